@@ -3,13 +3,24 @@ import importlib
 import logging
 import pathlib
 import shutil
-import timeit
+import sys
 import webbrowser
 
 from solutions.data import get_data
+from solutions.helpers import ENGINES, enable_run_cache, select_engine
+from solutions.runner import PHASES, Timings, format_answer, run_solution
 
 log = logging.getLogger(__name__)
 
+if sys.argv[1:2] == ["bench"]:
+    from solutions.bench import main as bench
+
+    sys.exit(bench(sys.argv[2:]))
+
+if sys.argv[1:2] == ["all"]:
+    from solutions.orchestrator import main as run_all
+
+    sys.exit(run_all(sys.argv[2:]))
 
 parser = argparse.ArgumentParser(description='Run or create the solutions for Advent of Code 2019')
 parser.add_argument(
@@ -34,6 +45,25 @@ parser.add_argument(
     metavar="IMPORT_NAME",
     help="run an alternative solution for a day",
 )
+parser.add_argument(
+    '-e',
+    '--engine',
+    dest="engine",
+    choices=ENGINES,
+    help="run IntCode applications on ENGINE (default: reference)",
+)
+parser.add_argument(
+    '--run-cache',
+    dest="run_cache",
+    action="store_true",
+    help="reuse the outputs of IntCode programs that ran on the same inputs before",
+)
+parser.add_argument(
+    '--parse-cache',
+    dest="parse_cache",
+    action="store_true",
+    help="load the parsed input data from the cache instead of parsing it again",
+)
 action_group = parser.add_mutually_exclusive_group(required=True)
 action_group.add_argument(
     '-c',
@@ -67,6 +97,12 @@ if args.debug:
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
 
+if args.engine:
+    select_engine(args.engine)
+
+if args.run_cache:
+    enable_run_cache()
+
 if args.create:
     template_path = SOLUTIONS_PATH / pathlib.Path("templates/dayx")
 
@@ -87,25 +123,18 @@ if args.solve:
             import_path += f".{args.alternative}"
         day = importlib.import_module(import_path)
 
+        data = get_data(day=args.day)
+        results = [run_solution(day, data, args.parse_cache) for _ in range(args.timeit or 1)]
+        answer_one, answer_two = results[-1].answers
+        print(f"Answer to part one: {format_answer(answer_one)}")
+        print(f"Answer to part two: {format_answer(answer_two)}")
+
+        # With --timeit, report the average time of each phase over all iterations
+        phase_times = zip(*(result.timings for result in results))
+        timings = Timings(*(sum(times) / len(results) for times in phase_times))
+        for phase, running_time in zip(PHASES, timings):
+            print(f"Running time of {phase}: {running_time:.6f} seconds")
         if args.timeit:
-            execution_times = []
-            for _ in range(args.timeit):
-                data = get_data(day=args.day)
-                time_prior = timeit.default_timer()
-                answer_one, answer_two = day.main(data)
-                time_after = timeit.default_timer()
-                execution_times.append(time_after - time_prior)
-
-            print(f"Answer to part one: {answer_one}")
-            print(f"Answer to part two: {answer_two}")
-
-            average_time = sum(execution_times) / len(execution_times)
-            print(f"Average running time: {average_time:.6f} seconds ({args.timeit} iterations)")
+            print(f"Average running time: {timings.total:.6f} seconds ({args.timeit} iterations)")
         else:
-            data = get_data(day=args.day)
-            time_prior = timeit.default_timer()
-            answer_one, answer_two = day.main(data)
-            time_after = timeit.default_timer()
-            print(f"Answer to part one: {answer_one}")
-            print(f"Answer to part two: {answer_two}")
-            print(f"Total running time: {time_after - time_prior:.6f} seconds")
+            print(f"Total running time: {timings.total:.6f} seconds")
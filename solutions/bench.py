@@ -0,0 +1,246 @@
+"""
+Benchmark the solutions of all days and their alternatives.
+
+Usage: python -m solutions bench [DAY ...] [-r REPEAT] [-w WARMUP] [-e ENGINE] [--parse-cache]
+                                 [-o FILE] [-b FILE] [-t THRESHOLD]
+
+Each solution module is imported once and its input data is read once, outside of the timed runs.
+After a number of warmup runs, which are not recorded, each solution is timed `REPEAT` times with
+the garbage collector disabled; it collects garbage before every run instead, so that a collection
+triggered by an earlier run is not charged to the next one. The parse, part one and part two phases
+of each run are timed separately, and the statistics are reported for each phase and in total.
+
+The results can be written to a JSON file. When a baseline file written earlier is given, the
+benchmark fails with exit status 1 if the median time of a solution regressed by more than the
+threshold compared with the baseline. A solution that raises an exception is reported as failed
+without stopping the benchmark of the others, and also makes it fail with exit status 1.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib
+import json
+import logging
+import math
+import os
+import pathlib
+import platform
+import statistics
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from solutions.data import get_data
+from solutions.helpers import ENGINES, select_engine
+from solutions.helpers.engines import DEFAULT_ENGINE, ENVIRONMENT_VARIABLE
+from solutions.runner import PHASES, Timings, run_solution
+
+log = logging.getLogger(__name__)
+
+SOLUTIONS_PATH = pathlib.Path(__file__).parent
+
+
+class Statistics(NamedTuple):
+    """Summary statistics of the running times of a solution, in seconds."""
+
+    runs: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+    stdev: float
+
+    @classmethod
+    def from_times(cls, times: List[float]) -> Statistics:
+        """Summarize the running times in `times`."""
+        ordered = sorted(times)
+        return cls(
+            runs=len(ordered),
+            min=ordered[0],
+            median=statistics.median(ordered),
+            p95=ordered[math.ceil(0.95 * len(ordered)) - 1],
+            mean=statistics.mean(ordered),
+            stdev=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+
+def find_solutions(days: Optional[List[int]] = None) -> Iterator[Tuple[int, str]]:
+    """Yield the day and import path of every solution module, or those of `days` only."""
+    for day_path in sorted(SOLUTIONS_PATH.glob("day[0-9][0-9]")):
+        day = int(day_path.name[3:])
+        if days and day not in days:
+            continue
+        for module_path in sorted(day_path.glob("solution*.py")):
+            yield day, f"solutions.{day_path.name}.{module_path.stem}"
+
+
+def time_solution(
+    day: int, import_path: str, repeat: int, warmup: int, parse_cache: bool = False
+) -> List[Timings]:
+    """Time the phases of the solution at `import_path` on the input data of `day`."""
+    solution = importlib.import_module(import_path)
+    data = get_data(day=day)
+
+    for _ in range(warmup):
+        run_solution(solution, list(data), parse_cache)
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            timings.append(run_solution(solution, list(data), parse_cache).timings)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return timings
+
+
+def summarize(timings: List[Timings]) -> Dict[str, Statistics]:
+    """Summarize the running times of each phase and of all phases combined."""
+    summary = {"total": Statistics.from_times([timing.total for timing in timings])}
+    for phase, times in zip(PHASES, zip(*timings)):
+        summary[phase] = Statistics.from_times(list(times))
+    return summary
+
+
+def find_regressions(
+    results: Dict[str, Statistics], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """Describe the solutions whose total median time regressed by more than `threshold`."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        previous = baseline[name]["total"]["median"]
+        if result.median > previous * (1 + threshold):
+            regressions.append(
+                f"{name}: median {result.median:.6f}s vs {previous:.6f}s in the baseline "
+                f"({result.median / previous - 1:+.0%})"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite and return the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m solutions bench", description="Benchmark the solutions of all days"
+    )
+    parser.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        metavar="DAY",
+        help="only benchmark the solutions of these days",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=10,
+        metavar="NUMBER",
+        help="time each solution NUMBER times",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        dest="warmup",
+        type=int,
+        default=1,
+        metavar="NUMBER",
+        help="run each solution NUMBER times before timing it",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        dest="engine",
+        choices=ENGINES,
+        help="run IntCode applications on ENGINE (default: reference)",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        dest="parse_cache",
+        action="store_true",
+        help="load the parsed input data from the cache instead of parsing it again",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="write the results as JSON to FILE",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        dest="baseline",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="fail if a solution regressed compared with the results in FILE",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=0.25,
+        metavar="FRACTION",
+        help="the relative increase of the median time that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    if args.engine:
+        select_engine(args.engine)
+
+    results = {}
+    failed = []
+    for day, import_path in find_solutions(args.days):
+        name = import_path[len("solutions."):]
+        try:
+            timings = time_solution(day, import_path, args.repeat, args.warmup, args.parse_cache)
+            summary = summarize(timings)
+        except ImportError as exception:
+            log.warning(f"Skipping {name}: {exception}")
+            continue
+        except Exception:
+            log.exception(f"Benchmarking {name} failed")
+            failed.append(name)
+            continue
+
+        results[name] = summary
+        total = summary["total"]
+        print(
+            f"{name:<28} min {total.min:.6f}s  median {total.median:.6f}s  "
+            f"p95 {total.p95:.6f}s  stdev {total.stdev:.6f}s"
+        )
+        print(" " * 29 + "  ".join(f"{phase} {summary[phase].median:.6f}s" for phase in PHASES))
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({
+            "python": platform.python_version(),
+            "engine": os.environ.get(ENVIRONMENT_VARIABLE, DEFAULT_ENGINE),
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "parse_cache": args.parse_cache,
+            "failed": failed,
+            "results": {
+                name: {key: result._asdict() for key, result in summary.items()}
+                for name, summary in results.items()
+            },
+        }, indent=2))
+
+    regressions = []
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        totals = {name: summary["total"] for name, summary in results.items()}
+        regressions = find_regressions(totals, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression in {regression}")
+
+    for name in failed:
+        print(f"{name:<28} FAILED")
+    return 1 if regressions or failed else 0
@@ -1,12 +1,24 @@
+import functools
+import hashlib
 import logging
+import mmap
 import os
 import pathlib
-from typing import List
+import pickle
+import sys
+import tempfile
+import types
+from typing import Callable, Iterator, List, Set, TypeVar
 
 import requests
 
 log = logging.getLogger(__name__)
 
+DATA_ROOT = pathlib.Path(__file__).parent
+PARSED_ROOT = DATA_ROOT / "parsed"
+
+T = TypeVar("T")
+
 
 class ImpatientPuzzlerError(Exception):
     """This exception is raised when we try to fetch the input data before it became available."""
@@ -21,9 +33,36 @@ def get_data(day: int, use_cache: bool = True) -> List[str]:
     cached using a flat text file (`day{day}.txt`). If, for some reason, we need a fresh copy of the
     data, the `use_cache` parameter can be used to force a request.
     """
+    return get_data_file(day, use_cache).read_text().splitlines()
+
+
+def iter_data(day: int, use_cache: bool = True) -> Iterator[str]:
+    """Yield the lines of the input data for the given day one by one, without reading it all."""
+    with get_data_file(day, use_cache).open() as data_file:
+        for line in data_file:
+            yield line.rstrip("\n")
 
-    data_root = pathlib.Path(__file__).parent
-    data_file = data_root / pathlib.Path(f"day{day:0>2d}.txt")
+
+def map_data(day: int, use_cache: bool = True) -> memoryview:
+    """
+    Map the input data for the given day into memory and return a view on its first line's bytes.
+
+    Nothing is read or copied until the view is accessed, which makes this suitable for very large
+    inputs that consist of a single line. The view keeps the file mapped as long as it exists. An
+    empty file, which cannot be mapped, results in an empty view.
+    """
+    with get_data_file(day, use_cache).open("rb") as data_file:
+        if os.fstat(data_file.fileno()).st_size == 0:
+            return memoryview(b"")
+        mapped = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    end = mapped.find(b"\n")
+    return memoryview(mapped)[:end if end != -1 else len(mapped)]
+
+
+def get_data_file(day: int, use_cache: bool = True) -> pathlib.Path:
+    """Return the path of the file with the input data for the given day, fetching it if needed."""
+    data_file = DATA_ROOT / pathlib.Path(f"day{day:0>2d}.txt")
 
     if not data_file.exists() or not use_cache:
         cookies = {"session": os.environ.get("AOC_SESSION")}
@@ -38,4 +77,81 @@ def get_data(day: int, use_cache: bool = True) -> List[str]:
     else:
         log.debug(f"A data file for day {day} already exists; using cached version.")
 
-    return data_file.read_text().splitlines()
+    return data_file
+
+
+def _dependencies(module_name: str) -> Set[str]:
+    """Return `module_name` and the modules of `solutions` it uses, directly or indirectly."""
+    dependencies = set()
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        if name in dependencies or name not in sys.modules:
+            continue
+
+        dependencies.add(name)
+        for value in vars(sys.modules[name]).values():
+            if isinstance(value, types.ModuleType):
+                dependency = value.__name__
+            else:
+                dependency = getattr(value, "__module__", None)
+            if isinstance(dependency, str) and dependency.partition(".")[0] == "solutions":
+                pending.append(dependency)
+    return dependencies
+
+
+@functools.lru_cache(maxsize=None)
+def _module_hash(module_name: str) -> str:
+    """Return a hash of the source of a module and its dependencies within `solutions`."""
+    content_hash = hashlib.sha256()
+    for name in sorted(_dependencies(module_name)):
+        source_file = getattr(sys.modules[name], "__file__", None)
+        if source_file is not None:
+            content_hash.update(name.encode())
+            content_hash.update(pathlib.Path(source_file).read_bytes())
+    return content_hash.hexdigest()
+
+
+def get_parsed_data(parse: Callable[[List[str]], T], data: List[str]) -> T:
+    """
+    Parse `data` with `parse`, or load the result of parsing the same data before from the cache.
+
+    The parsed data is pickled to a file in `solutions/data/parsed`, keyed by a hash of the module
+    that defines `parse` together with the modules of `solutions` it uses, like the helpers of its
+    day, and a hash of the input data. Changing any of them invalidates the cached file; the files
+    of the same parser with another parser hash are outdated and removed when a new result is
+    cached, while those of other input data are kept. Every call returns a fresh copy of the parsed
+    data, so the parts of a solution are free to modify it.
+    """
+    content_hash = hashlib.sha256("\n".join(data).encode()).hexdigest()[:32]
+    parser_hash = _module_hash(parse.__module__)[:16]
+
+    name = f"{parse.__module__}.{parse.__qualname__}"
+    parsed_file = PARSED_ROOT / f"{name}.{parser_hash}.{content_hash}.pickle"
+    try:
+        parsed = pickle.loads(parsed_file.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+    else:
+        log.debug(f"Loaded the parsed data of {name} from the cache.")
+        return parsed
+
+    parsed = parse(data)
+    try:
+        pickled = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, RecursionError, TypeError, AttributeError) as exception:
+        log.debug(f"Not caching the parsed data of {name}: {exception}")
+        return parsed
+
+    PARSED_ROOT.mkdir(exist_ok=True)
+    for cached_file in PARSED_ROOT.glob(f"{name}.*.pickle"):
+        # Another process may remove the same outdated file at the same time
+        if not cached_file.name.startswith(f"{name}.{parser_hash}."):
+            cached_file.unlink(missing_ok=True)
+
+    # Each process writes a temporary file of its own, so concurrent writers don't interfere
+    with tempfile.NamedTemporaryFile(dir=PARSED_ROOT, suffix=".tmp", delete=False) as file:
+        file.write(pickled)
+    os.replace(file.name, parsed_file)
+    log.debug(f"Cached the parsed data of {name}.")
+    return parsed
@@ -1,5 +1,5 @@
 import itertools
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 
 def _fuel_requirement(mass: int) -> int:
@@ -14,18 +14,35 @@ def _module_fuel(mass):
         yield mass
 
 
-def part_one(data: List[int]) -> int:
+def part_one(data: Iterable[int]) -> int:
     """Calculates the fuel requirements of my spacecraft."""
     return sum(_fuel_requirement(number) for number in data)
 
 
-def part_two(data: List[int]) -> int:
+def part_two(data: Iterable[int]) -> int:
     """Calculates the fuel requirements including the fuel mass itself."""
     return sum(sum(itertools.takewhile(lambda fuel: fuel > 0, _module_fuel(mass))) for mass in data)
 
 
-def main(data: List[str]) -> Tuple[int]:
-    data = [int(number) for number in data]
+def parse(data: Iterable[str]) -> List[int]:
+    """Parse the masses of the modules in the input data."""
+    return [int(number) for number in data]
+
+
+def solve_stream(data: Iterable[str]) -> Tuple[int, int]:
+    """Calculate both answers in a single pass over the input data, without keeping it in memory."""
+    answer_one = answer_two = 0
+    for number in data:
+        mass = int(number)
+        answer_one += _fuel_requirement(mass)
+        answer_two += sum(itertools.takewhile(lambda fuel: fuel > 0, _module_fuel(mass)))
+    return answer_one, answer_two
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """The main function taking care of parsing the input data and running the solutions."""
+    data = parse(data)
+
     answer_one = part_one(data)
     answer_two = part_two(data)
     return answer_one, answer_two
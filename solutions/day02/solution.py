@@ -1,18 +1,11 @@
-import functools
 import itertools
-import operator
-from typing import Callable, List, Tuple
+import logging
+from typing import List, Optional, Tuple
 
+from solutions.helpers import create_application
+from solutions.helpers.symbolic import SymbolicFallback, SymbolicIntCodeApplication, solve
 
-def cpu_operation(a: int, b: int, destination: int, data: List[int], operation: Callable) -> None:
-    """Uses operation on numbers `a` and `b` and stores the result at `destination` in `data`."""
-    data[destination] = operation(a, b)
-
-
-COMPUTER_OPERATIONS = {
-    1: functools.partial(cpu_operation, operation=operator.add),
-    2: functools.partial(cpu_operation, operation=operator.mul),
-}
+log = logging.getLogger(__name__)
 
 
 def ship_computer(data: List[int], noun: int, verb: int) -> int:
@@ -22,14 +15,9 @@ def ship_computer(data: List[int], noun: int, verb: int) -> int:
     data[1] = noun
     data[2] = verb
 
-    operation_code = iter(data)
-
-    while (operation := next(operation_code)) != 99:
-        a = data[next(operation_code)]
-        b = data[next(operation_code)]
-        destination = next(operation_code)
-        COMPUTER_OPERATIONS[operation](a, b, destination, data=data)
-    return data[0]
+    application = create_application(data, name="Ship Computer")
+    application.run()
+    return application.application[0]
 
 
 def part_one(data: List[int]) -> int:
@@ -37,18 +25,43 @@ def part_one(data: List[int]) -> int:
     return ship_computer(data, noun=12, verb=2)
 
 
-def part_two(data: List[int]) -> int:
-    """Determine the noun and verb needed to get `19690720` out of the ship's computer."""
+def solve_symbolically(data: List[int], target: int) -> Optional[int]:
+    """Run the application once with a symbolic noun and verb and solve for `target` directly."""
+    application = SymbolicIntCodeApplication(data, variables={1: "noun", 2: "verb"})
+    application.run()
+    log.debug(f"The ship's computer calculates {application.application[0]}")
+
+    domains = {"noun": range(100), "verb": range(100)}
+    for solution in solve(application.application[0], target, domains):
+        return 100 * solution["noun"] + solution["verb"]
+
+
+def part_two(data: List[int], target: int = 19690720) -> int:
+    """Determine the noun and verb needed to get `target` out of the ship's computer."""
+    try:
+        answer = solve_symbolically(data, target)
+    except SymbolicFallback as exception:
+        log.info(f"Falling back to a search over all nouns and verbs: {exception}")
+    else:
+        if answer is not None:
+            return answer
+        log.info("Falling back to a search over all nouns and verbs: no symbolic solution found")
+
     for noun, verb in itertools.product(range(100), repeat=2):
         result = ship_computer(data, noun=noun, verb=verb)
-        if result == 19690720:
+        if result == target:
             return 100 * noun + verb
 
 
-def main(data: List[str]) -> Tuple[int]:
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
+
+
+def main(data: List[str]) -> Tuple[int, int]:
     """The main function taking care of parsing the input data and running the solutions."""
-    op_codes = data[0].split(",")
-    data = [int(number) for number in op_codes]
+    data = parse(data)
+
     answer_one = part_one(data)
     answer_two = part_two(data)
     return answer_one, answer_two
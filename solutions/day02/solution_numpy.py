@@ -0,0 +1,39 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from solutions.helpers.batch import IntCodeBatch
+
+
+def part_one(data: List[int]) -> int:
+    """Calculate the result value of the intcode application with noun=12, verb=2."""
+    batch = IntCodeBatch(data, patches={1: [12], 2: [2]})
+    batch.run()
+    return int(batch.memory[0, 0])
+
+
+def part_two(data: List[int]) -> int:
+    """Run all nouns and verbs in lockstep to find the pair that produces `19690720`."""
+    nouns, verbs = (grid.ravel() for grid in np.meshgrid(range(100), range(100), indexing="ij"))
+    batch = IntCodeBatch(data, patches={1: nouns, 2: verbs})
+    batch.run()
+
+    results = batch.values(0)
+    for index in np.flatnonzero(batch.halted):
+        if results[index] == 19690720:
+            return int(100 * nouns[index] + verbs[index])
+    raise ValueError("No noun and verb make the ship's computer produce 19690720.")
+
+
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """The main function taking care of parsing the input data and running the solutions."""
+    data = parse(data)
+
+    answer_one = part_one(data)
+    answer_two = part_two(data)
+    return answer_one, answer_two
@@ -107,12 +107,15 @@ def part_two(intersections: List[Intersection]) -> int:
     return min(i.steps for i in intersections)
 
 
-def main(data: List[str]) -> Tuple[int]:
+def parse(data: List[str]) -> List[Intersection]:
+    """Draw the wires in the input data and find the intersections that both parts need."""
+    return find_intersections([draw_lines(wire) for wire in data])
+
+
+def main(data: List[str]) -> Tuple[int, int]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = [draw_lines(wire) for wire in data]
-    intersections = find_intersections(data)
+    intersections = parse(data)
 
     answer_one = part_one(intersections)
     answer_two = part_two(intersections)
-
     return answer_one, answer_two
@@ -1 +1 @@
-from .solution import main # noqa
+from .solution import parse, part_one, part_two, main # noqa
@@ -16,15 +16,27 @@ def ascending_values(start: str, stop: str) -> str:
             number = str(int(number)+1)
 
 
-def main(data: List[str]) -> Tuple[int]:
-    """The main function taking care of parsing the input data and running the solutions."""
+def parse(data: List[str]) -> List[str]:
+    """Parse the range of passwords in the input data into the passwords with ascending digits."""
     start, stop = data[0].split("-")
-    answer_one = 0
-    answer_two = 0
+    return list(ascending_values(start, stop))
+
+
+def part_one(candidates: List[str]) -> int:
+    """Count the passwords with ascending digits that have at least one repeated digit."""
+    # As the digits are ascending, a repeated digit means that not all six digits are distinct
+    return sum(len(set(number)) < len(number) for number in candidates)
+
 
-    for number in ascending_values(start, stop):
-        c = Counter(number)
-        answer_one += max(c.values()) >= 2
-        answer_two += 2 in c.values()
+def part_two(candidates: List[str]) -> int:
+    """Count the passwords with ascending digits that have a digit repeated exactly twice."""
+    return sum(2 in Counter(number).values() for number in candidates)
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """The main function taking care of parsing the input data and running the solutions."""
+    candidates = parse(data)
 
+    answer_one = part_one(candidates)
+    answer_two = part_two(candidates)
     return answer_one, answer_two
@@ -2,13 +2,13 @@ import re
 from typing import List, Tuple
 
 
-def part_one(start: int, stop: int) -> int:
+def part_one(passwords: range) -> int:
     """Part one of today's Advent of Code puzzle."""
     pattern = re.compile(r"(?:(?=.*(\d)\1{1,}.*))^1*2*3*4*5*6*7*8*9*$")
-    return sum(pattern.fullmatch(str(password)) is not None for password in range(start, stop))
+    return sum(pattern.fullmatch(str(password)) is not None for password in passwords)
 
 
-def part_two(start: int, stop: int) -> int:
+def part_two(passwords: range) -> int:
     """Part two of today's Advent of Code puzzle."""
     pattern = re.compile(
         r"(?:"
@@ -23,12 +23,18 @@ def part_two(start: int, stop: int) -> int:
         r"(?=.*(?<!9)(?:9){2}(?!9)).*)"
         r"^1*2*3*4*5*6*7*8*9*$"
     )
-    return sum(pattern.fullmatch(str(password)) is not None for password in range(start, stop))
+    return sum(pattern.fullmatch(str(password)) is not None for password in passwords)
 
 
-def main(data: List[str]) -> Tuple[int]:
-    """The main function taking care of parsing the input data and running the solutions."""
+def parse(data: List[str]) -> range:
+    """Parse the range of passwords in the input data, boundaries included."""
     start, stop = [int(n) for n in data[0].split("-")]
-    answer_one = part_one(start, stop+1)
-    answer_two = part_two(start, stop+1)
+    return range(start, stop + 1)
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """The main function taking care of parsing the input data and running the solutions."""
+    passwords = parse(data)
+    answer_one = part_one(passwords)
+    answer_two = part_two(passwords)
     return answer_one, answer_two
@@ -1,25 +1,34 @@
 from typing import List, Tuple
 
-from solutions.day05.helpers import System, terminal
+from solutions.helpers import run_to_completion
+
+
+def run_diagnostics(data: List[int], system_id: int) -> int:
+    """Run the diagnostics for `system_id` and return the final diagnostic code."""
+    *checks, diagnostic_code = run_to_completion(data, [system_id], name="TEST")
+    if any(checks):
+        raise RuntimeError(f"The diagnostic checks failed: {checks}")
+    return diagnostic_code
 
 
 def part_one(data: List[int]) -> int:
     """Run the diagnostics on the Thermal Environment Supervision Terminal."""
-    system = System(application=list(data), stdin=iter([1]))
-    system = terminal(system)
-    return system.stdout.pop()
+    return run_diagnostics(data, system_id=1)
 
 
 def part_two(data: List[int]) -> int:
     """Run diagnostics on System ID 5 of the Thermal Environment Supervision Terminal."""
-    system = System(application=list(data), stdin=iter([5]))
-    system = terminal(system)
-    return system.stdout.pop()
+    return run_diagnostics(data, system_id=5)
+
+
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
 
 
-def main(data: List[str]) -> Tuple[int]:
+def main(data: List[str]) -> Tuple[int, int]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = [int(number) for number in data[0].split(",")]
+    data = parse(data)
 
     answer_one = part_one(data)
     answer_two = part_two(data)
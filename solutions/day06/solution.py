@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from operator import attrgetter
-from typing import Iterator, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 
 class Node:
@@ -83,11 +83,17 @@ def part_two(orbital_map) -> int:
     return (me.depth - common_ancestor.depth) + (santa.depth - common_ancestor.depth) - 2
 
 
-def main(data: List[str]) -> Tuple[int, int]:
-    """Run my solution to day 6 of the Advent of Code."""
+def parse(data: Iterable[str]) -> OrbitalMap:
+    """Create the orbital map of the orbits in the input data."""
     orbital_map = OrbitalMap()
     for orbit in data:
         orbital_map.add_orbit(*orbit.split(")"))
+    return orbital_map
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """Run my solution to day 6 of the Advent of Code."""
+    orbital_map = parse(data)
 
     answer_one = part_one(orbital_map)
     answer_two = part_two(orbital_map)
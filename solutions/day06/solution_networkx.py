@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import networkx as nx
 
@@ -13,10 +13,17 @@ def part_two(orbits: nx.Graph) -> int:
     return nx.shortest_path_length(orbits, source="YOU", target="SAN") - 2
 
 
+def parse(data: Iterable[str]) -> nx.Graph:
+    """Create a graph of the orbits in the input data."""
+    orbits = nx.Graph()
+    orbits.add_edges_from(number.split(")") for number in data)
+    return orbits
+
+
 def main(data: List[str]) -> Tuple[int, int]:
     """Run my solution to day 6 of the Advent of Code."""
-    orbits = nx.Graph()
-    orbits.add_edges_from([number.split(")") for number in data])
+    orbits = parse(data)
+
     answer_one = part_one(orbits)
     answer_two = part_two(orbits)
     return answer_one, answer_two
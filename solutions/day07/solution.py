@@ -2,22 +2,25 @@ import concurrent.futures
 import functools
 import itertools
 import logging
-from typing import Callable, List, Tuple
+from typing import Callable, Dict, FrozenSet, List, Tuple
 
-from solutions.helpers import IntCodeApplication
+from solutions.helpers import IntCodeApplication, create_application
+from solutions.helpers.image import ProgramImage, close_program, load_program, share_program
+from solutions.helpers.scheduler import Scheduler
 
 log = logging.getLogger(__name__)
 
 
-def _create_applications(phases: Tuple[int], data: List[int]) -> List[IntCodeApplication]:
+def _create_applications(phases: Tuple[int], image: ProgramImage) -> List[IntCodeApplication]:
     """Create a list of IntCodeApplications with stout -> stdin pipes between them."""
     applications = []
 
     for i, phase in enumerate(phases, 1):
         if not applications:
-            app = IntCodeApplication(data, name=f"amp-{i}")
+            app = create_application(load_program(image), name=f"amp-{i}")
         else:
-            app = IntCodeApplication(data, stdin=applications[-1].stdout, name=f"amp-{i}")
+            stdin = applications[-1].stdout
+            app = create_application(load_program(image), stdin=stdin, name=f"amp-{i}")
         app.stdin.put(phase)
         applications.append(app)
 
@@ -25,28 +28,13 @@ def _create_applications(phases: Tuple[int], data: List[int]) -> List[IntCodeApp
 
 
 def _run_applications(applications: List[IntCodeApplication]) -> List[IntCodeApplication]:
-    """Run the IntCodeApplications listed in `applications` and return them."""
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=len(applications),
-        thread_name_prefix="amp"
-    ) as executor:
-        futures = {executor.submit(app.run): f"amp-{i}" for i, app in enumerate(applications, 1)}
-
-    done, _ = concurrent.futures.wait(futures)
-    for future in done:
-        try:
-            future.result()
-        except Exception:
-            log.exception("Something went wrong when running the applications:")
-        else:
-            log.debug("Ran without issue!")
-
-    return applications
-
+    """Run the IntCodeApplications listed in `applications` in turn until they've all halted."""
+    scheduler = Scheduler()
+    for app in applications:
+        scheduler.add(app)
+    scheduler.run()
 
-def _setup_apps_part_one(applications: List[IntCodeApplication]) -> List[IntCodeApplication]:
-    """Set up the `applications` for part 1."""
-    applications[0].stdin.put(0)
+    log.debug("Ran without issue!")
     return applications
 
 
@@ -57,37 +45,74 @@ def _setup_apps_part_two(applications: List[IntCodeApplication]) -> List[IntCode
     return applications
 
 
-def run_phase_configuration(phases: Tuple[int], data: List[int], setup: Callable) -> int:
+def _run_phase_configuration(phases: Tuple[int], image: ProgramImage, setup: Callable) -> int:
     """Run the amps with a single phase configuration and return the final signal strength."""
-    applications = _create_applications(phases, data)
+    applications = _create_applications(phases, image)
     applications = setup(applications)
     applications = _run_applications(applications)
 
     return applications[-1].stdout.get()
 
 
+def run_phase_configuration(phases: Tuple[int], image: ProgramImage, setup: Callable) -> int:
+    """Run a phase configuration in a worker and detach from the image once it's done."""
+    signal = _run_phase_configuration(phases, image, setup)
+    # The amplifiers are gone by now, so nothing uses the memory loaded from the image anymore
+    close_program(image)
+    return signal
+
+
+def find_max_signal(data: List[int], phases: FrozenSet[int], signal: int = 0) -> int:
+    """
+    Find the maximum signal the amplifier chain can produce from `signal` using each phase once.
+
+    The output of a single amplifier only depends on its phase and its input signal, so each stage
+    is run once per `(phase, signal)` pair and the permutations are searched as a tree, in which
+    all permutations that start with the same phases share the stages for that prefix.
+    """
+    stages: Dict[Tuple[int, int], int] = {}
+
+    def amplify(phase: int, signal: int) -> int:
+        if (phase, signal) not in stages:
+            application = create_application(data, name=f"amp-{phase}")
+            application.stdin.put(phase)
+            application.stdin.put(signal)
+            stages[phase, signal] = next(application.resume())
+        return stages[phase, signal]
+
+    def search(phases: FrozenSet[int], signal: int) -> int:
+        if not phases:
+            return signal
+        return max(search(phases - {phase}, amplify(phase, signal)) for phase in phases)
+
+    max_signal = search(phases, signal)
+    log.debug(f"Found the maximum signal by running {len(stages)} amplifier stages")
+    return max_signal
+
+
 def part_one(data: List[int]) -> int:
     """Find the maximum single strength after chaining together the amps."""
-    run_phase = functools.partial(run_phase_configuration, data=data, setup=_setup_apps_part_one)
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        signal_strength = executor.map(run_phase, itertools.permutations(range(5), 5))
-
-    return max(signal_strength)
+    return find_max_signal(data, phases=frozenset(range(5)))
 
 
 def part_two(data: List[int]) -> int:
     """Find the maximum signal strength after creating a feedback loop with the amps."""
-    run_phase = functools.partial(run_phase_configuration, data=data, setup=_setup_apps_part_two)
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        signal_strength = executor.map(run_phase, itertools.permutations(range(5, 10), 5))
+    with share_program(data) as image, concurrent.futures.ProcessPoolExecutor() as executor:
+        run_phase = functools.partial(
+            run_phase_configuration, image=image, setup=_setup_apps_part_two
+        )
+        return max(executor.map(run_phase, itertools.permutations(range(5, 10), 5)))
+
 
-    return max(signal_strength)
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
 
 
 def main(data: List[str]) -> Tuple[int, int]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = [int(number) for number in data[0].split(",")]
+    data = parse(data)
 
-    answer_one = part_one(data=data)
-    answer_two = part_two(data=data)
+    answer_one = part_one(data)
+    answer_two = part_two(data)
     return answer_one, answer_two
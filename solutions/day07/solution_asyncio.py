@@ -0,0 +1,63 @@
+import asyncio
+import itertools
+from typing import Iterable, List, Tuple
+
+from solutions.helpers import IntCodeApplication, create_application
+
+
+def _create_applications(
+    phases: Tuple[int], data: List[int], feedback: bool
+) -> List[IntCodeApplication]:
+    """Create a list of IntCodeApplications with asyncio stdout -> stdin pipes between them."""
+    pipes = [asyncio.Queue() for _ in range(len(phases) + 1)]
+    if feedback:
+        pipes[-1] = pipes[0]
+
+    for pipe, phase in zip(pipes, phases):
+        pipe.put_nowait(phase)
+    pipes[0].put_nowait(0)
+
+    return [
+        create_application(data, stdin=stdin, stdout=stdout, name=f"amp-{i}")
+        for i, (stdin, stdout) in enumerate(zip(pipes, pipes[1:]), 1)
+    ]
+
+
+async def run_phase_configuration(phases: Tuple[int], data: List[int], feedback: bool) -> int:
+    """Run the amps with a single phase configuration and return the final signal strength."""
+    applications = _create_applications(phases, data, feedback)
+    await asyncio.gather(*(app.run_async() for app in applications))
+    return applications[-1].stdout.get_nowait()
+
+
+async def find_max_signal(data: List[int], phase_settings: Iterable[int], feedback: bool) -> int:
+    """Run all phase configurations concurrently on one event loop and return the best signal."""
+    signal_strength = await asyncio.gather(*(
+        run_phase_configuration(phases, data, feedback)
+        for phases in itertools.permutations(phase_settings, 5)
+    ))
+    return max(signal_strength)
+
+
+def part_one(data: List[int]) -> int:
+    """Find the maximum single strength after chaining together the amps."""
+    return asyncio.run(find_max_signal(data, range(5), feedback=False))
+
+
+def part_two(data: List[int]) -> int:
+    """Find the maximum signal strength after creating a feedback loop with the amps."""
+    return asyncio.run(find_max_signal(data, range(5, 10), feedback=True))
+
+
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """The main function taking care of parsing the input data and running the solutions."""
+    data = parse(data)
+
+    answer_one = part_one(data)
+    answer_two = part_two(data)
+    return answer_one, answer_two
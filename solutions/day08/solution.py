@@ -1,41 +1,54 @@
-from collections import Counter
-from operator import itemgetter
-from typing import List, Tuple
+from typing import Iterable, List, Tuple, Union
 
 import numpy as np
 
+WIDTH, HEIGHT = 25, 6
+LAYER_SIZE = WIDTH * HEIGHT
 
-def part_one(data: str) -> int:
+# The pixels of the image as the bytes of their digits, like a view on a memory-mapped input file
+Pixels = Union[bytes, memoryview]
+BLACK, WHITE, TRANSPARENT = b"012"
+
+
+def part_one(data: Pixels) -> int:
     """Find the layer with the least amount of `0`s and return number of `1`s *  number of `2`s."""
-    min_layer = min((Counter(layer) for layer in zip(*[iter(data)]*150)), key=itemgetter("0"))
-    return min_layer["1"] * min_layer["2"]
+    layers = (bytes(data[i:i + LAYER_SIZE]) for i in range(0, len(data), LAYER_SIZE))
+    min_layer = min(layers, key=lambda layer: layer.count(b"0"))
+    return min_layer.count(b"1") * min_layer.count(b"2")
 
 
-def part_two_numpy(data: List[int]) -> str:
+def part_two_numpy(data: Pixels) -> str:
     """Reconstruct the image of the password by stacking partially transparent layers."""
-    image = np.full(150, 2, dtype=np.uint8)
-    for layer in zip(*[iter(data)]*150):
-        mask = image == 2
-        image[mask] = np.array(layer)[mask]
-    image = image.reshape((6, 25)).tolist()
-    return "\n".join("".join("\u2588" if pixel == 1 else " " for pixel in row) for row in image)
+    image = np.full(LAYER_SIZE, TRANSPARENT, dtype=np.uint8)
+    for layer in np.frombuffer(data, dtype=np.uint8).reshape((-1, LAYER_SIZE)):
+        mask = image == TRANSPARENT
+        image[mask] = layer[mask]
+    image = image.reshape((HEIGHT, WIDTH)).tolist()
+    return "\n".join("".join("\u2588" if pixel == WHITE else " " for pixel in row) for row in image)
 
 
-def part_two(data: str) -> str:
+def part_two(data: Pixels) -> str:
     """Reconstruct the image of the password by stacking partially transparent layers."""
-    pixels = [[] for _ in range(6)]
-    for i in range(150):
-        for pixel in data[i::150]:
-            if pixel != "2":
-                row = i // 25
-                pixels[row].append(pixel)
+    data = memoryview(data)
+    pixels = [[] for _ in range(HEIGHT)]
+    for i in range(LAYER_SIZE):
+        for pixel in data[i::LAYER_SIZE]:
+            if pixel != TRANSPARENT:
+                pixels[i // WIDTH].append(pixel)
                 break
-    return "\n".join("".join("\u2588" if pixel == "1" else " " for pixel in row) for row in pixels)
+    rows = ("".join("\u2588" if pixel == WHITE else " " for pixel in row) for row in pixels)
+    return "\n".join(rows)
+
+
+def parse(data: Iterable[str]) -> bytes:
+    """Return the pixels of the image in the input data, which consists of a single line."""
+    return next(iter(data)).encode()
 
 
 def main(data: List[str]) -> Tuple[int, str]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = data[0]
+    data = parse(data)
+
     answer_one = part_one(data)
     answer_two = part_two(data)
     return answer_one, "\n" + answer_two
@@ -0,0 +1 @@
+from .solution import parse, part_one, part_two, main # noqa
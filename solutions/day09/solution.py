@@ -1,27 +1,28 @@
 from typing import List, Tuple
 
-from solutions.helpers import IntCodeApplication
+from solutions.helpers import run_to_completion
 
 
 def part_one(data: List[int]) -> int:
     """Part one of today's Advent of Code puzzle."""
-    app = IntCodeApplication(data, name="BOOST Part I", flexible_memory=True)
-    app.stdin.put(1)
-    app.run()
-    return app.stdout.get()
+    keycode, = run_to_completion(data, [1], name="BOOST Part I", flexible_memory=True)
+    return keycode
 
 
 def part_two(data: List[int]) -> int:
     """Part two of today's Advent of Code puzzle."""
-    app = IntCodeApplication(data, name="BOOST Part II", flexible_memory=True)
-    app.stdin.put(2)
-    app.run()
-    return app.stdout.get()
+    coordinates, = run_to_completion(data, [2], name="BOOST Part II", flexible_memory=True)
+    return coordinates
+
+
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
 
 
 def main(data: List[str]) -> Tuple[int, int]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = [int(number) for number in data[0].split(",")]
+    data = parse(data)
 
     answer_one = part_one(data)
     answer_two = part_two(data)
@@ -1,11 +1,20 @@
 import functools
 import itertools
 import operator
-from typing import Dict, Generator, List, Tuple
+from typing import Dict, Generator, List, NamedTuple, Tuple
 
 from solutions.day10 import helpers
 
 
+class AsteroidMap(NamedTuple):
+    """The asteroids on the map in the input data and the lines of sight of one grid quadrant."""
+
+    data: List[str]
+    # The number of asteroids visible from each asteroid, once part one has counted them
+    asteroids: Dict[complex, int]
+    lines_of_sight: List[List[complex]]
+
+
 def line_of_sight(
     lines_of_sight: List[List[complex]], max_edge_distance: int
 ) -> Generator[complex, None, None]:
@@ -30,9 +39,7 @@ def distance_to_edge(coordinate, grid_size):
     return int(round(abs(coordinate - half_point + 1) + half_point, 0))
 
 
-def part_one(
-    data: List[int], asteroids: Dict[complex, int], lines_of_sight: List[List[complex]]
-) -> int:
+def part_one(asteroid_map: AsteroidMap) -> int:
     """
     Calculate the number of astroids each astroid can see.
 
@@ -40,6 +47,7 @@ def part_one(
     iterate over each coprime coordinate in range relative to each asteroid and extend that line of
     sight until I go out of bounds or find an astroid.
     """
+    data, asteroids, lines_of_sight = asteroid_map
     grid_size = len(data)
 
     # Since the grid size is constant, create partial functions to lessen the visual noise later
@@ -75,15 +83,10 @@ def part_one(
         asteroids[asteroid] = visible_astroids
         visible_astroids = 0
 
-    return max(asteroids.items(), key=operator.itemgetter(1))
+    return max(asteroids.values())
 
 
-def part_two(
-    data: List[int],
-    asteroids: Dict[complex, int],
-    lines_of_sight: List[List[complex]],
-    coordinate: complex,
-) -> int:
+def part_two(asteroid_map: AsteroidMap) -> int:
     """
     Calculate the 200th asteroid we'll vaporize using our laser.
 
@@ -94,6 +97,13 @@ def part_two(
     fact to assign guaranteed increasing scores that indicate the order in which astroids will be
     vaporized.
     """
+    data, asteroids, lines_of_sight = asteroid_map
+
+    # Our monitoring station is on the asteroid that part one found; count them if it hasn't run yet
+    if not any(asteroids.values()):
+        part_one(asteroid_map)
+    coordinate = max(asteroids.items(), key=operator.itemgetter(1))[0]
+
     grid_size = len(data)
     in_range = functools.partial(point_in_range, grid_size=grid_size)
 
@@ -128,8 +138,8 @@ def part_two(
     return int(asteroid.real * 100 + asteroid.imag)
 
 
-def main(data: List[str]) -> Tuple[int]:
-    """The main function taking care of parsing the input data and running the solutions."""
+def parse(data: List[str]) -> AsteroidMap:
+    """Find the asteroids on the map in the input data and calculate the lines of sight."""
     data = [line.strip() for line in data]
 
     lines_of_sight = helpers.lines_of_sight(len(data[0]), len(data))
@@ -140,6 +150,13 @@ def main(data: List[str]) -> Tuple[int]:
             if cell == "#":
                 asteroids[complex(x, y)] = 0
 
-    coordinate, answer_one = part_one(data, asteroids, lines_of_sight)
-    answer_two = part_two(asteroids, asteroids, lines_of_sight, coordinate)
+    return AsteroidMap(data, asteroids, lines_of_sight)
+
+
+def main(data: List[str]) -> Tuple[int, int]:
+    """The main function taking care of parsing the input data and running the solutions."""
+    asteroid_map = parse(data)
+
+    answer_one = part_one(asteroid_map)
+    answer_two = part_two(asteroid_map)
     return answer_one, answer_two
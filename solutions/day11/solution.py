@@ -1,57 +1,50 @@
-import threading
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from solutions.helpers import IntCodeApplication
+from solutions.helpers import IntCodeApplication, create_application
+from solutions.helpers.channel import Channel
+
+
+def paint_hull(application: IntCodeApplication, canvas: Dict[complex, int]) -> Dict[complex, int]:
+    """Let the painting robot controlled by `application` paint the panels on `canvas`."""
+    location = complex(0, 0)
+    direction = complex(0, 1)
+    stdout = application.stdout
+
+    while not application.halted:
+        application.stdin.put(canvas.get(location, 0))
+        stdout.write_many(application.resume())
+        while stdout:
+            color, turn = stdout.read_n(2)
+            canvas[location] = color
+            direction *= complex(0, 1 - 2*turn)
+            location += direction
+
+    return canvas
 
 
 def part_one(data: List[int]) -> int:
     """Test the Emergency Hull Painting Robot by running its application."""
-    canvas = {}
-    application = IntCodeApplication(
+    application = create_application(
         application=data,
+        stdin=Channel(),
+        stdout=Channel(),
         name="Painting App",
         flexible_memory=True,
     )
-    pipe_in = application.stdin
-    pipe_out = application.stdout
-
-    robot = threading.Thread(target=application.run)
-    robot.start()
-
-    location = complex(0, 0)
-    direction = complex(0, 1)
-
-    while robot.is_alive():
-        pipe_in.put(canvas.get(location, 0))
-        canvas[location] = pipe_out.get()
-        direction *= complex(0, 1 - 2*pipe_out.get())
-        location += direction
-
+    canvas = paint_hull(application, canvas={})
     return len(canvas)
 
 
 def part_two(data: List[int]) -> int:
     """Paint a Registration Identifier on my Spaceship to please the Space police."""
-    canvas = {complex(0, 0): 1}
-    application = IntCodeApplication(
+    application = create_application(
         application=data,
+        stdin=Channel(),
+        stdout=Channel(),
         name="Painting App",
         flexible_memory=True,
     )
-    pipe_in = application.stdin
-    pipe_out = application.stdout
-
-    robot = threading.Thread(target=application.run)
-    robot.start()
-
-    location = complex(0, 0)
-    direction = complex(0, 1)
-
-    while robot.is_alive():
-        pipe_in.put(canvas.get(location, 0))
-        canvas[location] = pipe_out.get()
-        direction *= complex(0, 1 - 2*pipe_out.get())
-        location += direction
+    canvas = paint_hull(application, canvas={complex(0, 0): 1})
 
     x_min, x_max = min(c.real for c in canvas), max(c.real for c in canvas)
     y_min, y_max = min(c.imag for c in canvas), max(c.imag for c in canvas)
@@ -65,9 +58,14 @@ def part_two(data: List[int]) -> int:
     return "\n".join("".join(row) for row in reversed(panels))
 
 
-def main(data: List[str]) -> Tuple[int]:
+def parse(data: List[str]) -> List[int]:
+    """Parse the IntCode program in the input data."""
+    return [int(number) for number in data[0].split(",")]
+
+
+def main(data: List[str]) -> Tuple[int, str]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = [int(number) for number in data[0].split(",")]
+    data = parse(data)
 
     answer_one = part_one(data)
     answer_two = part_two(data)
@@ -1 +1,5 @@
+from .compiler import CompiledIntCodeApplication, Int64IntCodeApplication  # noqa
+from .engines import ENGINES, create_application, get_engine, register_engine, select_engine  # noqa
 from .intcode import IntCodeApplication  # noqa
+from .optimizer import OptimizedIntCodeApplication  # noqa
+from .runcache import enable_run_cache, run_to_completion  # noqa
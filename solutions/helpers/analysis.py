@@ -0,0 +1,362 @@
+"""
+Static analysis and optimization of IntCode programs.
+
+`disassemble` follows the control flow of a program from its entry point to find the instructions
+that can be executed, groups them into the basic blocks of a control-flow graph, and determines
+which memory cells the program may write to. Instructions with words that may be written are
+self-modifying and are never rewritten.
+
+`optimize` uses that analysis to produce an equivalent program. Rewrites keep every instruction at
+its address, so jump targets and data addresses remain valid:
+
+- constant propagation: operands read from cells the program never writes become immediates;
+- dead-store elimination: stores that are overwritten later in the same basic block before they are
+  read are replaced by a jump over them.
+
+These rewrites are only sound if all memory accesses of the program are known, so they are skipped
+for programs with relative-mode memory accesses or jumps whose targets cannot be determined. In
+addition, `optimize` recognizes loops that multiply by repeated addition, which the optimizing
+engine replaces by a single multiplication at run time; that does not depend on the whole program.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .intcode import HALT, IMMEDIATE, POSITION, RELATIVE, decode_opcode
+
+log = logging.getLogger(__name__)
+
+# The number of parameters of each operation
+PARAMETERS = {1: 3, 2: 3, 3: 1, 4: 1, 5: 2, 6: 2, 7: 3, 8: 3, 9: 1, HALT: 0}
+# The index of the parameter each writing operation writes to
+WRITES = {1: 2, 2: 2, 3: 0, 7: 2, 8: 2}
+JUMPS = {5, 6}
+
+
+class Decoded(NamedTuple):
+    """A decoded instruction at a specific address, with its parameters."""
+
+    address: int
+    operation: int
+    modes: Tuple[int, int, int]
+    parameters: Tuple[int, ...]
+
+    @property
+    def extent(self) -> range:
+        """The addresses of the words of this instruction."""
+        return range(self.address, self.address + 1 + len(self.parameters))
+
+    @property
+    def next(self) -> int:
+        """The address of the instruction following this one in memory."""
+        return self.extent.stop
+
+    @property
+    def target(self) -> Optional[int]:
+        """The address this instruction writes to, or `None` if it doesn't write or it's unknown."""
+        if self.operation not in WRITES or self.modes[WRITES[self.operation]] == RELATIVE:
+            return None
+        return self.parameters[WRITES[self.operation]]
+
+    @property
+    def reads(self) -> List[int]:
+        """The addresses this instruction reads its operands from, if they are in position mode."""
+        count = len(self.parameters) - (self.operation in WRITES)
+        return [p for p, mode in zip(self.parameters[:count], self.modes) if mode == POSITION]
+
+    @property
+    def relative(self) -> bool:
+        """Whether this instruction accesses memory relative to the relative base."""
+        return RELATIVE in self.modes[:len(self.parameters)]
+
+
+class Block(NamedTuple):
+    """A basic block: a run of instructions that is always executed from start to end."""
+
+    start: int
+    instructions: Tuple[Decoded, ...]
+    successors: Tuple[int, ...]
+
+
+class ControlFlowGraph(NamedTuple):
+    """The executable instructions of a program, grouped into basic blocks."""
+
+    instructions: Dict[int, Decoded]
+    blocks: Dict[int, Block]
+    # Addresses that may be written to; `closed` tells whether that set is complete
+    writes: Set[int]
+    # Addresses that are read as operands
+    reads: Set[int]
+    # Addresses of the words of all instructions
+    code: Set[int]
+    # Addresses of instructions whose words may be written to
+    self_modifying: Set[int]
+    closed: bool
+
+
+class MultiplyLoop(NamedTuple):
+    """A loop that adds `operand` to `accumulator` `counter` times, counting the counter down."""
+
+    start: int
+    words: Tuple[int, ...]
+    accumulator: int
+    # The address of the operand, or `None` if the operand is the immediate `value`
+    operand: Optional[int]
+    value: int
+    counter: int
+
+    @property
+    def exit(self) -> int:
+        """The address execution continues at once the counter reaches zero."""
+        return self.start + len(self.words)
+
+
+class Optimization(NamedTuple):
+    """An optimized program and a report of what was optimized."""
+
+    program: List[int]
+    loops: Dict[int, MultiplyLoop]
+    folded_operands: int
+    dead_stores: int
+    # The number of instructions no longer executed per pass through the rewritten code
+    saved_instructions: int
+    skipped: Optional[str]
+
+
+def decode_at(program: Sequence[int], address: int) -> Optional[Decoded]:
+    """Decode the instruction at `address`, or return `None` if there is no valid instruction."""
+    if not 0 <= address < len(program):
+        return None
+
+    operation, modes = decode_opcode(program[address])
+    if operation not in PARAMETERS or program[address] < 0 or program[address] >= 100000:
+        return None
+
+    count = PARAMETERS[operation]
+    if address + count >= len(program) or any(mode > RELATIVE for mode in modes[:count]):
+        return None
+    if operation in WRITES and modes[WRITES[operation]] == IMMEDIATE:
+        return None
+
+    parameters = tuple(program[address + 1:address + 1 + count])
+    return Decoded(address=address, operation=operation, modes=modes, parameters=parameters)
+
+
+def _successors(
+    program: Sequence[int], instruction: Decoded, writes: Set[int]
+) -> Optional[Tuple[int, ...]]:
+    """Return the addresses that may be executed next, or `None` if that cannot be determined."""
+    if instruction.operation == HALT:
+        return ()
+    if instruction.operation not in JUMPS:
+        return (instruction.next,)
+
+    condition, target = instruction.parameters
+    condition_mode, target_mode, _ = instruction.modes
+    if target_mode == RELATIVE:
+        return None
+    if target_mode == POSITION:
+        if target in writes or not 0 <= target < len(program):
+            return None
+        target = program[target]
+
+    if condition_mode == IMMEDIATE:
+        taken = (condition != 0) == (instruction.operation == 5)
+        return (target,) if taken else (instruction.next,)
+    return (instruction.next, target)
+
+
+def disassemble(program: Sequence[int], entry: int = 0) -> ControlFlowGraph:
+    """Find the executable instructions of `program` and build its control-flow graph."""
+    writes: Set[int] = set()
+    while True:
+        instructions: Dict[int, Decoded] = {}
+        successors: Dict[int, Tuple[int, ...]] = {}
+        closed = True
+        pending = [entry]
+
+        while pending:
+            address = pending.pop()
+            if address in instructions:
+                continue
+            if (instruction := decode_at(program, address)) is None:
+                log.debug(f"No valid instruction at {address}")
+                closed = False
+                continue
+
+            instructions[address] = instruction
+            if (following := _successors(program, instruction, writes)) is None:
+                log.debug(f"Cannot determine where the jump at {address} goes")
+                closed = False
+                following = ()
+            successors[address] = following
+            pending.extend(following)
+
+        found = {i.target for i in instructions.values() if i.target is not None}
+        if found <= writes:
+            break
+        # Jump targets read from memory are only known if nothing writes to them: try again
+        writes |= found
+
+    code = {address: i.address for i in instructions.values() for address in i.extent}
+    self_modifying = {code[address] for address in writes if address in code}
+    # Relative-mode accesses could touch any cell, and modified code could do anything at all
+    closed = closed and not self_modifying and not any(i.relative for i in instructions.values())
+
+    # Blocks start at the entry point and wherever a jump may continue
+    jumps = [address for address, i in instructions.items() if i.operation in JUMPS]
+    leaders = {entry} | {a for address in jumps for a in successors[address]}
+    blocks = {}
+    for start in sorted(leaders & instructions.keys()):
+        block = [instructions[start]]
+        while (
+            block[-1].operation not in JUMPS | {HALT}
+            and successors[block[-1].address] == (block[-1].next,)
+            and block[-1].next in instructions
+            and block[-1].next not in leaders
+        ):
+            block.append(instructions[block[-1].next])
+        blocks[start] = Block(start, tuple(block), successors[block[-1].address])
+
+    return ControlFlowGraph(
+        instructions=instructions,
+        blocks=blocks,
+        writes=writes,
+        reads={address for i in instructions.values() for address in i.reads},
+        code=set(code),
+        self_modifying=self_modifying,
+        closed=closed,
+    )
+
+
+def _encode(instruction: Decoded) -> List[int]:
+    """Encode `instruction` as the words of an IntCode program."""
+    modes = instruction.modes
+    opcode = instruction.operation + 100 * modes[0] + 1000 * modes[1] + 10000 * modes[2]
+    return [opcode, *instruction.parameters]
+
+
+def propagate_constants(program: List[int], graph: ControlFlowGraph) -> int:
+    """Turn operands read from cells that are never written into immediates; return the count."""
+    folded = 0
+    for instruction in graph.instructions.values():
+        if instruction.address in graph.self_modifying or graph.reads & set(instruction.extent):
+            continue
+
+        modes, parameters = list(instruction.modes), list(instruction.parameters)
+        for index in range(len(parameters) - (instruction.operation in WRITES)):
+            address = parameters[index]
+            if modes[index] != POSITION or address in graph.writes:
+                continue
+            if 0 <= address < len(program):
+                modes[index], parameters[index] = IMMEDIATE, program[address]
+                folded += 1
+
+        rewritten = instruction._replace(modes=tuple(modes), parameters=tuple(parameters))
+        program[instruction.address:instruction.next] = _encode(rewritten)
+    return folded
+
+
+def eliminate_dead_stores(program: List[int], graph: ControlFlowGraph) -> Tuple[int, int]:
+    """Jump over stores that are overwritten before they are read; return the count and savings."""
+    dead = set()
+    for block in graph.blocks.values():
+        for index, instruction in enumerate(block.instructions):
+            target = instruction.target
+            if instruction.operation == 3 or target is None or target in graph.code:
+                continue
+            for later in block.instructions[index + 1:]:
+                if target in later.reads or later.address in graph.self_modifying:
+                    break
+                if later.target == target:
+                    dead.add(instruction.address)
+                    break
+
+    dead -= {address for address in dead if graph.reads & set(graph.instructions[address].extent)}
+    saved = 0
+    for block in graph.blocks.values():
+        run = []
+        for instruction in (*block.instructions, None):
+            if instruction is not None and instruction.address in dead:
+                run.append(instruction)
+                continue
+            if run:
+                start, stop = run[0].address, run[-1].next
+                program[start:stop] = [1105, 1, stop] + [0] * (stop - start - 3)
+                saved += len(run) - 1
+                run = []
+
+    return len(dead), saved
+
+
+def find_multiply_loops(program: Sequence[int], graph: ControlFlowGraph) -> Dict[int, MultiplyLoop]:
+    """Find the blocks that add an operand to an accumulator while counting a counter down."""
+    loops = {}
+    for start, block in graph.blocks.items():
+        if len(block.instructions) != 3:
+            continue
+
+        add, decrement, jump = block.instructions
+        if add.operation != 1 or decrement.operation != 1 or jump.operation != 5:
+            continue
+        if add.modes[2] != POSITION or decrement.modes[2] != POSITION:
+            continue
+
+        # The decrement is `counter = counter + -1`, in either order
+        counter = decrement.parameters[2]
+        operands = sorted(zip(decrement.modes, decrement.parameters[:2]))
+        if operands != sorted([(POSITION, counter), (IMMEDIATE, -1)]):
+            continue
+
+        # The jump is `if counter != 0: goto start`
+        if jump.modes[:2] != (POSITION, IMMEDIATE) or jump.parameters != (counter, start):
+            continue
+
+        # The addition is `accumulator = accumulator + operand`, in either order
+        accumulator = add.parameters[2]
+        operands = list(zip(add.modes, add.parameters[:2]))
+        if (POSITION, accumulator) not in operands:
+            continue
+        operands.remove((POSITION, accumulator))
+        (mode, operand), = operands
+        if mode == RELATIVE or (mode == POSITION and operand in (accumulator, counter)):
+            continue
+        if accumulator == counter:
+            continue
+
+        extent = range(start, jump.next)
+        if {accumulator, counter} & set(extent) or (mode == POSITION and operand in extent):
+            continue
+
+        loops[start] = MultiplyLoop(
+            start=start,
+            words=tuple(program[start:jump.next]),
+            accumulator=accumulator,
+            operand=operand if mode == POSITION else None,
+            value=operand if mode == IMMEDIATE else 0,
+            counter=counter,
+        )
+    return loops
+
+
+def optimize(program: Sequence[int]) -> Optimization:
+    """Produce an equivalent, faster version of `program` and report what was optimized."""
+    graph = disassemble(program)
+    optimized = list(program)
+    loops = find_multiply_loops(program, graph)
+
+    if not graph.closed:
+        skipped = "not all memory accesses and jump targets of the program are known"
+        log.debug(f"Skipped rewriting the program: {skipped}")
+        return Optimization(optimized, loops, 0, 0, 0, skipped)
+
+    folded = propagate_constants(optimized, graph)
+    dead, saved = eliminate_dead_stores(optimized, graph)
+    # Folding may change the words of a loop, so the loops are found again in the rewritten program
+    loops = find_multiply_loops(optimized, disassemble(optimized))
+    log.debug(
+        f"Folded {folded} operands, eliminated {dead} dead stores and found {len(loops)} "
+        f"multiplication loops in {len(graph.instructions)} instructions"
+    )
+    return Optimization(optimized, loops, folded, dead, saved, None)
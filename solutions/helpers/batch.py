@@ -0,0 +1,191 @@
+"""
+A lockstep IntCode engine that runs many copies of one application at once using NumPy.
+
+All copies share the same program but start with different values patched into their memory, like
+the noun and verb of day 2. Copies that are at the same instruction are executed together as a
+single vectorized operation on the rows of a `(copies, memory_size)` array. When the copies in a
+group diverge, because a conditional jump goes both ways or because one of them modified its code,
+the group is split up; groups that arrive at the same instruction later on are merged again.
+
+Only the instructions that don't need I/O are supported. Copies that execute an input or output
+instruction or touch an address outside of their memory are marked as faulted and stop running.
+Copies that may overflow the signed 64-bit integers used for their memory are taken out of the
+batch and finish on the interpreter, which has exact integers; their final memory is available
+through `values` if it no longer fits in 64 bits.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .intcode import HALT, IMMEDIATE, IntCodeApplication, RELATIVE, decode_opcode
+
+log = logging.getLogger(__name__)
+
+# The length of each supported instruction, including the opcode itself
+LENGTHS = {1: 4, 2: 4, 5: 3, 6: 3, 7: 4, 8: 4, 9: 2}
+
+# The products of operands with an absolute value larger than this may not fit in 64 bits
+MAX_EXACT_PRODUCT = float(2**62)
+
+# The range of values that fit in the signed 64-bit integers of the batch memory
+INT64_RANGE = range(-2**63, 2**63)
+
+
+class IntCodeBatch:
+    """A batch of copies of one IntCode application that are executed in lockstep."""
+
+    def __init__(
+        self,
+        application: List[int],
+        patches: Dict[int, Sequence[int]],
+        memory_size: int = 0,
+    ) -> None:
+        copies = {len(values) for values in patches.values()}
+        if len(copies) != 1:
+            raise ValueError("All patches need to have the same number of values.")
+
+        self.memory = np.zeros((copies.pop(), max(len(application), memory_size)), dtype=np.int64)
+        self.memory[:, :len(application)] = application
+        for address, values in patches.items():
+            self.memory[:, address] = values
+
+        self.relative_base = np.zeros(len(self.memory), dtype=np.int64)
+        self.halted = np.zeros(len(self.memory), dtype=bool)
+        self.faulted = np.zeros(len(self.memory), dtype=bool)
+        self.steps = 0
+        # The instruction pointers of the copies that left the batch because they may overflow
+        self.deferred: Dict[int, int] = {}
+        # The final memory of the copies with values that do not fit in 64 bits
+        self.exact: Dict[int, List[int]] = {}
+
+    def run(self, max_steps: Optional[int] = None) -> None:
+        """Run the batch until every copy has halted or faulted, or until `max_steps` is reached."""
+        # The rows of the copies waiting at each instruction pointer
+        pending: Dict[int, List[np.ndarray]] = {0: [np.arange(len(self.memory))]}
+
+        while pending and (max_steps is None or self.steps < max_steps):
+            pointer = next(iter(pending))
+            rows = np.concatenate(pending.pop(pointer))
+            self.steps += 1
+
+            for next_pointer, next_rows in self.step(pointer, rows):
+                pending.setdefault(next_pointer, []).append(next_rows)
+
+        log.debug(f"Ran a batch of {len(self.memory)} copies in {self.steps} steps")
+        if not pending:
+            self.finish_deferred()
+
+    def finish_deferred(self) -> None:
+        """Run the copies that left the batch to completion on the interpreter."""
+        for row, pointer in self.deferred.items():
+            application = IntCodeApplication(self.memory[row].tolist())
+            application.pointer = pointer
+            application.relative_base = int(self.relative_base[row])
+            try:
+                outputs = list(application.resume())
+            except IndexError:
+                outputs = None
+
+            if outputs != [] or not application.halted:
+                self.fault(np.array([row]), "the interpreter could not run the copy to completion")
+                continue
+
+            self.halted[row] = True
+            memory = application.application
+            if all(value in INT64_RANGE for value in memory):
+                self.memory[row] = memory
+            else:
+                self.exact[row] = memory
+        self.deferred.clear()
+
+    def values(self, address: int) -> List[int]:
+        """Return the value at `address` of every copy, also of copies that outgrew 64 bits."""
+        values = self.memory[:, address].tolist()
+        for row, memory in self.exact.items():
+            values[row] = memory[address]
+        return values
+
+    def fault(self, rows: np.ndarray, reason: str) -> None:
+        """Mark the copies in `rows` as faulted."""
+        log.debug(f"{len(rows)} copies faulted: {reason}")
+        self.faulted[rows] = True
+
+    def step(self, pointer: int, rows: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+        """Execute the instruction at `pointer` for `rows` and return the successor groups."""
+        memory = self.memory
+        size = memory.shape[1]
+
+        opcodes = memory[rows, pointer]
+        if (opcodes != opcodes[0]).any():
+            # Some copies modified their code: split the group up and execute each opcode apart
+            return [
+                successor
+                for opcode in np.unique(opcodes)
+                for successor in self.step(pointer, rows[opcodes == opcode])
+            ]
+
+        operation, modes = decode_opcode(int(opcodes[0]))
+        if operation == HALT:
+            self.halted[rows] = True
+            return []
+        if operation not in LENGTHS:
+            self.fault(rows, f"unsupported operation {operation} at {pointer}")
+            return []
+        if pointer + LENGTHS[operation] > size:
+            self.fault(rows, f"instruction at {pointer} runs past the end of memory")
+            return []
+
+        parameters = memory[rows, pointer + 1:pointer + LENGTHS[operation]]
+        addresses = [
+            parameters[:, i] + self.relative_base[rows] if mode == RELATIVE else parameters[:, i]
+            for i, mode in enumerate(modes[:parameters.shape[1]])
+        ]
+
+        valid = np.ones(len(rows), dtype=bool)
+        for i, address in enumerate(addresses):
+            if modes[i] != IMMEDIATE or i == 2:
+                valid &= (address >= 0) & (address < size)
+        if not valid.all():
+            self.fault(rows[~valid], f"address out of range at {pointer}")
+            return [(pointer, rows[valid])] if valid.any() else []
+
+        def value(i: int) -> np.ndarray:
+            return parameters[:, i] if modes[i] == IMMEDIATE else memory[rows, addresses[i]]
+
+        a = value(0)
+        if operation == 9:
+            self.relative_base[rows] += a
+            return [(pointer + 2, rows)]
+
+        b = value(1)
+        if operation in (5, 6):
+            taken = (a != 0) if operation == 5 else (a == 0)
+            successors = [] if taken.all() else [(pointer + 3, rows[~taken])]
+            for target in np.unique(b[taken]):
+                if target < 0:
+                    self.fault(rows[taken & (b == target)], f"negative jump target at {pointer}")
+                else:
+                    successors.append((int(target), rows[taken & (b == target)]))
+            return successors
+
+        if operation == 1:
+            result = a + b
+            overflow = ((a ^ result) & (b ^ result)) < 0
+        elif operation == 2:
+            result = a * b
+            overflow = np.abs(a.astype(np.float64) * b) > MAX_EXACT_PRODUCT
+        else:
+            result = ((a < b) if operation == 7 else (a == b)).astype(np.int64)
+            overflow = np.zeros(len(rows), dtype=bool)
+
+        target = addresses[2]
+        if overflow.any():
+            log.debug(f"{overflow.sum()} copies may overflow at {pointer}; deferring them")
+            self.deferred.update(dict.fromkeys(rows[overflow].tolist(), pointer))
+            rows, result, target = rows[~overflow], result[~overflow], target[~overflow]
+
+        memory[rows, target] = result
+        return [(pointer + 4, rows)] if len(rows) else []
@@ -0,0 +1,108 @@
+"""
+Measure the throughput of the IntCodeApplication in instructions per second.
+
+Usage: python -m solutions.helpers.benchmark [-r REPEAT] [-e ENGINE] [-p DIRECTORY]
+"""
+import argparse
+import functools
+import itertools
+import pathlib
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from solutions.data import get_data
+from solutions.day11.solution import paint_hull
+from solutions.helpers import ENGINES, IntCodeApplication, get_engine
+from solutions.helpers.profiler import Profile
+
+Factory = Callable[..., IntCodeApplication]
+
+
+def _profiling_factory(*args: Any, profile: Profile, **kwargs: Any) -> IntCodeApplication:
+    """Create an IntCodeApplication that records its executed instructions in `profile`."""
+    application = IntCodeApplication(*args, **kwargs)
+    profile.attach(application)
+    return application
+
+
+def amplifier_search(data: List[int], create: Factory) -> None:
+    """Run the amplifier chain of day 7 for each phase permutation, one amplifier at a time."""
+    for phases in itertools.permutations(range(5), 5):
+        signal = 0
+        for phase in phases:
+            application = create(data)
+            application.stdin.put(phase)
+            application.stdin.put(signal)
+            application.run()
+            signal = application.stdout.get()
+
+
+def boost(data: List[int], create: Factory, mode: int) -> None:
+    """Run the BOOST program of day 9 in either test mode (1) or sensor boost mode (2)."""
+    application = create(data, flexible_memory=True)
+    application.stdin.put(mode)
+    application.run()
+
+
+def hull_painting(data: List[int], create: Factory) -> None:
+    """Run the hull painting robot of day 11 on an all-black hull."""
+    application = create(data, flexible_memory=True)
+    paint_hull(application, canvas={})
+
+
+WORKLOADS: Dict[str, Tuple[int, Callable[[List[int], Factory], None]]] = {
+    "day07-amplifiers": (7, amplifier_search),
+    "day09-boost-test": (9, functools.partial(boost, mode=1)),
+    "day09-boost-sensor": (9, functools.partial(boost, mode=2)),
+    "day11-hull-painting": (11, hull_painting),
+}
+
+
+def benchmark(repeat: int, engine: str, profiles: Optional[pathlib.Path] = None) -> None:
+    """Time each workload `repeat` times on `engine` and print the best instructions per second."""
+    for name, (day, workload) in WORKLOADS.items():
+        data = [int(number) for number in get_data(day=day)[0].split(",")]
+
+        profile = Profile()
+        workload(data, functools.partial(_profiling_factory, profile=profile))
+        if profiles is not None:
+            profiles.mkdir(parents=True, exist_ok=True)
+            (profiles / f"{name}.json").write_text(profile.to_json(indent=2))
+
+        timer = functools.partial(workload, data, get_engine(engine))
+        best = min(timeit.repeat(timer, number=1, repeat=repeat))
+        print(
+            f"{name:<20} {profile.instructions:>9} instructions in {best:.6f} seconds "
+            f"({profile.instructions / best:,.0f} instructions per second)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the IntCodeApplication")
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=5,
+        metavar="NUMBER",
+        help="run each workload NUMBER times and report the best time",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        dest="engine",
+        choices=ENGINES,
+        default="reference",
+        help="the IntCode engine to benchmark",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        dest="profiles",
+        type=pathlib.Path,
+        metavar="DIRECTORY",
+        help="write the execution profile of each workload as JSON to DIRECTORY",
+    )
+    args = parser.parse_args()
+    benchmark(args.repeat, args.engine, args.profiles)
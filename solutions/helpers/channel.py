@@ -0,0 +1,81 @@
+"""
+Buffered I/O channels for IntCode applications.
+
+A `Channel` can be given to an IntCode application as its `stdin` and `stdout` instead of the
+default `queue.SimpleQueue`. It offers the same interface that the applications and their hosts
+use, but it does not lock, so it's meant for hosts that drive their applications from a single
+thread. On top of that, it reads and writes values in bulk: a host can write all outputs of a
+`resume` in one call and then read them a frame at a time, like the `(color, turn)` pairs of the
+painting robot of day 11.
+
+The values are kept in a `collections.deque`, which is a ring of fixed-size blocks: values are
+appended and consumed at either end without shifting or reallocating the buffered values.
+
+Since nothing else could put a value in a channel while the application waits, reading from an
+empty channel raises `queue.Empty` instead of blocking forever. Applications that run in threads
+or on an event loop should keep the default `queue.SimpleQueue` or be given an `asyncio.Queue`.
+"""
+from __future__ import annotations
+
+import collections
+import queue
+from typing import Iterable, Iterator, List
+
+
+class Channel:
+    """A single-threaded FIFO channel of values with bulk reads and writes."""
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._buffer = collections.deque(values)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the values waiting in the channel without removing them."""
+        return iter(self._buffer)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._buffer)})"
+
+    def put(self, value: int, block: bool = True, timeout: None = None) -> None:
+        """Write `value` to the channel."""
+        self._buffer.append(value)
+
+    def put_nowait(self, value: int) -> None:
+        """Write `value` to the channel."""
+        self._buffer.append(value)
+
+    def get(self, block: bool = True, timeout: None = None) -> int:
+        """Read the next value from the channel, or raise `queue.Empty` if there is none."""
+        try:
+            return self._buffer.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    get_nowait = get
+
+    def empty(self) -> bool:
+        """Return whether the channel is empty."""
+        return not self._buffer
+
+    def qsize(self) -> int:
+        """Return the number of values waiting in the channel."""
+        return len(self._buffer)
+
+    def write_many(self, values: Iterable[int]) -> None:
+        """Write all `values` to the channel, consuming an iterator lazily."""
+        self._buffer.extend(values)
+
+    def read_n(self, n: int) -> List[int]:
+        """Read the next `n` values at once; raise `queue.Empty` if fewer than `n` are waiting."""
+        buffer = self._buffer
+        if len(buffer) < n:
+            raise queue.Empty
+        return [buffer.popleft() for _ in range(n)]
+
+    def read_all(self) -> List[int]:
+        """Read all values waiting in the channel."""
+        values = list(self._buffer)
+        self._buffer.clear()
+        return values
@@ -0,0 +1,159 @@
+"""
+Binary checkpoints of IntCode applications on disk.
+
+A checkpoint file consists of:
+
+- a fixed-size header with the registers of the application and the sizes of the sections below;
+- the indices of the int64 memory pages, as int64 values;
+- JSON metadata with the name of the application, the values waiting in its stdin and stdout, and
+  the (rare) memory pages that hold values too large for 64 bits;
+- padding up to a multiple of the page size, followed by the raw int64 memory pages.
+
+Loading a checkpoint maps the file into memory and uses read-only views on the mapped pages as the
+memory of the application, so nothing is parsed or copied until the application writes to a page.
+
+The header is always little-endian. The page indices and pages are written in the byte order of
+the machine by default, which is recorded in the header flags; a checkpoint loaded on a machine
+with the other byte order has its pages swapped into copies instead of mapped.
+"""
+from __future__ import annotations
+
+import array
+import json
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import sys
+from typing import Optional, Union
+
+from .engines import get_engine
+from .intcode import IntCodeApplication, Snapshot
+from .memory import BoundedMemory, PAGE_SIZE, PagedMemory
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"INTC"
+VERSION = 1
+
+# Magic, version, flags, pointer, relative base, memory length, page count, metadata size
+HEADER = struct.Struct("<4sHHqqqqq")
+PAGE_BYTES = 8 * PAGE_SIZE
+
+# Header flags
+PAGED = 1
+HALTED = 2
+BIG_ENDIAN = 4
+
+Path = Union[str, os.PathLike]
+
+
+def _to_bytes(values: Union[array.array, memoryview], swap: bool) -> bytes:
+    """Return the raw bytes of the int64 `values`, in the other byte order if `swap` is set."""
+    if not swap:
+        return values.tobytes()
+    swapped = array.array("q", values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _from_bytes(buffer: memoryview, swap: bool) -> Union[array.array, memoryview]:
+    """Return a view on the int64 values in `buffer`, or a swapped copy if `swap` is set."""
+    if not swap:
+        return buffer.cast("q")
+    values = array.array("q", bytes(buffer))
+    values.byteswap()
+    return values
+
+
+def save_checkpoint(
+    application: IntCodeApplication, path: Path, byteorder: str = sys.byteorder
+) -> None:
+    """Write a checkpoint of the current state of `application` to `path`, atomically."""
+    snapshot = application.snapshot()
+    # A bounded memory has a fixed size, so it's saved like the lists of the other engines
+    paged = (
+        isinstance(snapshot.memory, PagedMemory)
+        and not isinstance(snapshot.memory, BoundedMemory)
+    )
+    memory = snapshot.memory if paged else PagedMemory(snapshot.memory)
+
+    raw_pages = {
+        index: page for index, page in sorted(memory.pages.items())
+        if isinstance(page, (array.array, memoryview))
+    }
+    metadata = json.dumps({
+        "name": application.name,
+        "stdin": snapshot.stdin,
+        "stdout": snapshot.stdout,
+        "pages": {
+            index: list(page) for index, page in memory.pages.items() if index not in raw_pages
+        },
+    }).encode()
+
+    flags = (
+        (PAGED if paged else 0)
+        | (HALTED if snapshot.halted else 0)
+        | (BIG_ENDIAN if byteorder == "big" else 0)
+    )
+    swap = byteorder != sys.byteorder
+    header = HEADER.pack(
+        MAGIC, VERSION, flags, snapshot.pointer, snapshot.relative_base,
+        0 if paged else len(snapshot.memory), len(raw_pages), len(metadata),
+    )
+    offset = HEADER.size + 8 * len(raw_pages) + len(metadata)
+
+    path = pathlib.Path(path)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as file:
+        file.write(header)
+        file.write(_to_bytes(array.array("q", list(raw_pages)), swap))
+        file.write(metadata)
+        file.write(bytes(-offset % PAGE_BYTES))
+        for page in raw_pages.values():
+            file.write(_to_bytes(page, swap))
+    os.replace(temporary, path)
+
+    log.debug(f"Saved a checkpoint of {application.name} with {len(memory.pages)} pages to {path}")
+
+
+def load_checkpoint(path: Path, engine: Optional[str] = None) -> IntCodeApplication:
+    """Load the application checkpointed at `path` on `engine`, or on the selected engine."""
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, flags, pointer, relative_base, length, page_count, metadata_size = (
+        HEADER.unpack_from(mapped)
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} IntCode checkpoint.")
+
+    swap = bool(flags & BIG_ENDIAN) != (sys.byteorder == "big")
+    if swap:
+        log.debug(f"Swapping the byte order of the pages of {path}")
+
+    offset = HEADER.size
+    indices = _from_bytes(memoryview(mapped)[offset:offset + 8 * page_count], swap)
+    offset += 8 * page_count
+    metadata = json.loads(mapped[offset:offset + metadata_size])
+    offset += metadata_size
+    offset += -offset % PAGE_BYTES
+
+    memory = PagedMemory()
+    for number, index in enumerate(indices):
+        start = offset + number * PAGE_BYTES
+        memory.pages[index] = _from_bytes(memoryview(mapped)[start:start + PAGE_BYTES], swap)
+    for index, values in metadata["pages"].items():
+        memory.pages[int(index)] = tuple(values)
+
+    application = get_engine(engine)([], name=metadata["name"])
+    application.restore(Snapshot(
+        memory=memory if flags & PAGED else tuple(memory)[:length],
+        pointer=pointer,
+        relative_base=relative_base,
+        halted=bool(flags & HALTED),
+        stdin=tuple(metadata["stdin"]),
+        stdout=tuple(metadata["stdout"]),
+    ))
+    return application
@@ -0,0 +1,297 @@
+"""
+A basic-block compiler for IntCode applications.
+
+Straight-line runs of instructions are translated to Python source, compiled once and cached, so a
+hot loop costs one Python call per block instead of a dispatch and a handful of method calls per
+instruction. Input, output and halt instructions are left to the interpreter. Whenever a program
+writes into a compiled region, the affected blocks are dropped and that code is decoded again.
+
+With paged memory, the generated code indexes the pages directly. An instruction that touches a
+page that was not allocated yet, that writes to a read-only page of a shared image, or that stores a
+value that does not fit in 64 bits, is handed to the interpreter instead, which allocates, copies or
+promotes the page as needed.
+
+The `Int64IntCodeApplication` uses paged memory for programs with a fixed-size memory as well, so
+all values are stored as native int64s in compact arrays. Only a page that receives a value that
+overflows 64 bits is promoted to Python ints; the other pages of the program are left as they are.
+Unless `flexible_memory` is set, such a memory is a `BoundedMemory`, which raises an `IndexError`
+outside of the program, just like the lists of the other engines.
+"""
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Set, Tuple, Union,
+)
+
+from .intcode import (
+    HALT, IMMEDIATE, INPUT, Instruction, IntCodeApplication, OUTPUT, RELATIVE, Snapshot,
+    decode_opcode,
+)
+from .memory import BoundedMemory, PAGE_BITS, PAGE_MASK, PagedMemory
+
+log = logging.getLogger(__name__)
+
+# Operations that can be part of a compiled block, mapped to their instruction length.
+STRAIGHT_LINE = {1: 4, 2: 4, 7: 4, 8: 4, 9: 2}
+JUMPS = {5: 3, 6: 3}
+
+EXPRESSIONS = {
+    1: "{a} + {b}",
+    2: "{a} * {b}",
+    7: "1 if {a} < {b} else 0",
+    8: "1 if {a} == {b} else 0",
+}
+CONDITIONS = {5: "{a} != 0", 6: "{a} == 0"}
+
+Block = Callable[[IntCodeApplication, List[int], Dict[int, Set[int]], Callable], int]
+
+
+class Translation(NamedTuple):
+    """A compiled basic block and the memory pages its fixed addresses refer to."""
+
+    block: Block
+    pages: FrozenSet[int]
+
+
+def scan_block(memory: List[int], start: int) -> Tuple[int, ...]:
+    """Return the words of the compilable basic block at `start`, or `()` if there is none."""
+    address = start
+    try:
+        while True:
+            operation = decode_opcode(memory[address]).operation
+            if operation in STRAIGHT_LINE:
+                address += STRAIGHT_LINE[operation]
+            elif operation in JUMPS:
+                address += JUMPS[operation]
+                break
+            else:
+                break
+        words = tuple(memory[i] for i in range(start, address))
+    except IndexError:
+        # The block runs off the end of a fixed-size memory; leave the tail to the interpreter.
+        words = ()
+    return words
+
+
+@functools.lru_cache(maxsize=4096)
+def translate(start: int, words: Tuple[int, ...], paged: bool) -> Translation:
+    """Translate the basic block `words` located at `start` to a compiled Python function."""
+    modifies_base = False
+    pages = set()
+    body = []
+    address = start
+
+    def location(mode: int, parameter: int) -> str:
+        if mode == RELATIVE:
+            return f"rb + {parameter}"
+        return f"{parameter}"
+
+    def cell(mode: int, parameter: int, name: str = "t") -> str:
+        if not paged:
+            return f"memory[{location(mode, parameter)}]"
+        if mode == RELATIVE:
+            return f"pages[({name} := rb + {parameter}) >> {PAGE_BITS}][{name} & {PAGE_MASK}]"
+
+        pages.add(parameter >> PAGE_BITS)
+        return f"pages[{parameter >> PAGE_BITS}][{parameter & PAGE_MASK}]"
+
+    def operand(mode: int, parameter: int) -> str:
+        return f"{parameter}" if mode == IMMEDIATE else cell(mode, parameter)
+
+    def leave(resume: str) -> List[str]:
+        sync = ["app.relative_base = rb"] if modifies_base else []
+        return sync + [f"return {resume}"]
+
+    def emit(lines: List[str], indent: int = 1) -> None:
+        body.extend("    " * indent + line for line in lines)
+
+    def guarded(lines: List[str]) -> List[str]:
+        """Hand the instruction at `address` to the interpreter if it faults on paged memory."""
+        if not paged or not any("pages[" in line for line in lines):
+            return lines
+        return [
+            "try:",
+            *("    " + line for line in lines),
+            "except (KeyError, TypeError, OverflowError):",
+            *("    " + line for line in leave(f"app.fallback({address})")),
+        ]
+
+    while address - start < len(words):
+        operation, modes = decode_opcode(words[address - start])
+        parameters = words[address - start + 1:address - start + 4]
+        a = operand(modes[0], parameters[0])
+
+        if operation in EXPRESSIONS:
+            resume = address + STRAIGHT_LINE[operation]
+            b = operand(modes[1], parameters[1])
+            expression = EXPRESSIONS[operation].format(a=a, b=b)
+            target = "memory[address]" if not paged else cell(modes[2], parameters[2], "address")
+            emit(guarded([
+                f"address = {location(modes[2], parameters[2])}",
+                f"{target} = {expression}",
+            ]))
+            emit(["if address in covered:"])
+            emit(leave(f"invalidate(address, {resume})"), indent=2)
+        elif operation == 9:
+            emit(guarded([f"rb += {a}"]))
+            modifies_base = True
+        else:
+            resume = address + JUMPS[operation]
+            b = operand(modes[1], parameters[1])
+            emit(guarded([
+                f"if {CONDITIONS[operation].format(a=a)}:",
+                *("    " + line for line in leave(b)),
+            ]))
+            emit(leave(f"{resume}"))
+            break
+
+        address += STRAIGHT_LINE.get(operation, 0)
+    else:
+        emit(leave(f"{address}"))
+
+    source = "\n".join([
+        f"def block_{start}(app, memory, covered, invalidate):",
+        "    rb = app.relative_base",
+        *(["    pages = memory.pages"] if paged else []),
+        *body,
+    ])
+    namespace = {}
+    exec(compile(source, f"<intcode block {start}>", "exec"), namespace)
+    return Translation(block=namespace[f"block_{start}"], pages=frozenset(pages))
+
+
+class CompiledIntCodeApplication(IntCodeApplication):
+    """An IntCodeApplication that runs straight-line code as compiled basic blocks."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Compiled blocks by start address; `None` marks an address the interpreter handles
+        self._blocks: Dict[int, Optional[Block]] = {}
+        self._extents: Dict[int, range] = {}
+        # The start addresses of the blocks covering each compiled address
+        self._covered: Dict[int, Set[int]] = {}
+
+    def decode(self, address: int) -> Instruction:
+        """Decode the instruction at `address`; compiled blocks write memory behind the cache."""
+        return decode_opcode(self.application[address])
+
+    def compile_block(self, start: int) -> Optional[Block]:
+        """Compile the basic block starting at `start` and register the addresses it covers."""
+        words = scan_block(self.application, start)
+        if not words:
+            return None
+
+        extent = range(start, start + len(words))
+        self._extents[start] = extent
+        for address in extent:
+            self._covered.setdefault(address, set()).add(start)
+
+        translation = translate(start, words, paged=isinstance(self.application, PagedMemory))
+        for page in translation.pages:
+            self.application.touch(page << PAGE_BITS)
+
+        log.debug(f"{self.name}: compiled block {start}-{extent.stop - 1}")
+        return translation.block
+
+    def invalidate(self, address: int, resume: int) -> int:
+        """Drop all compiled blocks covering `address` and return the address to resume at."""
+        for start in self._covered.pop(address, ()):
+            del self._blocks[start]
+            for covered_address in self._extents.pop(start):
+                starts = self._covered.get(covered_address)
+                if starts is not None:
+                    starts.discard(start)
+                    if not starts:
+                        del self._covered[covered_address]
+        return resume
+
+    def fallback(self, address: int) -> int:
+        """Interpret the single instruction at `address` and return the address to resume at."""
+        operation, modes = decode_opcode(self.application[address])
+        self._pointer = address + 1
+        self.operations[operation](modes=modes)
+        return self._pointer
+
+    def resume(self, blocking: bool = False, quantum: Optional[int] = None) -> Iterator[int]:
+        """
+        Run the IntCodeApplication like `IntCodeApplication.resume`, using compiled blocks.
+
+        A `quantum` counts dispatches rather than instructions: a compiled block counts as one.
+        """
+        memory = self.application
+        blocks = self._blocks
+        covered = self._covered
+        invalidate = self.invalidate
+        operations = self.operations
+        stdin = self.stdin
+        dispatches = itertools.repeat(None) if quantum is None else itertools.repeat(None, quantum)
+
+        for _ in dispatches:
+            pointer = self._pointer
+            try:
+                block = blocks[pointer]
+            except KeyError:
+                block = blocks[pointer] = self.compile_block(pointer)
+
+            if block is not None:
+                self.pointer = block(self, memory, covered, invalidate)
+                continue
+
+            operation, modes = decode_opcode(memory[pointer])
+            if operation == HALT:
+                self.halted = True
+                return
+            if operation == INPUT and not blocking and stdin.empty():
+                return
+
+            self._pointer += 1
+            if operation == OUTPUT:
+                yield self.read(modes[0])
+            elif operation == INPUT and not blocking:
+                self.write(modes[0], stdin.get_nowait())
+            else:
+                operations[operation](modes=modes)
+
+    def _reset_caches(self) -> None:
+        """Give the application caches of its own, including those of its compiled blocks."""
+        super()._reset_caches()
+        self._blocks = {}
+        self._extents = {}
+        self._covered = {}
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Restore the application from `snapshot` and drop all compiled blocks."""
+        super().restore(snapshot)
+        self._blocks.clear()
+        self._extents.clear()
+        self._covered.clear()
+
+    def write(self, mode: int, value: int) -> None:
+        """Write `value` to memory and drop the compiled blocks that cover the written address."""
+        pointer = self.parameter()
+        if mode == RELATIVE:
+            pointer += self.relative_base
+        self.application[pointer] = value
+        self._instructions.pop(pointer, None)
+        if pointer in self._covered:
+            self.invalidate(pointer, self._pointer)
+
+
+class Int64IntCodeApplication(CompiledIntCodeApplication):
+    """A CompiledIntCodeApplication that keeps its memory in int64 pages, even if it's fixed."""
+
+    def __init__(
+        self,
+        application: Union[List[int], PagedMemory],
+        *args: Any,
+        flexible_memory: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        if not isinstance(application, PagedMemory):
+            # A fixed-size memory keeps its bounds, like the list the other engines use
+            memory_class = PagedMemory if flexible_memory else BoundedMemory
+            application = memory_class(application)
+        super().__init__(application, *args, **kwargs)
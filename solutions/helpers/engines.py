@@ -0,0 +1,62 @@
+"""
+A registry of the engines that can run IntCode applications.
+
+The solutions create their applications with `create_application` instead of instantiating an
+engine class directly, so all IntCode days can be switched to another engine at once, either with
+the `--engine` option of the command line interface or with the `AOC_INTCODE_ENGINE` environment
+variable. Selecting an engine also sets the environment variable, so worker processes started
+afterwards use the same engine.
+"""
+import logging
+import os
+from typing import Any, Dict, Optional, Type
+
+from .compiler import CompiledIntCodeApplication, Int64IntCodeApplication
+from .intcode import IntCodeApplication
+from .optimizer import OptimizedIntCodeApplication
+
+log = logging.getLogger(__name__)
+
+ENVIRONMENT_VARIABLE = "AOC_INTCODE_ENGINE"
+DEFAULT_ENGINE = "reference"
+
+ENGINES: Dict[str, Type[IntCodeApplication]] = {
+    "reference": IntCodeApplication,
+    "fast": CompiledIntCodeApplication,
+    "int64": Int64IntCodeApplication,
+    "optimized": OptimizedIntCodeApplication,
+}
+
+
+def register_engine(name: str, engine: Type[IntCodeApplication]) -> None:
+    """Register `engine` under `name` so it can be selected like the built-in engines."""
+    if name in ENGINES:
+        raise ValueError(f"An IntCode engine named {name!r} has already been registered.")
+    ENGINES[name] = engine
+
+
+def select_engine(name: str) -> None:
+    """Select the engine that `create_application` uses from now on, in this and child processes."""
+    if name not in ENGINES:
+        raise ValueError(f"Unknown IntCode engine {name!r}; choose from {', '.join(ENGINES)}.")
+
+    log.debug(f"Selecting the {name} IntCode engine")
+    os.environ[ENVIRONMENT_VARIABLE] = name
+
+
+def get_engine(name: Optional[str] = None) -> Type[IntCodeApplication]:
+    """Get the engine registered as `name`, or the selected engine if no name is given."""
+    if name is None:
+        name = os.environ.get(ENVIRONMENT_VARIABLE, DEFAULT_ENGINE)
+
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown IntCode engine {name!r}; choose from {', '.join(ENGINES)}.")
+
+
+def create_application(
+    *args: Any, engine: Optional[str] = None, **kwargs: Any
+) -> IntCodeApplication:
+    """Create an IntCode application on `engine`, or on the selected engine by default."""
+    return get_engine(engine)(*args, **kwargs)
@@ -0,0 +1,91 @@
+"""
+Incremental state fingerprints for IntCode applications, and cycle detection built on them.
+
+The fingerprint of the memory is the XOR of a hash of every `(address, value)` pair with a non-zero
+value, in the spirit of Zobrist hashing. Since XOR is its own inverse, a write only has to XOR out
+the hash of the old value and XOR in the hash of the new one, which makes hashing the state of an
+application O(1) instead of O(memory). Cells that hold zero do not contribute, so extending the
+memory with zeros does not change the fingerprint.
+
+Writes that bypass `write`, like the ones in compiled blocks, are not tracked, so fingerprinted
+applications run on the interpreter.
+"""
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+from .intcode import IntCodeApplication, RELATIVE, Snapshot
+
+
+def cell_hash(address: int, value: int) -> int:
+    """Return the contribution of the cell at `address` holding `value` to the fingerprint."""
+    return hash((address, value)) if value else 0
+
+
+def memory_fingerprint(memory: Iterable[int]) -> int:
+    """Calculate the fingerprint of `memory` from scratch."""
+    fingerprint = 0
+    for address, value in enumerate(memory):
+        fingerprint ^= cell_hash(address, value)
+    return fingerprint
+
+
+class Cycle(NamedTuple):
+    """A cycle in the states of an application, in number of instructions executed."""
+
+    start: int
+    length: int
+
+
+class FingerprintedIntCodeApplication(IntCodeApplication):
+    """An IntCodeApplication that maintains a fingerprint of its memory as it writes to it."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.memory_fingerprint = memory_fingerprint(self.application)
+
+    def __hash__(self) -> int:
+        """Return a hash of the memory, pointer and relative base of the application in O(1)."""
+        return hash((self.memory_fingerprint, self._pointer, self.relative_base))
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Restore the application from `snapshot` and recalculate the fingerprint in O(memory)."""
+        super().restore(snapshot)
+        self.memory_fingerprint = memory_fingerprint(self.application)
+
+    def write(self, mode: int, value: int) -> None:
+        """Write `value` to memory and update the fingerprint of the memory accordingly."""
+        address = self.parameter()
+        if mode == RELATIVE:
+            address += self.relative_base
+
+        memory = self.application
+        self.memory_fingerprint ^= cell_hash(address, memory[address]) ^ cell_hash(address, value)
+        memory[address] = value
+        self._instructions.pop(address, None)
+
+
+def find_cycle(
+    application: FingerprintedIntCodeApplication, max_steps: Optional[int] = None
+) -> Optional[Cycle]:
+    """
+    Run `application` one instruction at a time until it revisits a state and return the cycle.
+
+    The outputs of the application are put in its `stdout`. `None` is returned if it halts, waits
+    for input or runs for `max_steps` instructions without revisiting a state. Since the states are
+    compared by hash, a collision could report a cycle that does not exist, but that is unlikely.
+    """
+    seen: Dict[int, int] = {}
+    for step in itertools.count() if max_steps is None else range(max_steps):
+        state = hash(application)
+        if state in seen:
+            return Cycle(start=seen[state], length=step - seen[state])
+        seen[state] = step
+
+        for value in application.resume(quantum=1):
+            application.stdout.put(value)
+        if application.halted or application.waiting_for_input():
+            return None
+
+    return None
@@ -0,0 +1,73 @@
+"""
+Program images in shared memory for running IntCode applications in worker processes.
+
+Instead of pickling the program for every task sent to a process pool, the parent process places
+the program in shared memory once with `share_program` and only sends the small `ProgramImage`
+reference along with each task. Workers attach to the image once per process and get a
+copy-on-write `PagedMemory` on top of it for every application they run with `load_program`.
+
+A worker stays attached to an image until it calls `close_program`, which it should do once it no
+longer uses any memory loaded from the image; otherwise, a long-lived worker keeps a mapping of
+every image it has seen, even after the parent process removed them.
+"""
+from __future__ import annotations
+
+import array
+import contextlib
+import logging
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, NamedTuple
+
+from .memory import PAGE_SIZE, PagedMemory
+
+log = logging.getLogger(__name__)
+
+# The shared memory blocks this process is attached to, by name
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+class ProgramImage(NamedTuple):
+    """A reference to a program in shared memory that is cheap to send to other processes."""
+
+    name: str
+    length: int
+
+    @property
+    def padded_length(self) -> int:
+        """The length of the image, which is padded with zeros to a whole number of pages."""
+        return -(-self.length // PAGE_SIZE) * PAGE_SIZE
+
+
+@contextlib.contextmanager
+def share_program(program: List[int]) -> Iterator[ProgramImage]:
+    """Place `program` in shared memory for as long as the context lasts; it must fit in int64."""
+    image = ProgramImage(name="", length=len(program))
+    block = shared_memory.SharedMemory(create=True, size=8 * max(image.padded_length, PAGE_SIZE))
+    image = image._replace(name=block.name)
+
+    try:
+        with block.buf.cast("q") as words:
+            words[:len(program)] = array.array("q", program)
+
+        log.debug(f"Shared a program of {len(program)} words as {block.name}")
+        yield image
+    finally:
+        block.close()
+        block.unlink()
+
+
+def load_program(image: ProgramImage) -> PagedMemory:
+    """Return copy-on-write memory backed by `image`, attaching to it if this is the first time."""
+    try:
+        block = _attached[image.name]
+    except KeyError:
+        block = _attached[image.name] = shared_memory.SharedMemory(name=image.name)
+
+    return PagedMemory.from_buffer(block.buf.cast("q")[:image.padded_length])
+
+
+def close_program(image: ProgramImage) -> None:
+    """Detach this process from `image`; memory loaded from it must no longer be in use."""
+    block = _attached.pop(image.name, None)
+    if block is not None:
+        block.close()
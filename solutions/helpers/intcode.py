@@ -1,29 +1,88 @@
 from __future__ import annotations
 
-import collections
+import copy
 import functools
+import itertools
 import logging
 import operator
 import queue
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .channel import Channel
+from .memory import PagedMemory
 
 log = logging.getLogger(__name__)
 
+# Parameter modes
+POSITION = 0
+IMMEDIATE = 1
+RELATIVE = 2
+
+INPUT = 3
+OUTPUT = 4
+HALT = 99
+
+# The I/O channels of an application; `queue.SimpleQueue` is the default, and single-threaded hosts
+# can use a `Channel` for bulk reads and writes
+Queue = Union[Channel, queue.SimpleQueue]
+
+
+class Instruction(NamedTuple):
+    """A decoded instruction: the operation code and the modes of its three parameters."""
+
+    operation: int
+    modes: Tuple[int, int, int]
+
+
+def decode_opcode(opcode: int) -> Instruction:
+    """Split an opcode into its operation and parameter modes using integer arithmetic."""
+    return Instruction(
+        operation=opcode % 100,
+        modes=(opcode // 100 % 10, opcode // 1000 % 10, opcode // 10000 % 10),
+    )
+
+
+class Snapshot(NamedTuple):
+    """The state of an IntCodeApplication, including the values waiting in its I/O queues."""
+
+    memory: Union[Tuple[int, ...], PagedMemory]
+    pointer: int
+    relative_base: int
+    halted: bool
+    stdin: Tuple[int, ...]
+    stdout: Tuple[int, ...]
+
+
+def pending(channel: Queue) -> Tuple[int, ...]:
+    """Return the values waiting in `channel` without removing them."""
+    if isinstance(channel, Channel):
+        return tuple(channel)
+
+    values = []
+    while not channel.empty():
+        values.append(channel.get_nowait())
+    for value in values:
+        channel.put_nowait(value)
+    return tuple(values)
+
 
 class IntCodeApplication:
     """A class for representing my ship's internal terminal system."""
 
     def __init__(
         self,
-        application: List[int],
-        stdin: Optional[queue.SimpleQueue[int]] = None,
-        stdout: Optional[queue.SimpleQueue[int]] = None,
+        application: Union[List[int], PagedMemory],
+        stdin: Optional[Queue] = None,
+        stdout: Optional[Queue] = None,
         name: str = "",
         flexible_memory: bool = False,
     ) -> None:
-        if flexible_memory:
-            # Use a defaultdict if we need an extendable application memory
-            self.application = collections.defaultdict(int, enumerate(application))
+        if isinstance(application, PagedMemory):
+            # Use memory prepared by the caller as is, like a copy-on-write view on a shared image
+            self.application = application
+        elif flexible_memory:
+            # Use paged memory if we need an extendable application memory
+            self.application = PagedMemory(application)
         else:
             # Otherwise, use a simple list
             self.application = list(application)
@@ -34,27 +93,39 @@ class IntCodeApplication:
 
         self._pointer: int = 0
         self.relative_base = 0
+        self.halted = False
 
-        self.operations = {
-            "01": self.addition,
-            "02": self.multiplication,
-            "03": self.get_input,
-            "04": self.put_output,
-            "05": self.jump_true,
-            "06": self.jump_false,
-            "07": self.logical_lt,
-            "08": self.logical_eq,
-            "09": self.change_relative_base,
+        # Cache of decoded instructions by address; `write` drops entries it overwrites.
+        self._instructions: Dict[int, Instruction] = {}
+        self.operations = self._bind_operations()
+
+    def _bind_operations(self) -> Dict[int, Callable]:
+        """Map each operation to the method of this application that executes it."""
+        return {
+            1: self.addition,
+            2: self.multiplication,
+            3: self.get_input,
+            4: self.put_output,
+            5: self.jump_true,
+            6: self.jump_false,
+            7: self.logical_lt,
+            8: self.logical_eq,
+            9: self.change_relative_base,
         }
 
-    def __next__(self) -> int:
-        """Get the next operation code and increment the application pointer."""
-        operation = self.application[self.pointer]
-        if operation == 99:
+    def _reset_caches(self) -> None:
+        """Give the application caches of its own, as a copy made by `fork` shares them."""
+        self._instructions = {}
+        self.operations = self._bind_operations()
+
+    def __next__(self) -> Instruction:
+        """Get the next decoded instruction and increment the application pointer."""
+        instruction = self.decode(self._pointer)
+        if instruction.operation == HALT:
             raise StopIteration
 
-        self.pointer += 1
-        return operation
+        self._pointer += 1
+        return instruction
 
     def __iter__(self) -> IntCodeApplication:
         """Return `self` as System implements the iterator protocol."""
@@ -64,33 +135,161 @@ class IntCodeApplication:
         """Create a hash of the entire state of the application."""
         return hash(tuple(self.application))
 
-    def process_opcode(self, opcode: int) -> Tuple[str, str]:
-        """Process the opcode by padding it with zeros and returning the modes and instruction."""
-        opcode = f"{opcode:0>5}"
-        return opcode[-2:], opcode[:-2]
+    def decode(self, address: int) -> Instruction:
+        """Decode the instruction at `address`, using the cached decoding if there is one."""
+        try:
+            return self._instructions[address]
+        except KeyError:
+            instruction = self._instructions[address] = decode_opcode(self.application[address])
+            return instruction
 
     def run(self) -> None:
-        """Run the IntCodeApplication until it halts."""
-        for opcode in self:
-            operation, modes = self.process_opcode(opcode)
-            self.operations[operation](modes=modes)
+        """Run the IntCodeApplication until it halts, waiting for input on `self.stdin`."""
+        if isinstance(self.stdout, Channel):
+            self.stdout.write_many(self.resume(blocking=True))
+            return
+
+        for value in self.resume(blocking=True):
+            self.stdout.put(value)
+
+    def resume(self, blocking: bool = False, quantum: Optional[int] = None) -> Iterator[int]:
+        """
+        Run the IntCodeApplication, yielding its outputs, until it halts or runs out of input.
+
+        Unless `blocking` is set, the application suspends at the first input instruction it
+        encounters while `self.stdin` is empty. This allows a host to drive one or more
+        applications from a single thread: put the next input in `stdin` and call `resume` again
+        until `self.halted` is set. If a `quantum` is given, the application also suspends after
+        executing that many instructions.
+        """
+        operations = self.operations
+        stdin = self.stdin
+        instructions = self if quantum is None else itertools.islice(self, quantum)
+
+        for operation, modes in instructions:
+            if operation == OUTPUT:
+                yield self.read(modes[0])
+            elif operation == INPUT and not blocking:
+                if stdin.empty():
+                    self._pointer -= 1
+                    return
+                self.write(modes[0], stdin.get_nowait())
+            else:
+                operations[operation](modes=modes)
+
+        if quantum is None or self.decode(self._pointer).operation == HALT:
+            self.halted = True
+
+    def waiting_for_input(self) -> bool:
+        """Return whether the application is suspended on an input instruction with no input."""
+        return self.stdin.empty() and self.decode(self._pointer).operation == INPUT
+
+    async def run_async(self) -> None:
+        """
+        Run the IntCodeApplication as a coroutine until it halts.
+
+        The application awaits input from `self.stdin` and awaits putting its output on
+        `self.stdout`, so both need to be `asyncio.Queue`-compatible. Since the application only
+        yields to the event loop when it waits for I/O, any number of them can be run concurrently
+        on a single event loop.
+        """
+        while True:
+            for value in self.resume():
+                await self.stdout.put(value)
+
+            if self.halted:
+                return
+
+            self.provide_input(await self.stdin.get())
+
+    def provide_input(self, value: int) -> None:
+        """Execute the input instruction the application is suspended on using `value`."""
+        operation, modes = decode_opcode(self.application[self._pointer])
+        if operation != INPUT:
+            raise RuntimeError(f"{self.name} is not waiting for input at {self._pointer}.")
+
+        self._pointer += 1
+        self.write(modes[0], value)
+
+    def snapshot(self) -> Snapshot:
+        """
+        Capture the current state of the application.
+
+        Paged memory is captured as a copy-on-write copy, so this costs O(pages) and the pages are
+        only copied when the application, or one restored from the snapshot, writes to them. A
+        fixed-size memory is copied in full.
+        """
+        if isinstance(self.application, PagedMemory):
+            memory = self.application.copy()
+        else:
+            memory = tuple(self.application)
+
+        return Snapshot(
+            memory=memory,
+            pointer=self._pointer,
+            relative_base=self.relative_base,
+            halted=self.halted,
+            stdin=pending(self.stdin),
+            stdout=pending(self.stdout),
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Return the application to the state in `snapshot`, which can be restored again later."""
+        if isinstance(snapshot.memory, PagedMemory):
+            self.application = snapshot.memory.copy()
+        else:
+            self.application = list(snapshot.memory)
+
+        self._pointer = snapshot.pointer
+        self.relative_base = snapshot.relative_base
+        self.halted = snapshot.halted
+        self._instructions.clear()
+
+        for channel, values in ((self.stdin, snapshot.stdin), (self.stdout, snapshot.stdout)):
+            while not channel.empty():
+                channel.get_nowait()
+            for value in values:
+                channel.put_nowait(value)
+
+    def fork(self) -> IntCodeApplication:
+        """
+        Create an independent copy of the application in its current state, with its own I/O.
+
+        The copy is made without calling the constructor, so it keeps the configuration of
+        subclasses, like the variables of a symbolic application. A profile attached to the
+        application is not attached to the copy.
+        """
+        application = copy.copy(self)
+        application.__dict__.pop("resume", None)
+        application.stdin = type(self.stdin)()
+        application.stdout = type(self.stdout)()
+        application._reset_caches()
+        application.restore(self.snapshot())
+        return application
+
+    def parameter(self) -> int:
+        """Get the raw value of the next parameter and increment the application pointer."""
+        value = self.application[self._pointer]
+        self._pointer += 1
+        return value
 
-    def read(self, mode: str) -> int:
+    def read(self, mode: int) -> int:
         """Get the application code based on the mode of the get operation."""
-        if mode == "0":
-            return self.application[next(self)]
+        if mode == POSITION:
+            return self.application[self.parameter()]
 
-        if mode == "2":
-            return self.application[self.relative_base + next(self)]
+        if mode == RELATIVE:
+            return self.application[self.relative_base + self.parameter()]
 
-        return next(self)
+        return self.parameter()
 
-    def write(self, mode: str, value: int) -> None:
+    def write(self, mode: int, value: int) -> None:
         """Write `value` to the application's memory, taking relative pointers into account."""
-        pointer = next(self)
-        if mode == "2":
+        pointer = self.parameter()
+        if mode == RELATIVE:
             pointer += self.relative_base
         self.application[pointer] = value
+        self._instructions.pop(pointer, None)
 
     @property
     def pointer(self) -> int:
@@ -104,37 +303,37 @@ class IntCodeApplication:
             raise IndexError(f"The application pointer {new_pointer} cannot be negative.")
         self._pointer = new_pointer
 
-    def math_operation(self, modes: str, operation: Callable) -> None:
+    def math_operation(self, modes: Tuple[int, int, int], operation: Callable) -> None:
         """Perform a mathematical operation that mutates the `self`'s application state."""
-        a = self.read(modes[-1])
-        b = self.read(modes[-2])
-        self.write(modes[-3], operation(a, b))
+        a = self.read(modes[0])
+        b = self.read(modes[1])
+        self.write(modes[2], operation(a, b))
 
-    def jump_operation(self, modes: str, operation: Callable) -> None:
+    def jump_operation(self, modes: Tuple[int, int, int], operation: Callable) -> None:
         """Jump to another point in the `self`'s application if a certain condition holds."""
-        if operation(self.read(modes[-1]), 0):
-            self.pointer = self.read(modes[-2])
+        if operation(self.read(modes[0]), 0):
+            self.pointer = self.read(modes[1])
         else:
-            next(self)
+            self._pointer += 1
 
-    def logic_operation(self, modes: str, operation: Callable) -> None:
+    def logic_operation(self, modes: Tuple[int, int, int], operation: Callable) -> None:
         """Store the result of a logical comparison at a certain location in the application."""
-        if operation(self.read(modes[-1]), self.read(modes[-2])):
-            self.write(modes[-3], 1)
+        if operation(self.read(modes[0]), self.read(modes[1])):
+            self.write(modes[2], 1)
         else:
-            self.write(modes[-3], 0)
+            self.write(modes[2], 0)
 
-    def get_input(self, modes: str) -> None:
-        """Read a value from `self.stdin`."""
-        self.write(modes[-1], self.stdin.get())
+    def get_input(self, modes: Tuple[int, int, int]) -> None:
+        """Read a value from `self.stdin`, waiting for one if it's empty."""
+        self.write(modes[0], self.stdin.get())
 
-    def put_output(self, modes: str) -> None:
+    def put_output(self, modes: Tuple[int, int, int]) -> None:
         """Write a value to `self.stdout`."""
-        self.stdout.put(self.read(modes[-1]))
+        self.stdout.put(self.read(modes[0]))
 
-    def change_relative_base(self, modes: str) -> None:
+    def change_relative_base(self, modes: Tuple[int, int, int]) -> None:
         """Change the base of the relative pointers."""
-        self.relative_base += self.read(modes[-1])
+        self.relative_base += self.read(modes[0])
 
     addition = functools.partialmethod(math_operation, operation=operator.add)
     multiplication = functools.partialmethod(math_operation, operation=operator.mul)
@@ -0,0 +1,162 @@
+"""
+Compact, extendable memory for IntCode applications.
+
+Memory is split into fixed-size pages of signed 64-bit integers that are only allocated when they
+are first touched; reading from a page that was never touched returns `0`. A page that has to hold
+a value that does not fit in 64 bits is promoted to a list of Python ints.
+
+Memory can also be backed by a read-only buffer, like a program image in shared memory. Its pages
+are then views on that buffer that are only copied to a private page when they are first written to.
+Copies of memory work the same way: both copies share read-only versions of the pages until they
+write to them.
+
+The pages are kept in a dict keyed by page number, so that `pages[address >> PAGE_BITS]` raises a
+`KeyError` both for pages that were never touched and for negative addresses. That allows fast paths
+to index the pages directly and fall back to the methods below when that fails.
+"""
+from __future__ import annotations
+
+import array
+import itertools
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+PAGE_BITS = 10
+PAGE_SIZE = 1 << PAGE_BITS
+PAGE_MASK = PAGE_SIZE - 1
+
+Page = Union[array.array, List[int], memoryview, Tuple[int, ...]]
+
+
+class PagedMemory:
+    """An extendable application memory made up of lazily allocated int64 pages."""
+
+    __slots__ = ("pages",)
+
+    def __init__(self, application: Iterable[int] = ()) -> None:
+        self.pages: Dict[int, Page] = {}
+
+        application = iter(application)
+        chunks = iter(lambda: list(itertools.islice(application, PAGE_SIZE)), [])
+        for index, chunk in enumerate(chunks):
+            chunk.extend([0] * (PAGE_SIZE - len(chunk)))
+            try:
+                self.pages[index] = array.array("q", chunk)
+            except OverflowError:
+                self.pages[index] = chunk
+
+    @classmethod
+    def from_buffer(cls, buffer: memoryview) -> PagedMemory:
+        """Create memory backed by the int64 `buffer`, copying each page on its first write."""
+        if len(buffer) % PAGE_SIZE:
+            raise ValueError(f"The length of the buffer must be a multiple of {PAGE_SIZE}.")
+
+        memory = cls()
+        buffer = buffer.toreadonly()
+        for index in range(len(buffer) >> PAGE_BITS):
+            memory.pages[index] = buffer[index << PAGE_BITS:(index + 1) << PAGE_BITS]
+        return memory
+
+    def __getitem__(self, address: int) -> int:
+        """Get the value at `address`; addresses in pages that were never touched hold `0`."""
+        try:
+            return self.pages[address >> PAGE_BITS][address & PAGE_MASK]
+        except KeyError:
+            if address < 0:
+                raise IndexError(f"The memory address {address} cannot be negative.")
+            return 0
+
+    def __setitem__(self, address: int, value: int) -> None:
+        """Set the value at `address`, allocating, copying or promoting its page when necessary."""
+        page = self.touch(address)
+        try:
+            page[address & PAGE_MASK] = value
+        except TypeError:
+            # The page is shared read-only with a buffer or another copy: make a private copy
+            if isinstance(page, memoryview):
+                self.pages[address >> PAGE_BITS] = array.array("q", page.tobytes())
+            else:
+                self.pages[address >> PAGE_BITS] = list(page)
+            self[address] = value
+        except OverflowError:
+            self.pages[address >> PAGE_BITS] = page = page.tolist()
+            page[address & PAGE_MASK] = value
+
+    def __len__(self) -> int:
+        """Return the number of cells up to the end of the highest page allocated so far."""
+        return (max(self.pages) + 1) * PAGE_SIZE if self.pages else 0
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the values in memory, from address `0` up to `len(self)`."""
+        for index in range(len(self) >> PAGE_BITS):
+            yield from self.pages.get(index, itertools.repeat(0, PAGE_SIZE))
+
+    def __repr__(self) -> str:
+        """Return a developer-friendly representation of the memory."""
+        return f"{self.__class__.__name__}(pages={sorted(self.pages)})"
+
+    def copy(self) -> PagedMemory:
+        """Return a copy-on-write copy of this memory, sharing its pages until they are written."""
+        for index, page in self.pages.items():
+            if isinstance(page, array.array):
+                self.pages[index] = memoryview(page).toreadonly()
+            elif isinstance(page, list):
+                self.pages[index] = tuple(page)
+
+        memory = PagedMemory()
+        memory.pages = dict(self.pages)
+        return memory
+
+    def touch(self, address: int) -> Page:
+        """Return the page containing `address`, allocating it if it does not exist yet."""
+        if address < 0:
+            raise IndexError(f"The memory address {address} cannot be negative.")
+
+        try:
+            return self.pages[address >> PAGE_BITS]
+        except KeyError:
+            page = self.pages[address >> PAGE_BITS] = array.array("q", bytes(8 * PAGE_SIZE))
+            return page
+
+
+class BoundedMemory(PagedMemory):
+    """A fixed-size memory in int64 pages that raises `IndexError` outside of its bounds."""
+
+    __slots__ = ("size",)
+
+    def __init__(self, application: Iterable[int] = ()) -> None:
+        application = list(application)
+        super().__init__(application)
+        self.size = len(application)
+
+        # Shorten the last page, so that direct indexing of the pages fails past the end as well
+        if self.size & PAGE_MASK:
+            last = self.size >> PAGE_BITS
+            self.pages[last] = self.pages[last][:self.size & PAGE_MASK]
+
+    def __getitem__(self, address: int) -> int:
+        """Get the value at `address`, which has to be within the bounds of the memory."""
+        if not 0 <= address < self.size:
+            raise IndexError(f"The memory address {address} is out of bounds.")
+        return super().__getitem__(address)
+
+    def __len__(self) -> int:
+        """Return the size of the memory."""
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the values in memory."""
+        for index in range(len(self.pages)):
+            yield from self.pages[index]
+
+    def copy(self) -> BoundedMemory:
+        """Return a copy-on-write copy of this memory, sharing its pages until they are written."""
+        memory = BoundedMemory()
+        memory.pages = super().copy().pages
+        memory.size = self.size
+        return memory
+
+    def touch(self, address: int) -> Page:
+        """Return the page containing `address`, which has to be within the bounds of the memory."""
+        if not 0 <= address < self.size:
+            raise IndexError(f"The memory address {address} is out of bounds.")
+        return super().touch(address)
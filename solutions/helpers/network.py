@@ -0,0 +1,154 @@
+"""
+A packet-switched network of IntCode applications.
+
+Every node of the network is an IntCode application with an address, which it receives as its
+first input. Everything a node outputs is framed into `(destination, x, y)` packets. Packets are
+delivered in batches between the rounds of the scheduler that runs the nodes: the `x` and `y` of a
+packet are put in the `stdin` of the destination node, or handed to the monitor registered for its
+address. A monitor, like the `NAT`, can observe traffic to addresses without a node.
+
+The network is idle when no packets are in flight and every node is waiting for input. By default,
+a node waiting for input is parked until a packet arrives. If `empty_input` is set, nodes instead
+receive that value whenever they read from an empty queue, and the network is considered idle once
+a full round passes in which all nodes only polled their empty queues.
+"""
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from .intcode import IntCodeApplication
+from .scheduler import Scheduler
+
+log = logging.getLogger(__name__)
+
+
+class Packet(NamedTuple):
+    """A packet with a destination address and a payload of two values."""
+
+    destination: int
+    x: int
+    y: int
+
+
+Monitor = Callable[[Packet], None]
+
+
+class Network:
+    """A network of IntCode applications that send each other packets."""
+
+    def __init__(self, quantum: int = 1000, empty_input: Optional[int] = None) -> None:
+        self.scheduler = Scheduler(quantum=quantum)
+        self.empty_input = empty_input
+        self.nodes: Dict[int, IntCodeApplication] = {}
+        self.monitors: Dict[int, Monitor] = {}
+        self.in_flight: List[Packet] = []
+        self.delivered = 0
+        self.running = False
+
+    def add_node(self, application: IntCodeApplication, address: Optional[int] = None) -> int:
+        """Connect `application` to the network at `address`, or the next free one; return it."""
+        if address is None:
+            address = len(self.nodes)
+        if address in self.nodes or address in self.monitors:
+            raise ValueError(f"The network address {address} is already in use.")
+
+        self.nodes[address] = application
+        application.stdin.put(address)
+        self.scheduler.add(application, output=functools.partial(self._frame, []))
+        return address
+
+    def add_monitor(self, address: int, monitor: Monitor) -> None:
+        """Hand all packets sent to `address` to `monitor` instead of a node."""
+        if address in self.nodes or address in self.monitors:
+            raise ValueError(f"The network address {address} is already in use.")
+        self.monitors[address] = monitor
+
+    def _frame(self, frame: List[int], value: int) -> None:
+        """Collect the outputs of a node in `frame` and send them as a packet once complete."""
+        frame.append(value)
+        if len(frame) == 3:
+            self.send(Packet(*frame))
+            frame.clear()
+
+    def send(self, packet: Packet) -> None:
+        """Send `packet`; it will be delivered before the next round of the network."""
+        self.in_flight.append(packet)
+
+    def deliver(self) -> int:
+        """Deliver all packets in flight and return the number of packets delivered."""
+        packets, self.in_flight = self.in_flight, []
+        for packet in packets:
+            if packet.destination in self.nodes:
+                stdin = self.nodes[packet.destination].stdin
+                stdin.put(packet.x)
+                stdin.put(packet.y)
+            elif packet.destination in self.monitors:
+                self.monitors[packet.destination](packet)
+            else:
+                log.warning(f"Dropped a packet for unknown address {packet.destination}: {packet}")
+
+        self.delivered += len(packets)
+        return len(packets)
+
+    def stop(self) -> None:
+        """Stop the network after the current round, e.g. from within a monitor."""
+        self.running = False
+
+    def run(self, on_idle: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Run the network until all nodes have halted, it is stopped, or it is idle.
+
+        When the network is idle, `on_idle` is called; the network keeps running if it returns
+        `True` to indicate that it sent packets to wake the network up.
+        """
+        scheduler = self.scheduler
+        quiet_rounds = 0
+        self.running = True
+
+        while self.running and (scheduler.ready or scheduler.parked):
+            quiet_rounds = 0 if self.deliver() else quiet_rounds + 1
+            scheduler.unpark()
+
+            if not scheduler.ready and (self.empty_input is None or quiet_rounds > 1):
+                log.debug(f"The network is idle after delivering {self.delivered} packets")
+                if on_idle is None or not on_idle():
+                    break
+                continue
+
+            if self.empty_input is not None:
+                for application in scheduler.parked:
+                    application.stdin.put(self.empty_input)
+                scheduler.unpark()
+
+            for _ in range(len(scheduler.ready)):
+                scheduler.run_slice(scheduler.ready.popleft())
+
+        self.running = False
+
+
+class NAT:
+    """A monitor that remembers the last packet sent to it and wakes the idle network with it."""
+
+    def __init__(self, network: Network, address: int = 255, wake_address: int = 0) -> None:
+        self.network = network
+        self.wake_address = wake_address
+        self.packet: Optional[Packet] = None
+        # The packets the NAT sent to wake the network, in order
+        self.sent: List[Packet] = []
+        network.add_monitor(address, self.receive)
+
+    def receive(self, packet: Packet) -> None:
+        """Remember `packet` as the packet to wake the network with."""
+        self.packet = packet
+
+    def wake(self) -> bool:
+        """Send the last packet received to the wake address, if there is one."""
+        if self.packet is None:
+            return False
+
+        packet = self.packet._replace(destination=self.wake_address)
+        self.network.send(packet)
+        self.sent.append(packet)
+        return True
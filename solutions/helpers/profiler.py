@@ -0,0 +1,112 @@
+"""
+An opt-in execution profiler for IntCode applications.
+
+Attaching a `Profile` to an application replaces the application's `resume` method by an
+instrumented copy of the interpreter loop, so applications without a profile run the normal loop
+without any extra checks. The instrumented loop always interprets instructions one at a time, so an
+application on the compiled engine is profiled as if it ran on the reference engine.
+
+One profile can be attached to many applications to collect the combined statistics of all of them.
+"""
+from __future__ import annotations
+
+import collections
+import functools
+import itertools
+import json
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .intcode import HALT, INPUT, IntCodeApplication, OUTPUT
+
+# The jump instructions and their length, used to tell taken and not-taken branches apart
+JUMPS = {5: 3, 6: 3}
+
+
+class Profile:
+    """Execution statistics of one or more IntCode applications."""
+
+    def __init__(self, trace_size: int = 256) -> None:
+        self.opcodes: collections.Counter[int] = collections.Counter()
+        self.addresses: collections.Counter[int] = collections.Counter()
+        # The number of times each jump instruction was [not taken, taken]
+        self.branches: Dict[int, List[int]] = collections.defaultdict(lambda: [0, 0])
+        # The most recently executed instructions as (address, operation) pairs
+        self.trace: Deque[Tuple[int, int]] = collections.deque(maxlen=trace_size)
+
+    @property
+    def instructions(self) -> int:
+        """The total number of instructions executed."""
+        return sum(self.opcodes.values())
+
+    def attach(self, application: IntCodeApplication) -> None:
+        """Start profiling `application` by swapping in the instrumented interpreter loop."""
+        application.resume = functools.partial(self.resume, application)
+
+    @staticmethod
+    def detach(application: IntCodeApplication) -> None:
+        """Stop profiling `application` by restoring its own interpreter loop."""
+        application.__dict__.pop("resume", None)
+
+    def resume(
+        self, application: IntCodeApplication, blocking: bool = False, quantum: Optional[int] = None
+    ) -> Iterator[int]:
+        """Run `application` like `IntCodeApplication.resume`, recording every instruction."""
+        operations = application.operations
+        stdin = application.stdin
+        opcodes = self.opcodes
+        addresses = self.addresses
+        branches = self.branches
+        trace = self.trace
+        instructions = application if quantum is None else itertools.islice(application, quantum)
+
+        for operation, modes in instructions:
+            address = application.pointer - 1
+            if operation == INPUT and not blocking and stdin.empty():
+                application.pointer = address
+                return
+
+            opcodes[operation] += 1
+            addresses[address] += 1
+            trace.append((address, operation))
+
+            if operation == OUTPUT:
+                yield application.read(modes[0])
+            elif operation == INPUT and not blocking:
+                application.write(modes[0], stdin.get_nowait())
+            else:
+                operations[operation](modes=modes)
+                if operation in JUMPS:
+                    # A jump to the next instruction is counted as not taken; it makes no difference
+                    branches[address][application.pointer != address + JUMPS[operation]] += 1
+
+        if quantum is None or application.decode(application.pointer).operation == HALT:
+            application.halted = True
+
+    def hot_addresses(self, number: int = 10) -> List[Tuple[int, int]]:
+        """Return the `number` most executed addresses with their execution counts."""
+        return self.addresses.most_common(number)
+
+    def branch_ratios(self) -> Dict[int, float]:
+        """Return the fraction of executions in which each jump instruction was taken."""
+        return {
+            address: taken / (not_taken + taken)
+            for address, (not_taken, taken) in sorted(self.branches.items())
+        }
+
+    def to_dict(self, hot_addresses: int = 25) -> Dict[str, Any]:
+        """Return the profile as a JSON-serializable dictionary."""
+        ratios = self.branch_ratios()
+        return {
+            "instructions": self.instructions,
+            "opcodes": {str(operation): count for operation, count in sorted(self.opcodes.items())},
+            "hot_addresses": self.hot_addresses(hot_addresses),
+            "branches": {
+                str(address): {"not_taken": not_taken, "taken": taken, "ratio": ratios[address]}
+                for address, (not_taken, taken) in sorted(self.branches.items())
+            },
+            "trace": list(self.trace),
+        }
+
+    def to_json(self, hot_addresses: int = 25, **kwargs: Any) -> str:
+        """Export the profile as JSON; keyword arguments are passed on to `json.dumps`."""
+        return json.dumps(self.to_dict(hot_addresses), **kwargs)
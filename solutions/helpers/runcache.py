@@ -0,0 +1,179 @@
+"""
+A cache of the outputs of IntCode programs that run to completion on a fixed sequence of inputs.
+
+An IntCode program that gets all of its input up front is deterministic: the same program with the
+same inputs always produces the same outputs. Days that run such programs, like the diagnostics of
+day 5 and the BOOST program of day 9, use `run_to_completion`, which looks the outputs up in a
+`RunCache` by a hash of the program and its inputs before running anything.
+
+The cache is opt-in, as it is only useful when the same runs are repeated, like in the `--timeit`
+iterations of the command line interface. It's enabled with the `--run-cache` option or by setting
+the `AOC_INTCODE_RUN_CACHE` environment variable. It has two tiers:
+
+- an in-process LRU cache of a bounded number of runs;
+- a directory of JSON files under `solutions/data/runs`, bounded in total size, that evicts the
+  files that were used least recently first.
+"""
+from __future__ import annotations
+
+import collections
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .channel import Channel
+from .engines import create_application
+
+log = logging.getLogger(__name__)
+
+ENVIRONMENT_VARIABLE = "AOC_INTCODE_RUN_CACHE"
+CACHE_DIRECTORY = pathlib.Path(__file__).parents[1] / "data" / "runs"
+
+# Changing the key format or the way runs are executed invalidates all entries on disk
+CACHE_VERSION = 1
+
+
+def run_key(program: Sequence[int], inputs: Sequence[int]) -> str:
+    """Return the key of running `program` on `inputs`: a hash of both."""
+    description = f"{CACHE_VERSION}|{','.join(map(str, program))}|{','.join(map(str, inputs))}"
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class RunCache:
+    """A two-tier cache of the outputs of IntCode runs, by key."""
+
+    def __init__(
+        self,
+        directory: Optional[pathlib.Path] = CACHE_DIRECTORY,
+        max_entries: int = 128,
+        max_bytes: int = 1 << 20,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.entries: collections.OrderedDict[str, Tuple[int, ...]] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[int, ...]]:
+        """Return the outputs cached under `key`, or `None` if they're in neither tier."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.directory is not None:
+            path = self.directory / f"{key}.json"
+            try:
+                outputs = tuple(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                pass
+            else:
+                # Mark the file as recently used so it's evicted last, unless another process
+                # evicted it in the meantime
+                with contextlib.suppress(FileNotFoundError):
+                    os.utime(path)
+                self._remember(key, outputs)
+                self.hits += 1
+                return outputs
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, outputs: Iterable[int]) -> None:
+        """Cache `outputs` under `key` in both tiers."""
+        outputs = tuple(outputs)
+        self._remember(key, outputs)
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Other processes may write the same run at the same time, so each uses its own file
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.directory, suffix=".tmp", delete=False
+            ) as temporary:
+                temporary.write(json.dumps(outputs))
+            os.replace(temporary.name, self.directory / f"{key}.json")
+            self.evict_files()
+
+    def evict_files(self) -> None:
+        """Delete the least recently used files until the directory fits in `max_bytes`."""
+        files = []
+        for path in self.directory.glob("*.json"):
+            # Another process sharing the directory may have evicted the file already
+            with contextlib.suppress(FileNotFoundError):
+                files.append((path.stat(), path))
+
+        total = sum(stat.st_size for stat, _ in files)
+        for stat, path in sorted(files, key=lambda file: file[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            log.debug(f"Evicting the cached run {path.stem}")
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def clear(self) -> None:
+        """Remove all cached runs from both tiers."""
+        self.entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, outputs: Tuple[int, ...]) -> None:
+        """Add `outputs` to the in-process tier, evicting the least recently used run if full."""
+        self.entries[key] = outputs
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+_run_cache: Optional[RunCache] = None
+
+
+def enable_run_cache() -> None:
+    """Enable the run cache in this process and in processes started afterwards."""
+    os.environ[ENVIRONMENT_VARIABLE] = "1"
+
+
+def get_run_cache() -> Optional[RunCache]:
+    """Return the run cache of this process, or `None` if the run cache is not enabled."""
+    global _run_cache
+
+    if not os.environ.get(ENVIRONMENT_VARIABLE):
+        return None
+    if _run_cache is None:
+        _run_cache = RunCache()
+    return _run_cache
+
+
+def run_to_completion(
+    program: Sequence[int],
+    inputs: Sequence[int] = (),
+    cache: Optional[RunCache] = None,
+    **kwargs: Any,
+) -> List[int]:
+    """
+    Run `program` with `inputs` until it halts and return all of its outputs.
+
+    The outputs are looked up in `cache`, or in the run cache of this process if it is enabled,
+    before running the program. The keyword arguments are passed on to `create_application`.
+    """
+    cache = cache if cache is not None else get_run_cache()
+    key = run_key(program, inputs) if cache is not None else None
+    if cache is not None and (outputs := cache.get(key)) is not None:
+        log.debug(f"Using the cached outputs of run {key[:12]}")
+        return list(outputs)
+
+    application = create_application(program, stdin=Channel(inputs), **kwargs)
+    outputs = list(application.resume())
+    if not application.halted:
+        raise RuntimeError(f"{application.name or 'The program'} needs more input than {inputs}.")
+
+    if cache is not None:
+        cache.put(key, outputs)
+    return outputs
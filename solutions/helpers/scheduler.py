@@ -0,0 +1,87 @@
+"""
+A cooperative scheduler for running many IntCode applications on a single thread.
+
+The applications are run round-robin, each for at most a quantum of instructions at a time. An
+application that is waiting for input while its `stdin` is empty is parked and only scheduled
+again once input has arrived. When all applications that have not halted are parked, nothing can
+make progress anymore: the scheduler then gives its `on_idle` hook a chance to provide input and
+raises a `DeadlockError` if that does not happen.
+"""
+from __future__ import annotations
+
+import collections
+import logging
+from typing import Callable, Deque, Dict, List, Optional
+
+from .intcode import IntCodeApplication
+
+log = logging.getLogger(__name__)
+
+OutputHandler = Callable[[int], None]
+
+
+class DeadlockError(RuntimeError):
+    """This exception is raised when all applications are waiting for input that will never come."""
+    pass
+
+
+class Scheduler:
+    """Run IntCode applications round-robin in time slices of `quantum` instructions."""
+
+    def __init__(self, quantum: int = 1000) -> None:
+        self.quantum = quantum
+        self.ready: Deque[IntCodeApplication] = collections.deque()
+        self.parked: List[IntCodeApplication] = []
+        self.applications: List[IntCodeApplication] = []
+        self._outputs: Dict[int, OutputHandler] = {}
+
+    def add(self, application: IntCodeApplication, output: Optional[OutputHandler] = None) -> None:
+        """Schedule `application`, passing its outputs to `output` or putting them in its stdout."""
+        self.applications.append(application)
+        self._outputs[id(application)] = output if output is not None else application.stdout.put
+        if not application.halted:
+            self.ready.append(application)
+
+    def unpark(self) -> bool:
+        """Move the parked applications that have received input back to the ready queue."""
+        waiting = []
+        for application in self.parked:
+            if application.stdin.empty():
+                waiting.append(application)
+            else:
+                self.ready.append(application)
+
+        unparked = len(waiting) < len(self.parked)
+        self.parked = waiting
+        return unparked
+
+    def run_slice(self, application: IntCodeApplication) -> None:
+        """Run `application` for one quantum and reschedule it unless it halted."""
+        output = self._outputs[id(application)]
+        for value in application.resume(quantum=self.quantum):
+            output(value)
+
+        if application.halted:
+            log.debug(f"{application.name} halted")
+        elif application.waiting_for_input():
+            self.parked.append(application)
+        else:
+            self.ready.append(application)
+
+    def run(self, on_idle: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Run the scheduled applications until they have all halted.
+
+        If every application that has not halted is waiting for input, `on_idle` is called. It
+        should return whether it provided input to any of them; if it did not, or if there is no
+        `on_idle` hook, a `DeadlockError` is raised.
+        """
+        while self.ready or self.parked:
+            if self.unpark() or self.ready:
+                for _ in range(len(self.ready)):
+                    self.run_slice(self.ready.popleft())
+                continue
+
+            if on_idle is None or not on_idle():
+                names = ", ".join(application.name for application in self.parked)
+                raise DeadlockError(f"All applications are waiting for input: {names}")
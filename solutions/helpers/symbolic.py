@@ -0,0 +1,246 @@
+"""
+Symbolic execution of IntCode applications.
+
+Selected memory cells are replaced by variables before the application runs. Additions and
+multiplications then build polynomials in those variables, so the final memory describes the result
+of the application for every possible value of the variables at once. As soon as the execution
+would depend on the value of a variable, because it is used in a comparison, a jump, the opcode of
+an instruction or the address of a write, `SymbolicFallback` is raised so that the caller can fall
+back to a concrete search.
+"""
+from __future__ import annotations
+
+import collections
+import functools
+import itertools
+import operator
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+
+from .intcode import IMMEDIATE, Instruction, IntCodeApplication, RELATIVE
+
+# A monomial is a sorted tuple of (variable, power) pairs; the constant term is the empty tuple
+Monomial = Tuple[Tuple[str, int], ...]
+Value = Union[int, "Polynomial", "Unknown"]
+
+
+class SymbolicFallback(Exception):
+    """This exception is raised when the execution of an application depends on a variable."""
+    pass
+
+
+class Unknown:
+    """A value read from an address that depends on a variable; anything derived from it is too."""
+
+    def __add__(self, other: Value) -> Unknown:
+        """Adding anything to an unknown value results in an unknown value."""
+        return self
+
+    def __repr__(self) -> str:
+        """Return a developer-friendly representation of the unknown value."""
+        return "UNKNOWN"
+
+    __radd__ = __mul__ = __rmul__ = __add__
+
+
+UNKNOWN = Unknown()
+
+
+class Polynomial:
+    """A polynomial with integer coefficients in one or more named variables."""
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: Mapping[Monomial, int]) -> None:
+        self.terms = {powers: coefficient for powers, coefficient in terms.items() if coefficient}
+
+    @classmethod
+    def variable(cls, name: str) -> Polynomial:
+        """Create the polynomial consisting of just the variable `name`."""
+        return cls({((name, 1),): 1})
+
+    @staticmethod
+    def simplify(terms: Mapping[Monomial, int]) -> Union[int, Polynomial]:
+        """Return the polynomial with the given terms, or a plain int if it is a constant."""
+        polynomial = Polynomial(terms)
+        if not polynomial.terms.keys() - {()}:
+            return polynomial.terms.get((), 0)
+        return polynomial
+
+    def __add__(self, other: Value) -> Value:
+        """Add an int or another polynomial to this polynomial."""
+        if isinstance(other, int):
+            other = Polynomial({(): other})
+        elif not isinstance(other, Polynomial):
+            return NotImplemented
+
+        terms = collections.Counter(self.terms)
+        terms.update(other.terms)
+        return self.simplify(terms)
+
+    def __mul__(self, other: Value) -> Value:
+        """Multiply this polynomial by an int or another polynomial."""
+        if isinstance(other, int):
+            other = Polynomial({(): other})
+        elif not isinstance(other, Polynomial):
+            return NotImplemented
+
+        terms = collections.Counter()
+        for (left, a), (right, b) in itertools.product(self.terms.items(), other.terms.items()):
+            powers = collections.Counter(dict(left))
+            powers.update(dict(right))
+            terms[tuple(sorted(powers.items()))] += a * b
+        return self.simplify(terms)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __repr__(self) -> str:
+        """Return a human-readable representation of the polynomial."""
+        def monomial(powers: Monomial) -> str:
+            return "*".join(name if power == 1 else f"{name}**{power}" for name, power in powers)
+
+        return " + ".join(
+            f"{coefficient}" if not powers else
+            monomial(powers) if coefficient == 1 else f"{coefficient}*{monomial(powers)}"
+            for powers, coefficient in sorted(self.terms.items(), key=lambda term: -len(term[0]))
+        )
+
+    @property
+    def variables(self) -> List[str]:
+        """The names of the variables in this polynomial, sorted alphabetically."""
+        return sorted({name for powers in self.terms for name, _ in powers})
+
+    def degree(self, variable: str) -> int:
+        """Return the highest power of `variable` in this polynomial."""
+        return max(dict(powers).get(variable, 0) for powers in self.terms)
+
+    def substitute(self, values: Mapping[str, int]) -> Union[int, Polynomial]:
+        """Substitute the variables in `values` and return the resulting (simplified) polynomial."""
+        terms = collections.Counter()
+        for powers, coefficient in self.terms.items():
+            remaining = []
+            for name, power in powers:
+                if name in values:
+                    coefficient *= values[name] ** power
+                else:
+                    remaining.append((name, power))
+            terms[tuple(remaining)] += coefficient
+        return self.simplify(terms)
+
+
+def solve(
+    expression: Union[int, Polynomial], target: int, domains: Dict[str, Sequence[int]]
+) -> Iterator[Dict[str, int]]:
+    """
+    Yield the assignments of the variables in `domains` for which `expression` equals `target`.
+
+    The assignments are yielded in the order of `itertools.product` over the domains. If the
+    expression is linear in the last variable, that variable is solved for directly instead of
+    being enumerated, turning a search over all combinations into a search over all but one. An
+    `UNKNOWN` expression raises `SymbolicFallback`, as nothing can be said about its solutions.
+    """
+    names = list(domains)
+    if not isinstance(expression, (int, Polynomial)):
+        raise SymbolicFallback(f"The expression {expression} cannot be solved symbolically.")
+    if not isinstance(expression, Polynomial):
+        if expression == target:
+            yield from (dict(zip(names, values)) for values in itertools.product(*domains.values()))
+        return
+
+    if set(expression.variables) - set(names):
+        raise ValueError(f"The expression {expression} has variables without a domain.")
+
+    *enumerated, solved = names
+    if expression.degree(solved) != 1:
+        enumerated, solved = names, None
+
+    for values in itertools.product(*(domains[name] for name in enumerated)):
+        assignment = dict(zip(enumerated, values))
+        remainder = expression.substitute(assignment)
+
+        if solved is None:
+            if remainder == target:
+                yield assignment
+            continue
+
+        # What remains is linear in the solved variable: `constant + slope * solved`
+        if isinstance(remainder, int):
+            constant, slope = remainder, 0
+        else:
+            constant = remainder.substitute({solved: 0})
+            slope = remainder.substitute({solved: 1}) - constant
+
+        if slope == 0:
+            if constant == target:
+                yield from ({**assignment, solved: value} for value in domains[solved])
+        elif (target - constant) % slope == 0 and (target - constant) // slope in domains[solved]:
+            yield {**assignment, solved: (target - constant) // slope}
+
+
+class SymbolicIntCodeApplication(IntCodeApplication):
+    """An IntCodeApplication in which some memory cells hold variables instead of values."""
+
+    def __init__(self, application: List[int], variables: Dict[int, str], **kwargs: Any) -> None:
+        super().__init__(application, **kwargs)
+        for address, name in variables.items():
+            self.application[address] = Polynomial.variable(name)
+
+    def decode(self, address: int) -> Instruction:
+        """Decode the instruction at `address`, which is only possible if its opcode is known."""
+        if not isinstance(self.application[address], int):
+            raise SymbolicFallback(f"The opcode at {address} depends on a variable.")
+        return super().decode(address)
+
+    def read(self, mode: int) -> Value:
+        """Get the parameter value; reading from a symbolic address results in `UNKNOWN`."""
+        parameter = self.parameter()
+        if mode == IMMEDIATE:
+            return parameter
+
+        address = parameter + self.relative_base if mode == RELATIVE else parameter
+        if not isinstance(address, int):
+            return UNKNOWN
+        return self.application[address]
+
+    def write(self, mode: int, value: Value) -> None:
+        """Write `value` to memory, which is only possible if the address is known."""
+        address = self.parameter()
+        if mode == RELATIVE:
+            address += self.relative_base
+        if not isinstance(address, int):
+            raise SymbolicFallback(f"A write at {self.pointer} has an address that is not known.")
+
+        self.application[address] = value
+        self._instructions.pop(address, None)
+
+    def jump_operation(self, modes: Tuple[int, int, int], operation: Callable) -> None:
+        """Jump if the condition holds, which is only possible if the condition value is known."""
+        condition = self.read(modes[0])
+        if not isinstance(condition, int):
+            raise SymbolicFallback(f"The jump at {self.pointer} depends on a variable.")
+
+        if operation(condition, 0):
+            self.pointer = self._known(self.read(modes[1]))
+        else:
+            self._pointer += 1
+
+    def logic_operation(self, modes: Tuple[int, int, int], operation: Callable) -> None:
+        """Compare two values, which is only possible if both values are known."""
+        a = self._known(self.read(modes[0]))
+        b = self._known(self.read(modes[1]))
+        self.write(modes[2], 1 if operation(a, b) else 0)
+
+    def _known(self, value: Value) -> int:
+        """Return `value` if it is a plain int and raise `SymbolicFallback` otherwise."""
+        if not isinstance(value, int):
+            raise SymbolicFallback(f"The instruction at {self.pointer} depends on a variable.")
+        return value
+
+    def change_relative_base(self, modes: Tuple[int, int, int]) -> None:
+        """Change the base of the relative pointers, which is only possible with a known value."""
+        self.relative_base += self._known(self.read(modes[0]))
+
+    jump_true = functools.partialmethod(jump_operation, operation=operator.ne)
+    jump_false = functools.partialmethod(jump_operation, operation=operator.eq)
+    logical_lt = functools.partialmethod(logic_operation, operation=operator.lt)
+    logical_eq = functools.partialmethod(logic_operation, operation=operator.eq)
@@ -0,0 +1,261 @@
+"""
+Run the solutions of all days in parallel on a pool of processes.
+
+Usage: python -m solutions all [DAY ...] [-j WORKERS] [-e ENGINE] [--run-cache] [--parse-cache]
+                               [--timings FILE]
+
+Days can be given one by one or as a range, like `3-7`; by default, the solutions and alternative
+solutions of all days are run. Each solution is run once in a worker process and the answers and
+phase timings of all solutions are collected into a single report.
+
+The solutions are submitted to the pool longest first, using the running times of earlier sweeps,
+so that the slowest solution does not start last and the whole sweep takes about as long as the
+slowest solution instead of the sum of all of them. Solutions without a known time are submitted
+before all others, as they may be the slowest of all. Each sweep records the running times it
+measured in `solutions/data/timings.json`, under a key of their own. The median times of a
+benchmark, written by `python -m solutions bench --output`, can be given with `--timings`; they
+take precedence over the times of a sweep, which ran under contention, and are never modified.
+
+A solution that raises an exception is reported as failed without affecting the others. If a
+worker process dies altogether, the pool can no longer tell which of its solutions caused it, so
+the solutions that did not finish are run again, each in a process of its own, with no more of
+those processes running at the same time than the number of workers.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import importlib
+import json
+import logging
+import os
+import pathlib
+import timeit
+import traceback
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from solutions.bench import find_solutions
+from solutions.data import DATA_ROOT, get_data
+from solutions.helpers import ENGINES, enable_run_cache, select_engine
+from solutions.runner import Result, format_answer, run_solution
+
+log = logging.getLogger(__name__)
+
+TIMINGS_FILE = DATA_ROOT / "timings.json"
+
+Task = Tuple[int, str]
+
+
+class Outcome(NamedTuple):
+    """The result of running a solution in a worker, or the error that it failed with."""
+
+    name: str
+    result: Optional[Result] = None
+    error: Optional[str] = None
+
+
+def solution_name(import_path: str) -> str:
+    """Return the name of the solution at `import_path`, as used in reports and timings files."""
+    return import_path[len("solutions."):]
+
+
+def parse_days(argument: str) -> List[int]:
+    """Parse a day, like `7`, or an inclusive range of days, like `3-7`."""
+    first, _, last = argument.partition("-")
+    try:
+        days = list(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid day or range of days: {argument!r}") from None
+
+    if not days or days[0] < 1 or days[-1] > 25:
+        raise argparse.ArgumentTypeError(f"days must be between 1 and 25: {argument!r}")
+    return days
+
+
+def load_timings(*paths: pathlib.Path) -> Dict[str, float]:
+    """
+    Load the running time of each solution from timings files that exist.
+
+    A file can hold the times recorded by earlier sweeps and the statistics of a benchmark; the
+    median total time of a benchmark takes precedence over the time of a sweep, and the times in
+    later files over those in earlier ones.
+    """
+    timings = {}
+    for path in paths:
+        try:
+            content = json.loads(path.read_text())
+            timings.update(content.get("sweep", {}))
+            timings.update(
+                (name, result["total"]["median"])
+                for name, result in content.get("results", {}).items()
+            )
+        except FileNotFoundError:
+            continue
+        except (ValueError, KeyError, TypeError, AttributeError) as exception:
+            log.warning(f"Ignoring the timings in {path}: {exception}")
+    return timings
+
+
+def save_timings(path: pathlib.Path, outcomes: Iterable[Outcome]) -> None:
+    """Record the total running times of the successful `outcomes` as the times of a sweep."""
+    try:
+        content = json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        content = {}
+
+    sweep = content.setdefault("sweep", {})
+    for outcome in outcomes:
+        if outcome.result is not None:
+            sweep[outcome.name] = outcome.result.timings.total
+    path.write_text(json.dumps(content, indent=2))
+
+
+def schedule(tasks: Iterable[Task], timings: Dict[str, float]) -> List[Task]:
+    """Order `tasks` longest first by their recorded time, putting those without one in front."""
+    def expected_time(task: Task) -> float:
+        return timings.get(solution_name(task[1]), float("inf"))
+
+    return sorted(tasks, key=expected_time, reverse=True)
+
+
+def run_task(day: int, import_path: str, parse_cache: bool = False) -> Outcome:
+    """Run the solution at `import_path` on the input data of `day` in a worker process."""
+    name = solution_name(import_path)
+    try:
+        solution = importlib.import_module(import_path)
+    except ImportError as exception:
+        log.warning(f"Skipping {name}: {exception}")
+        return Outcome(name)
+
+    try:
+        result = run_solution(solution, get_data(day=day), parse_cache)
+    except Exception:
+        return Outcome(name, error=traceback.format_exc())
+    return Outcome(name, result=result)
+
+
+def run_tasks(
+    tasks: List[Task], workers: Optional[int] = None, parse_cache: bool = False
+) -> List[Outcome]:
+    """Run `tasks` in order on a pool of `workers` processes and collect their outcomes."""
+    outcomes = []
+    crashed = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_task, *task, parse_cache): task for task in tasks}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                outcomes.append(future.result())
+            except BrokenProcessPool:
+                crashed.append(futures[future])
+
+    if crashed:
+        log.warning(f"A worker process died; running {len(crashed)} solution(s) in isolation")
+        outcomes.extend(run_isolated(crashed, workers, parse_cache))
+    return outcomes
+
+
+def run_isolated(
+    tasks: List[Task], workers: Optional[int] = None, parse_cache: bool = False
+) -> List[Outcome]:
+    """Run each of `tasks` in a process of its own, with at most `workers` processes at a time."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as threads:
+        return list(threads.map(lambda task: run_in_process(task, parse_cache), tasks))
+
+
+def run_in_process(task: Task, parse_cache: bool = False) -> Outcome:
+    """Run `task` in a new process of its own, so that a crash only affects this task."""
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(run_task, *task, parse_cache).result()
+        except BrokenProcessPool:
+            return Outcome(solution_name(task[1]), error="The worker process died")
+
+
+def report(outcomes: List[Outcome]) -> None:
+    """Print the answers and running times of all solutions, and the errors of failed ones."""
+    for outcome in sorted(outcomes, key=lambda outcome: outcome.name):
+        if outcome.error is not None:
+            print(f"{outcome.name:<28} FAILED")
+            print("".join(f"    {line}\n" for line in outcome.error.rstrip().splitlines()))
+        elif outcome.result is not None:
+            answer_one, answer_two = outcome.result.answers
+            print(f"{outcome.name:<28} {outcome.result.timings.total:.6f}s")
+            print(f"    Answer to part one: {format_answer(answer_one)}")
+            print(f"    Answer to part two: {format_answer(answer_two)}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the solutions in parallel, report the results and return the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m solutions all", description="Run the solutions of all days in parallel"
+    )
+    parser.add_argument(
+        "days",
+        type=parse_days,
+        nargs="*",
+        metavar="DAY",
+        help="only run the solutions of these days or ranges of days, like 3-7",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        dest="workers",
+        type=int,
+        metavar="NUMBER",
+        help="run NUMBER solutions at the same time (default: the number of processors)",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        dest="engine",
+        choices=ENGINES,
+        help="run IntCode applications on ENGINE (default: reference)",
+    )
+    parser.add_argument(
+        "--run-cache",
+        dest="run_cache",
+        action="store_true",
+        help="reuse the outputs of IntCode programs that ran on the same inputs before",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        dest="parse_cache",
+        action="store_true",
+        help="load the parsed input data from the cache instead of parsing it again",
+    )
+    parser.add_argument(
+        "--timings",
+        dest="timings",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="schedule the solutions using the benchmark results in FILE as well",
+    )
+    args = parser.parse_args(argv)
+
+    # The worker processes inherit the engine and run cache settings through the environment
+    if args.engine:
+        select_engine(args.engine)
+    if args.run_cache:
+        enable_run_cache()
+
+    days = sorted({day for days in args.days for day in days})
+    timings_files = [TIMINGS_FILE] + ([args.timings] if args.timings is not None else [])
+    tasks = schedule(find_solutions(days), load_timings(*timings_files))
+    log.debug(f"Running {', '.join(solution_name(path) for _, path in tasks)} in that order")
+
+    time_prior = timeit.default_timer()
+    outcomes = run_tasks(tasks, args.workers or os.cpu_count(), args.parse_cache)
+    wall_time = timeit.default_timer() - time_prior
+
+    report(outcomes)
+    finished = [outcome for outcome in outcomes if outcome.result is not None]
+    failed = [outcome for outcome in outcomes if outcome.error is not None]
+    total_time = sum(outcome.result.timings.total for outcome in finished)
+    print(
+        f"Ran {len(finished)} solution(s) in {wall_time:.6f} seconds "
+        f"({total_time:.6f} seconds one after another); {len(failed)} failed"
+    )
+
+    save_timings(TIMINGS_FILE, finished)
+    return 1 if failed else 0
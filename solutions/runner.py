@@ -0,0 +1,70 @@
+"""
+Run the solution of a day phase by phase.
+
+A solution module provides three entry points:
+
+- `parse(data)` turns the lines of the input data into the input of both parts;
+- `part_one(parsed)` and `part_two(parsed)` compute the answers from the parsed input.
+
+The runner calls and times each of them separately, so the time spent on parsing can be told apart
+from the time spent on either part. Each module also keeps a `main(data)` function that runs all
+three phases at once, for callers that only need the answers.
+
+With the parse cache, the parse phase loads the result of an earlier parse of the same input data
+by the same parser from disk instead; see `solutions.data.get_parsed_data`.
+"""
+from __future__ import annotations
+
+import timeit
+from types import ModuleType
+from typing import Any, List, NamedTuple, Tuple
+
+from solutions.data import get_parsed_data
+
+PHASES = ("parse", "part_one", "part_two")
+
+
+class Timings(NamedTuple):
+    """The running times of the phases of a solution, in seconds."""
+
+    parse: float
+    part_one: float
+    part_two: float
+
+    @property
+    def total(self) -> float:
+        """The running time of all phases combined."""
+        return self.parse + self.part_one + self.part_two
+
+
+class Result(NamedTuple):
+    """The answers of a solution and the time each phase took to run."""
+
+    answers: Tuple[Any, Any]
+    timings: Timings
+
+
+def run_solution(solution: ModuleType, data: List[str], parse_cache: bool = False) -> Result:
+    """Run the phases of `solution` on the lines of input `data` and time each of them."""
+    timer = timeit.default_timer
+
+    time_prior = timer()
+    parsed = get_parsed_data(solution.parse, data) if parse_cache else solution.parse(data)
+    time_parsed = timer()
+    answer_one = solution.part_one(parsed)
+    time_part_one = timer()
+    answer_two = solution.part_two(parsed)
+    time_part_two = timer()
+
+    timings = Timings(
+        parse=time_parsed - time_prior,
+        part_one=time_part_one - time_parsed,
+        part_two=time_part_two - time_part_one,
+    )
+    return Result(answers=(answer_one, answer_two), timings=timings)
+
+
+def format_answer(answer: Any) -> str:
+    """Format an answer for printing, starting answers that span multiple lines on a new line."""
+    answer = str(answer)
+    return f"\n{answer}" if "\n" in answer and not answer.startswith("\n") else answer
@@ -1,6 +1,11 @@
 from typing import List, Tuple
 
 
+def parse(data: List[str]) -> List[int]:
+    """Parse the input data into the input of both parts."""
+    return [int(number) for number in data]
+
+
 def part_one(data: List[int]) -> int:
     """Part one of today's Advent of Code puzzle."""
 
@@ -11,7 +16,7 @@ def part_two(data: List[int]) -> int:
 
 def main(data: List[str]) -> Tuple[int]:
     """The main function taking care of parsing the input data and running the solutions."""
-    data = [int(number) for number in data]
+    data = parse(data)
     answer_one = part_one(data)
     answer_two = part_two(data)
     return answer_one, answer_two
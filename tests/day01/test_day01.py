@@ -1,6 +1,7 @@
 import unittest
 
 from solutions.day01 import part_one, part_two
+from solutions.day01.solution import solve_stream
 from tests.helpers import Puzzle
 
 
@@ -31,3 +32,8 @@ class DayOneTests(unittest.TestCase):
         for puzzle in test_cases:
             with self.subTest(data=puzzle.data, answer=puzzle.answer):
                 self.assertEqual(part_two(puzzle.data), puzzle.answer)
+
+    def test_solve_stream(self):
+        """Test that both parts can be solved in a single pass over an iterator of lines."""
+        lines = iter(["12", "14", "1969", "100756"])
+        self.assertEqual(solve_stream(lines), (34241, 51316))
@@ -1,6 +1,7 @@
 import unittest
 
-from solutions.day02.solution import ship_computer
+from solutions.day02 import solution_numpy
+from solutions.day02.solution import part_two, ship_computer
 from tests.helpers import Puzzle
 
 
@@ -20,3 +21,15 @@ class DayTwoTests(unittest.TestCase):
                 verb = puzzle.data[2]
 
                 self.assertEqual(ship_computer(puzzle.data, noun=noun, verb=verb), puzzle.answer)
+
+    def test_part_two_falls_back_without_symbolic_solution(self):
+        """Test that part two searches concretely if the symbolic result is not known."""
+        # The result reads from the addresses `noun` and `verb`, which makes it unknown
+        data = [1, 0, 0, 0, 99] + list(range(5, 100))
+
+        self.assertEqual(part_two(data, target=150), 275)
+
+    def test_numpy_part_two_without_solution(self):
+        """Test that the lockstep search fails clearly if no noun and verb give the answer."""
+        with self.assertRaises(ValueError):
+            solution_numpy.part_two([1, 0, 0, 0, 99])
@@ -0,0 +1,35 @@
+import unittest
+
+from solutions.day07.solution import part_one
+from tests.helpers import Puzzle
+
+
+class DaySevenTests(unittest.TestCase):
+    """Tests for my solutions to Day 7 of the Advent of Code 2019."""
+
+    def test_part_one_examples(self):
+        """Test part one of day 7 using the example data provided in the puzzle."""
+        test_cases = (
+            Puzzle(
+                data=[3, 15, 3, 16, 1002, 16, 10, 16, 1, 16, 15, 15, 4, 15, 99, 0, 0],
+                answer=43210,
+            ),
+            Puzzle(
+                data=[
+                    3, 23, 3, 24, 1002, 24, 10, 24, 1002, 23, -1, 23, 101, 5, 23, 23, 1, 24, 23,
+                    23, 4, 23, 99, 0, 0,
+                ],
+                answer=54321,
+            ),
+            Puzzle(
+                data=[
+                    3, 31, 3, 32, 1002, 32, 10, 32, 1001, 31, -2, 31, 1007, 31, 0, 33, 1002, 33, 7,
+                    33, 1, 33, 31, 31, 1, 32, 31, 31, 4, 31, 99, 0, 0, 0,
+                ],
+                answer=65210,
+            ),
+        )
+
+        for puzzle in test_cases:
+            with self.subTest(data=puzzle.data, answer=puzzle.answer):
+                self.assertEqual(part_one(puzzle.data), puzzle.answer)
@@ -0,0 +1,75 @@
+import unittest
+
+from solutions.helpers import OptimizedIntCodeApplication
+from solutions.helpers.analysis import disassemble, optimize
+
+# Outputs the sum of two constants after a store to address 14 that is overwritten right away
+DEAD_STORE = [1, 12, 13, 14, 1101, 2, 3, 14, 4, 14, 99, 0, 20, 22, 0]
+
+# Reads a count and an operand and outputs their product, calculated by repeated addition
+MULTIPLY = [3, 30, 3, 31, 1, 32, 31, 32, 1001, 30, -1, 30, 1005, 30, 4, 4, 32, 99] + [0] * 15
+
+
+class AnalysisTests(unittest.TestCase):
+    """Tests for the static analysis and optimization of IntCode programs."""
+
+    def test_control_flow_graph(self):
+        """Test that the basic blocks, reads and writes of a program are found."""
+        graph = disassemble(MULTIPLY)
+
+        self.assertEqual(sorted(graph.blocks), [0, 4, 15])
+        self.assertEqual(graph.blocks[4].successors, (15, 4))
+        self.assertEqual(graph.writes, {30, 31, 32})
+        self.assertEqual(graph.reads, {30, 31, 32})
+        self.assertTrue(graph.closed)
+
+    def test_self_modifying_programs_are_not_rewritten(self):
+        """Test that a program that overwrites its own instructions is left as it is."""
+        # Overwrites the instruction directly following it with `99`
+        data = [1101, 98, 1, 4, 1101, 1, 1, 10, 104, 7, 99]
+
+        self.assertEqual(disassemble(data).self_modifying, {4, 10})
+        optimization = optimize(data)
+        self.assertEqual(optimization.program, data)
+        self.assertIsNotNone(optimization.skipped)
+
+    def test_constant_propagation_and_dead_stores(self):
+        """Test that constant operands are folded and that the overwritten store is jumped over."""
+        optimization = optimize(DEAD_STORE)
+
+        self.assertEqual(optimization.program[:8], [1105, 1, 4, 0, 1101, 2, 3, 14])
+        self.assertEqual((optimization.folded_operands, optimization.dead_stores), (2, 1))
+
+        application = OptimizedIntCodeApplication(DEAD_STORE)
+        application.run()
+        self.assertEqual(application.stdout.get(), 5)
+
+    def test_multiply_loop(self):
+        """Test that a loop of repeated additions is recognized and runs as one multiplication."""
+        loop = optimize(MULTIPLY).loops[4]
+        self.assertEqual((loop.accumulator, loop.operand, loop.counter), (32, 31, 30))
+        self.assertEqual(loop.exit, 15)
+
+        application = OptimizedIntCodeApplication(MULTIPLY)
+        for value in (1000, 7):
+            application.stdin.put(value)
+        application.run()
+
+        self.assertEqual(application.stdout.get(), 7000)
+        self.assertEqual(application.saved_instructions, 2999)
+
+    def test_multiply_loop_with_folded_operand(self):
+        """Test that a loop with a folded operand is still run as a multiplication."""
+        # Outputs seven times its input; the operand at address 31 is never written, so it's folded
+        data = [3, 30, 1, 32, 31, 32, 1001, 30, -1, 30, 1005, 30, 2, 4, 32, 99] + [0] * 15 + [7, 0]
+
+        optimization = optimize(data)
+        self.assertEqual(optimization.program[2:6], [1001, 32, 7, 32])
+        self.assertEqual(optimization.loops[2].value, 7)
+
+        application = OptimizedIntCodeApplication(data)
+        application.stdin.put(1000)
+        application.run()
+
+        self.assertEqual(application.stdout.get(), 7000)
+        self.assertEqual(application.saved_instructions, 2999)
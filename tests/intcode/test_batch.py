@@ -0,0 +1,53 @@
+import unittest
+
+from solutions.helpers.batch import IntCodeBatch
+
+
+class IntCodeBatchTests(unittest.TestCase):
+    """Tests for the lockstep batch engine for IntCode applications."""
+
+    def test_diverging_copies(self):
+        """Test that copies that take different branches are split up and all run to completion."""
+        # Stores 2 at address 14 if the value at address 13 is non-zero and 1 otherwise
+        data = [1005, 13, 8, 1101, 0, 1, 14, 99, 1101, 0, 2, 14, 99, 0, 0]
+
+        batch = IntCodeBatch(data, patches={13: [0, 5, 0, -1]})
+        batch.run()
+
+        self.assertEqual(batch.memory[:, 14].tolist(), [1, 2, 1, 2])
+        self.assertTrue(batch.halted.all())
+
+    def test_copies_with_different_opcodes(self):
+        """Test that copies at the same instruction with different opcodes each make progress."""
+        # Adds or multiplies the values at addresses 5 and 6, depending on the opcode patched in
+        data = [1, 5, 6, 7, 99, 3, 4, 0]
+
+        batch = IntCodeBatch(data, patches={0: [1, 2]})
+        batch.run(max_steps=100)
+
+        self.assertTrue(batch.halted.all())
+        self.assertEqual(batch.memory[:, 7].tolist(), [7, 12])
+
+    def test_faulting_copies(self):
+        """Test that copies reading outside their memory fault without affecting the others."""
+        data = [1, 0, 0, 0, 99]
+
+        batch = IntCodeBatch(data, patches={1: [0, 100, 4]})
+        batch.run()
+
+        self.assertEqual(batch.halted.tolist(), [True, False, True])
+        self.assertEqual(batch.faulted.tolist(), [False, True, False])
+        self.assertEqual(batch.memory[[0, 2], 0].tolist(), [2, 100])
+
+    def test_overflowing_copies_finish_on_the_interpreter(self):
+        """Test that copies whose products may not fit in 64 bits still get the exact result."""
+        # Multiplies the values at addresses 1 and 2 and stores the product at address 7
+        data = [1102, 0, 0, 7, 99, 0, 0, 0]
+
+        batch = IntCodeBatch(data, patches={1: [3, 2**40, 3], 2: [4, 2**40, 2**61]})
+        batch.run()
+
+        self.assertTrue(batch.halted.all())
+        self.assertFalse(batch.faulted.any())
+        self.assertEqual(batch.values(7), [12, 2**80, 3 * 2**61])
+        self.assertEqual(int(batch.memory[2, 7]), 3 * 2**61)
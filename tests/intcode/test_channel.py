@@ -0,0 +1,42 @@
+import queue
+import unittest
+
+from solutions.helpers import IntCodeApplication
+from solutions.helpers.channel import Channel
+
+
+class ChannelTests(unittest.TestCase):
+    """Tests for the buffered I/O channels of IntCode applications."""
+
+    def test_bulk_reads_and_writes(self):
+        """Test that values are read in frames in the order they were written."""
+        channel = Channel()
+        channel.write_many(iter(range(5)))
+        channel.put(5)
+
+        self.assertEqual(channel.read_n(2), [0, 1])
+        self.assertEqual(channel.get(), 2)
+        self.assertEqual(channel.read_all(), [3, 4, 5])
+        self.assertTrue(channel.empty())
+
+    def test_incomplete_frames_are_left_in_the_channel(self):
+        """Test that reading more values than are waiting raises `queue.Empty` and reads nothing."""
+        channel = Channel([1])
+        with self.assertRaises(queue.Empty):
+            channel.read_n(2)
+        self.assertEqual(list(channel), [1])
+
+        channel.get()
+        with self.assertRaises(queue.Empty):
+            channel.get()
+
+    def test_application_writes_output_frames(self):
+        """Test that an application writes its outputs to its stdout channel in bulk."""
+        # Outputs its input and the input plus one, twice
+        data = [3, 13, 4, 13, 101, 1, 13, 13, 4, 13, 1105, 1, 14, 0, 3, 13, 1105, 1, 2]
+        application = IntCodeApplication(data, stdin=Channel(), stdout=Channel())
+        application.stdin.write_many([7, 20])
+        application.stdout.write_many(application.resume())
+
+        self.assertEqual(application.stdout.read_n(2), [7, 8])
+        self.assertEqual(application.stdout.read_n(2), [20, 21])
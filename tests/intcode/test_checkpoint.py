@@ -0,0 +1,63 @@
+import pathlib
+import sys
+import tempfile
+import unittest
+
+from solutions.helpers import ENGINES, IntCodeApplication
+from solutions.helpers.checkpoint import load_checkpoint, save_checkpoint
+
+# Multiplies an accumulator on another memory page by each input and outputs it
+MULTIPLY = [1101, 1, 0, 5000, 3, 20, 2, 20, 5000, 5000, 4, 5000, 1105, 1, 4] + [0] * 6
+
+
+class CheckpointTests(unittest.TestCase):
+    """Tests for saving IntCode applications to disk and loading them again."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = pathlib.Path(directory.name) / "checkpoint.bin"
+
+    def test_checkpoint_resumes_where_it_left_off(self):
+        """Test that a loaded checkpoint continues with the same memory, registers and I/O."""
+        application = IntCodeApplication(MULTIPLY, name="multiply", flexible_memory=True)
+        for value in (2**40, 2**40, 3):
+            application.stdin.put(value)
+        list(application.resume())
+        application.stdin.put(7)
+        application.stdout.put(-1)
+        save_checkpoint(application, self.path)
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                restored = load_checkpoint(self.path, engine=engine)
+                self.assertEqual(restored.name, "multiply")
+                self.assertEqual(restored.stdout.get(), -1)
+                self.assertEqual(list(restored.resume()), [7 * 3 * 2**80])
+
+    def test_fixed_memory_checkpoint(self):
+        """Test that an application with a fixed-size memory keeps that memory when restored."""
+        application = IntCodeApplication([3, 5, 4, 5, 99, 0])
+        save_checkpoint(application, self.path)
+
+        restored = load_checkpoint(self.path, engine="reference")
+        self.assertEqual(restored.application, [3, 5, 4, 5, 99, 0])
+        restored.stdin.put(12)
+        self.assertEqual(list(restored.resume()), [12])
+        self.assertTrue(restored.halted)
+
+    def test_checkpoint_in_other_byte_order(self):
+        """Test that a checkpoint written in the other byte order is swapped when it is loaded."""
+        other = "little" if sys.byteorder == "big" else "big"
+        application = IntCodeApplication(MULTIPLY, flexible_memory=True)
+        application.stdin.put(6)
+        list(application.resume())
+        save_checkpoint(application, self.path, byteorder=other)
+
+        content = self.path.read_bytes()
+        self.assertIn((1101).to_bytes(8, other, signed=True), content)
+        self.assertNotIn((1101).to_bytes(8, sys.byteorder, signed=True), content)
+        restored = load_checkpoint(self.path, engine="reference")
+        self.assertEqual([restored.application[i] for i in range(4)], MULTIPLY[:4])
+        restored.stdin.put(7)
+        self.assertEqual(list(restored.resume()), [42])
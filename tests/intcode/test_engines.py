@@ -0,0 +1,36 @@
+import os
+import unittest
+from unittest import mock
+
+from solutions.helpers import ENGINES, create_application, select_engine
+from solutions.helpers.engines import ENVIRONMENT_VARIABLE
+
+
+class EngineRegistryTests(unittest.TestCase):
+    """Tests for the registry of IntCode engines."""
+
+    def test_engines_produce_the_same_output(self):
+        """Test that every registered engine runs an application to the same output."""
+        # Outputs the factorial of its input using a loop that jumps back to its start
+        data = [
+            3, 20, 1101, 0, 1, 21, 2, 20, 21, 21, 1001, 20, -1, 20, 1005, 20, 6, 4, 21, 99, 0, 0,
+        ]
+
+        for name in ENGINES:
+            with self.subTest(engine=name):
+                application = create_application(data, engine=name)
+                application.stdin.put(5)
+                application.run()
+                self.assertEqual(application.stdout.get(), 120)
+
+    def test_select_engine(self):
+        """Test that the selected engine is used by default and that unknown names are refused."""
+        with mock.patch.dict(os.environ):
+            for name, engine in ENGINES.items():
+                with self.subTest(engine=name):
+                    select_engine(name)
+                    self.assertIs(type(create_application([99])), engine)
+                    self.assertEqual(os.environ[ENVIRONMENT_VARIABLE], name)
+
+            with self.assertRaises(ValueError):
+                select_engine("abacus")
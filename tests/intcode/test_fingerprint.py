@@ -0,0 +1,40 @@
+import unittest
+
+from solutions.helpers.fingerprint import (
+    Cycle, FingerprintedIntCodeApplication, find_cycle, memory_fingerprint,
+)
+
+# Negates the value at address 7 forever, returning to the same state every four instructions
+NEGATE = [1002, 7, -1, 7, 1105, 1, 0, 5]
+
+
+class FingerprintTests(unittest.TestCase):
+    """Tests for the incremental state fingerprints of IntCode applications."""
+
+    def test_fingerprint_matches_memory(self):
+        """Test that the incremental fingerprint equals one calculated from scratch."""
+        # Stores the product of its input and 2**70 at an address far beyond the program
+        data = [3, 11, 1002, 11, 3, 11, 21102, 2**70, 5, 5000, 99, 0]
+
+        application = FingerprintedIntCodeApplication(data, flexible_memory=True)
+        application.stdin.put(4)
+        application.run()
+
+        fingerprint = memory_fingerprint(application.application)
+        self.assertEqual(application.memory_fingerprint, fingerprint)
+        self.assertEqual(application.application[5000], 5 * 2**70)
+
+    def test_equal_states_have_equal_hashes(self):
+        """Test that applications in the same state hash the same, whatever their history."""
+        first = FingerprintedIntCodeApplication(NEGATE)
+        second = FingerprintedIntCodeApplication(NEGATE)
+        list(first.resume(quantum=4))
+
+        self.assertEqual(hash(first), hash(second))
+        list(second.resume(quantum=1))
+        self.assertNotEqual(hash(first), hash(second))
+
+    def test_find_cycle(self):
+        """Test that a revisited state is detected and that halting applications have no cycle."""
+        self.assertEqual(find_cycle(FingerprintedIntCodeApplication(NEGATE)), Cycle(0, 4))
+        self.assertIsNone(find_cycle(FingerprintedIntCodeApplication([1101, 1, 1, 0, 99])))
@@ -0,0 +1,44 @@
+import unittest
+
+from solutions.helpers import CompiledIntCodeApplication, IntCodeApplication
+from solutions.helpers import image as image_module
+from solutions.helpers.image import close_program, load_program, share_program
+from solutions.helpers.memory import PAGE_SIZE
+
+
+class ProgramImageTests(unittest.TestCase):
+    """Tests for program images in shared memory with copy-on-write memory on top of them."""
+
+    def test_writes_are_private_to_each_memory(self):
+        """Test that writing to memory loaded from an image changes neither the image nor others."""
+        with share_program([1, 2, 3]) as image:
+            first, second = load_program(image), load_program(image)
+            first[1] = 20
+            first[PAGE_SIZE + 1] = 2**70
+
+            self.assertEqual([first[0], first[1], first[PAGE_SIZE + 1]], [1, 20, 2**70])
+            self.assertEqual([second[0], second[1], second[PAGE_SIZE + 1]], [1, 2, 0])
+            self.assertEqual(list(load_program(image))[:4], [1, 2, 3, 0])
+
+    def test_applications_run_on_shared_image(self):
+        """Test that self-modifying code runs correctly on memory loaded from an image."""
+        # Outputs its input, followed by the input plus one that it patched into its own code
+        data = [3, 12, 1001, 12, 1, 9, 4, 12, 104, 0, 99, 0, 0]
+
+        with share_program(data) as image:
+            for application_class in (IntCodeApplication, CompiledIntCodeApplication):
+                with self.subTest(application_class=application_class.__name__):
+                    application = application_class(load_program(image))
+                    application.stdin.put(42)
+                    self.assertEqual(list(application.resume()), [42, 43])
+
+    def test_close_program_detaches(self):
+        """Test that closing an image releases the attachment of this process."""
+        with share_program([1, 2, 3]) as image:
+            memory = load_program(image)
+            self.assertIn(image.name, image_module._attached)
+
+            del memory
+            close_program(image)
+            self.assertNotIn(image.name, image_module._attached)
+            self.assertEqual(list(load_program(image))[:3], [1, 2, 3])
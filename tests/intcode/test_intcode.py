@@ -0,0 +1,230 @@
+import array
+import asyncio
+import threading
+import unittest
+
+from solutions.helpers import (
+    CompiledIntCodeApplication, ENGINES, Int64IntCodeApplication, IntCodeApplication,
+    OptimizedIntCodeApplication,
+)
+from solutions.helpers.fingerprint import FingerprintedIntCodeApplication
+from solutions.helpers.memory import PAGE_BITS
+from solutions.helpers.profiler import Profile
+from solutions.helpers.symbolic import SymbolicIntCodeApplication
+from tests.helpers import Puzzle
+
+QUINE = [109, 1, 204, -1, 1001, 100, 1, 100, 1008, 100, 16, 101, 1006, 101, 0, 99]
+
+# Outputs 999 if the input is below 8, 1000 if it is equal to 8 and 1001 if it is larger than 8
+COMPARE_TO_EIGHT = [
+    3, 21, 1008, 21, 8, 20, 1005, 20, 22, 107, 8, 21, 20, 1006, 20, 31, 1106, 0, 36, 98, 0, 0,
+    1002, 21, 125, 20, 4, 20, 1105, 1, 46, 104, 999, 1105, 1, 46, 1101, 1000, 1, 20, 4, 20, 1105,
+    1, 46, 98, 99,
+]
+
+
+def run_application(application_class, data, inputs=(), **kwargs):
+    """Run an IntCodeApplication on `data` with `inputs` and return all of its outputs."""
+    application = application_class(data, **kwargs)
+    for value in inputs:
+        application.stdin.put(value)
+    application.run()
+
+    outputs = []
+    while not application.stdout.empty():
+        outputs.append(application.stdout.get())
+    return outputs
+
+
+class IntCodeApplicationTests(unittest.TestCase):
+    """Tests for the IntCodeApplication using the example programs provided in the puzzles."""
+
+    application_class = IntCodeApplication
+
+    def test_position_and_immediate_modes(self):
+        """Test the comparison and jump instructions using the day 5 example program."""
+        test_cases = (
+            Puzzle(data=[7], answer=[999]),
+            Puzzle(data=[8], answer=[1000]),
+            Puzzle(data=[9], answer=[1001]),
+        )
+
+        for puzzle in test_cases:
+            with self.subTest(data=puzzle.data, answer=puzzle.answer):
+                outputs = run_application(self.application_class, COMPARE_TO_EIGHT, puzzle.data)
+                self.assertEqual(outputs, puzzle.answer)
+
+    def test_relative_mode_and_flexible_memory(self):
+        """Test relative mode and memory beyond the program using the day 9 example programs."""
+        test_cases = (
+            Puzzle(data=QUINE, answer=QUINE),
+            Puzzle(data=[1102, 34915192, 34915192, 7, 4, 7, 99, 0], answer=[1219070632396864]),
+            Puzzle(data=[104, 1125899906842624, 99], answer=[1125899906842624]),
+            # Multiplies two numbers into a product that does not fit in 64 bits
+            Puzzle(data=[1102, 2**40, 2**40, 7, 4, 7, 99, 0], answer=[2**80]),
+        )
+
+        for puzzle in test_cases:
+            with self.subTest(data=puzzle.data, answer=puzzle.answer):
+                outputs = run_application(self.application_class, puzzle.data, flexible_memory=True)
+                self.assertEqual(outputs, puzzle.answer)
+
+    def test_self_modifying_code(self):
+        """Test that overwriting an already decoded instruction executes the new instruction."""
+        test_cases = (
+            # Increments and outputs a counter, overwrites address 0 with `99` and jumps back to it
+            Puzzle(data=[1001, 13, 1, 13, 4, 13, 1101, 98, 1, 0, 1105, 1, 0, 0], answer=[1]),
+            # Overwrites the instruction directly following it with `99`
+            Puzzle(data=[1101, 98, 1, 4, 1101, 1, 1, 10, 104, 7, 99], answer=[]),
+        )
+
+        for puzzle in test_cases:
+            with self.subTest(data=puzzle.data, answer=puzzle.answer):
+                outputs = run_application(self.application_class, puzzle.data)
+                self.assertEqual(outputs, puzzle.answer)
+
+    def test_fixed_memory_out_of_bounds(self):
+        """Test that accessing memory beyond a fixed-size program raises an IndexError."""
+        test_cases = (
+            # Outputs the value at address 100
+            [4, 100, 99],
+            # Writes to address 100
+            [1101, 1, 1, 100, 99],
+            # Writes to the address right after a program that spans more than one page
+            [1101, 1, 1, 1500, 99] + [0] * 1495,
+        )
+
+        for data in test_cases:
+            with self.subTest(data=data[:5]):
+                with self.assertRaises(IndexError):
+                    run_application(self.application_class, data)
+
+    def test_decode_after_self_modification(self):
+        """Test that `decode` does not return a stale instruction after its address was written."""
+        # Overwrites the `99` at address 4 with an input instruction
+        application = self.application_class([1101, 3, 0, 4, 99, 6, 0])
+        self.assertFalse(application.waiting_for_input())
+
+        self.assertEqual(list(application.resume()), [])
+        self.assertFalse(application.halted)
+        self.assertTrue(application.waiting_for_input())
+
+    def test_resume_suspends_without_input(self):
+        """Test that `resume` suspends on an empty stdin and continues once input is available."""
+        application = self.application_class(COMPARE_TO_EIGHT)
+
+        self.assertEqual(list(application.resume()), [])
+        self.assertFalse(application.halted)
+
+        application.stdin.put(8)
+        self.assertEqual(list(application.resume()), [1000])
+        self.assertTrue(application.halted)
+
+    def test_run_in_thread_waits_for_input(self):
+        """Test that an application running in a thread waits for input put on its stdin."""
+        application = self.application_class([3, 0, 4, 0, 99])
+        thread = threading.Thread(target=application.run)
+        thread.start()
+
+        application.stdin.put(5)
+        thread.join(timeout=5)
+        self.assertEqual(application.stdout.get(timeout=5), 5)
+        self.assertTrue(application.halted)
+
+    def test_run_async_with_a_feedback_loop(self):
+        """Test two applications that pass a counter back and forth on a single event loop."""
+        # Reads a number, outputs it plus one and halts after outputting a number larger than 5
+        data = [3, 20, 1001, 20, 1, 20, 4, 20, 1007, 20, 5, 21, 1005, 21, 0, 99, 0, 0, 0, 0, 0, 0]
+
+        async def ping_pong():
+            ping, pong = asyncio.Queue(), asyncio.Queue()
+            applications = (
+                self.application_class(data, stdin=ping, stdout=pong),
+                self.application_class(data, stdin=pong, stdout=ping),
+            )
+            ping.put_nowait(0)
+            await asyncio.gather(*(application.run_async() for application in applications))
+            return ping.get_nowait()
+
+        self.assertEqual(asyncio.run(ping_pong()), 6)
+
+    def test_fork_snapshot_and_restore(self):
+        """Test that forks and restored snapshots run independently of the original application."""
+        # Adds each input to an accumulator on another memory page and outputs the accumulator
+        data = [3, 20, 1, 20, 3000, 3000, 4, 3000, 1105, 1, 0] + [0] * 10
+
+        application = self.application_class(data, flexible_memory=True)
+        application.stdin.put(5)
+        self.assertEqual(list(application.resume()), [5])
+
+        fork = application.fork()
+        application.stdin.put(40)
+        snapshot = application.snapshot()
+
+        self.assertEqual(list(application.resume()), [45])
+        fork.stdin.put(10)
+        self.assertEqual(list(fork.resume()), [15])
+
+        for value in (1, 2):
+            application.restore(snapshot)
+            application.stdin.put(value)
+            self.assertEqual(list(application.resume()), [45, 45 + value])
+
+
+class CompiledIntCodeApplicationTests(IntCodeApplicationTests):
+    """Run the IntCodeApplication tests against the basic-block compiler backend."""
+
+    application_class = CompiledIntCodeApplication
+
+
+class Int64IntCodeApplicationTests(IntCodeApplicationTests):
+    """Run the IntCodeApplication tests against the compiler with int64 memory."""
+
+    application_class = Int64IntCodeApplication
+
+    def test_overflow_promotes_only_the_affected_page(self):
+        """Test that a value beyond 64 bits promotes the page it's stored in and no other page."""
+        # Stores the square of 2**40 at address 3000 and 2**62 + 1 at address 7
+        data = [1102, 2**40, 2**40, 3000, 1101, 1, 2**62, 7, 99]
+        application = self.application_class(data, flexible_memory=True)
+        application.run()
+
+        memory = application.application
+        self.assertEqual((memory[3000], memory[7]), (2**80, 2**62 + 1))
+        self.assertIsInstance(memory.pages[0], array.array)
+        self.assertIsInstance(memory.pages[3000 >> PAGE_BITS], list)
+
+
+class OptimizedIntCodeApplicationTests(IntCodeApplicationTests):
+    """Run the IntCodeApplication tests against the optimizing engine."""
+
+    application_class = OptimizedIntCodeApplication
+
+
+class ForkTests(unittest.TestCase):
+    """Test `fork` on every engine and on the other subclasses of IntCodeApplication."""
+
+    def test_fork_every_application_class(self):
+        """Test that a fork keeps the configuration of its class and runs independently."""
+        # Outputs twice its input
+        data = [3, 9, 1002, 9, 2, 9, 4, 9, 99, 0]
+        applications = [engine(data) for engine in ENGINES.values()] + [
+            FingerprintedIntCodeApplication(data),
+            SymbolicIntCodeApplication(data, variables={}),
+        ]
+
+        for application in applications:
+            with self.subTest(application_class=type(application).__name__):
+                profile = Profile()
+                profile.attach(application)
+                self.assertEqual(list(application.resume()), [])
+
+                fork = application.fork()
+                self.assertIs(type(fork), type(application))
+                fork.stdin.put(21)
+                self.assertEqual(list(fork.resume()), [42])
+                self.assertTrue(fork.halted)
+
+                application.stdin.put(5)
+                self.assertEqual(list(application.resume()), [10])
+                self.assertEqual(profile.opcodes, {3: 1, 2: 1, 4: 1})
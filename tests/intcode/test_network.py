@@ -0,0 +1,54 @@
+import unittest
+
+from solutions.helpers import IntCodeApplication
+from solutions.helpers.network import NAT, Network, Packet
+
+# Reads its address and forwards every packet (x, y) it receives as (x, y + 1) to the next address
+FORWARD = [3, 30, 1001, 30, 1, 31, 3, 32, 3, 33, 1001, 33, 1, 33, 4, 31, 4, 32, 4, 33, 1105, 1, 6]
+FORWARD += [0] * (34 - len(FORWARD))
+
+# Like FORWARD, but it polls for packets and ignores the -1 it reads when its queue is empty
+POLLING_FORWARD = [
+    3, 30, 1001, 30, 1, 31, 3, 32, 1008, 32, -1, 34, 1005, 34, 6, 3, 33, 1001, 33, 1, 33,
+    4, 31, 4, 32, 4, 33, 1105, 1, 6,
+]
+POLLING_FORWARD += [0] * (35 - len(POLLING_FORWARD))
+
+
+class NetworkTests(unittest.TestCase):
+    """Tests for the packet-switched network of IntCode applications."""
+
+    def test_packets_are_routed_through_many_nodes(self):
+        """Test that a packet is forwarded along a chain of 50 nodes to a monitor."""
+        network = Network()
+        for _ in range(50):
+            network.add_node(IntCodeApplication(FORWARD))
+
+        received = []
+        network.add_monitor(50, received.append)
+        network.send(Packet(0, 7, 0))
+        network.run()
+
+        self.assertEqual(received, [Packet(50, 7, 50)])
+        self.assertEqual(network.delivered, 51)
+
+    def test_nat_wakes_idle_network(self):
+        """Test that the NAT wakes up an idle network of polling nodes with its last packet."""
+        network = Network(empty_input=-1)
+        for _ in range(5):
+            network.add_node(IntCodeApplication(POLLING_FORWARD))
+
+        nat = NAT(network, address=5)
+        network.send(Packet(0, 7, 0))
+        network.run(on_idle=lambda: len(nat.sent) < 2 and nat.wake())
+
+        self.assertEqual(nat.sent, [Packet(0, 7, 5), Packet(0, 7, 10)])
+        self.assertEqual(nat.packet, Packet(5, 7, 15))
+
+    def test_addresses_are_unique(self):
+        """Test that a node or monitor cannot be added at an address that is already in use."""
+        network = Network()
+        network.add_node(IntCodeApplication(FORWARD), address=3)
+
+        with self.assertRaises(ValueError):
+            network.add_monitor(3, print)
@@ -0,0 +1,71 @@
+import json
+import unittest
+
+from solutions.helpers import CompiledIntCodeApplication, IntCodeApplication
+from solutions.helpers.profiler import Profile
+
+# Outputs the factorial of its input using a loop that jumps back to address 6
+FACTORIAL = [3, 20, 1101, 0, 1, 21, 2, 20, 21, 21, 1001, 20, -1, 20, 1005, 20, 6, 4, 21, 99, 0, 0]
+
+
+class ProfileTests(unittest.TestCase):
+    """Tests for the opt-in execution profiler for IntCode applications."""
+
+    def test_profile_records_execution(self):
+        """Test that the opcode counts, hot addresses, branches and trace are recorded."""
+        for application_class in (IntCodeApplication, CompiledIntCodeApplication):
+            with self.subTest(application_class=application_class.__name__):
+                profile = Profile(trace_size=3)
+                application = application_class(FACTORIAL)
+                profile.attach(application)
+                application.stdin.put(5)
+                application.run()
+
+                self.assertEqual(application.stdout.get(), 120)
+                self.assertEqual(profile.opcodes, {3: 1, 1: 6, 2: 5, 5: 5, 4: 1})
+                self.assertEqual(profile.instructions, 18)
+                self.assertEqual(profile.hot_addresses(1), [(6, 5)])
+                self.assertEqual(profile.branch_ratios(), {14: 0.8})
+                self.assertEqual(list(profile.trace), [(10, 1), (14, 5), (17, 4)])
+
+                branch = json.loads(profile.to_json())["branches"]["14"]
+                self.assertEqual(branch, {"not_taken": 1, "taken": 4, "ratio": 0.8})
+
+    def test_suspended_input_is_counted_once(self):
+        """Test that an input instruction the application suspends on is only counted when run."""
+        profile = Profile()
+        application = IntCodeApplication([3, 5, 4, 5, 99, 0])
+        profile.attach(application)
+
+        self.assertEqual(list(application.resume()), [])
+        application.stdin.put(7)
+        self.assertEqual(list(application.resume()), [7])
+        self.assertEqual(profile.opcodes, {3: 1, 4: 1})
+
+    def test_detach_restores_interpreter_loop(self):
+        """Test that detaching a profile leaves the application without any instrumentation."""
+        profile = Profile()
+        application = IntCodeApplication(FACTORIAL)
+        profile.attach(application)
+        profile.detach(application)
+
+        self.assertNotIn("resume", vars(application))
+        application.stdin.put(3)
+        application.run()
+        self.assertEqual(profile.instructions, 0)
+
+    def test_self_modifying_code(self):
+        """Test that a profiled application executes instructions that overwrote decoded ones."""
+        # Increments and outputs a counter, overwrites address 0 with `99` and jumps back to it
+        data = [1001, 13, 1, 13, 4, 13, 1101, 98, 1, 0, 1105, 1, 0, 0]
+
+        for application_class in (IntCodeApplication, CompiledIntCodeApplication):
+            with self.subTest(application_class=application_class.__name__):
+                profile = Profile()
+                application = application_class(data)
+                profile.attach(application)
+                application.run()
+
+                self.assertEqual(application.stdout.get_nowait(), 1)
+                self.assertTrue(application.stdout.empty())
+                self.assertTrue(application.halted)
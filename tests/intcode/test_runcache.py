@@ -0,0 +1,59 @@
+import os
+import pathlib
+import tempfile
+import unittest
+
+from solutions.helpers.runcache import RunCache, run_key, run_to_completion
+
+# Outputs the sum of its two inputs
+ADD = [3, 11, 3, 12, 1, 11, 12, 11, 4, 11, 99, 0, 0]
+
+
+class RunCacheTests(unittest.TestCase):
+    """Tests for the cache of the outputs of IntCode runs."""
+
+    def test_cached_outputs_are_reused(self):
+        """Test that a repeated run is answered from the cache in memory and from disk."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = RunCache(pathlib.Path(directory))
+            self.assertEqual(run_to_completion(ADD, [3, 4], cache=cache), [7])
+            self.assertEqual(run_to_completion(ADD, [3, 4], cache=cache), [7])
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # A fresh cache on the same directory finds the run on disk
+            cache = RunCache(pathlib.Path(directory))
+            self.assertEqual(cache.get(run_key(ADD, [3, 4])), (7,))
+            self.assertIsNone(cache.get(run_key(ADD, [4, 3])))
+
+    def test_lru_and_size_bounds(self):
+        """Test that the least recently used entries are evicted from both tiers."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = RunCache(pathlib.Path(directory), max_entries=2, max_bytes=25)
+            for number, key in enumerate("abc"):
+                cache.put(key, [number] * 4)
+                # Make sure the files have distinct modification times
+                os.utime(pathlib.Path(directory) / f"{key}.json", (number, number))
+
+            self.assertEqual(list(cache.entries), ["b", "c"])
+            cache.put("d", [])
+            files = sorted(path.stem for path in pathlib.Path(directory).glob("*.json"))
+            self.assertEqual(files, ["c", "d"])
+
+    def test_files_evicted_by_another_process(self):
+        """Test that files that disappear while the directory is shared are skipped."""
+        with tempfile.TemporaryDirectory() as directory:
+            # A file that another process evicted between listing and using it
+            (pathlib.Path(directory) / "gone.json").symlink_to(pathlib.Path(directory) / "none")
+            cache = RunCache(pathlib.Path(directory), max_bytes=0)
+            cache.put("a", [1, 2, 3])
+
+            self.assertEqual(list(pathlib.Path(directory).glob("*.tmp")), [])
+            self.assertEqual(RunCache(pathlib.Path(directory)).get("a"), None)
+            cache.clear()
+
+    def test_incomplete_runs_are_refused(self):
+        """Test that a program that waits for more input is not cached as complete."""
+        cache = RunCache(directory=None)
+        with self.assertRaises(RuntimeError):
+            run_to_completion(ADD, [3], cache=cache)
+        self.assertEqual(cache.entries, {})
@@ -0,0 +1,60 @@
+import unittest
+
+from solutions.helpers import IntCodeApplication
+from solutions.helpers.scheduler import DeadlockError, Scheduler
+
+# Reads a number n and outputs n, n - 1, ..., 1 using three instructions per output
+COUNTDOWN = [3, 12, 4, 12, 1001, 12, -1, 12, 1005, 12, 2, 99, 0]
+
+# Outputs its input plus one, forever
+INCREMENT = [3, 9, 1001, 9, 1, 9, 4, 9, 1105, 1, 0]
+
+
+class SchedulerTests(unittest.TestCase):
+    """Tests for the cooperative scheduler for IntCode applications."""
+
+    def test_quantum_interleaves_applications(self):
+        """Test that applications are run round-robin in slices of `quantum` instructions."""
+        outputs = []
+        scheduler = Scheduler(quantum=3)
+        for name in "ab":
+            application = IntCodeApplication(COUNTDOWN, name=name)
+            application.stdin.put(3)
+            scheduler.add(application, output=lambda value, n=name: outputs.append(f"{n}{value}"))
+
+        scheduler.run()
+        self.assertEqual(outputs, ["a3", "b3", "a2", "b2", "a1", "b1"])
+        self.assertTrue(all(application.halted for application in scheduler.applications))
+
+    def test_parked_applications_are_resumed_on_input(self):
+        """Test that an application waiting for input is parked until another one provides it."""
+        source = IntCodeApplication(COUNTDOWN, name="source")
+        sink = IntCodeApplication([3, 5, 4, 5, 99, 0], stdin=source.stdout, name="sink")
+        source.stdin.put(1)
+
+        scheduler = Scheduler(quantum=1)
+        scheduler.add(sink)
+        scheduler.add(source)
+        scheduler.run()
+
+        self.assertEqual(sink.stdout.get(), 1)
+
+    def test_deadlock_is_detected(self):
+        """Test that a deadlock raises an error, unless the `on_idle` hook provides input."""
+        application = IntCodeApplication(INCREMENT, name="increment")
+        fed = []
+
+        def on_idle() -> bool:
+            if len(fed) < 3:
+                fed.append(len(fed))
+                application.stdin.put(fed[-1] * 10)
+                return True
+            return False
+
+        scheduler = Scheduler()
+        scheduler.add(application)
+        with self.assertRaises(DeadlockError):
+            scheduler.run(on_idle=on_idle)
+
+        self.assertEqual([application.stdout.get() for _ in fed], [1, 11, 21])
+        self.assertFalse(application.halted)
@@ -0,0 +1,51 @@
+import unittest
+
+from solutions.helpers.symbolic import (
+    Polynomial, SymbolicFallback, SymbolicIntCodeApplication, UNKNOWN, solve,
+)
+
+
+class SymbolicIntCodeApplicationTests(unittest.TestCase):
+    """Tests for the symbolic execution of IntCode applications."""
+
+    def test_output_is_polynomial_in_variables(self):
+        """Test that additions and multiplications of variables result in a polynomial."""
+        # Stores (noun + verb) * noun + 7 at address 0; the first instruction reads from the
+        # addresses `noun` and `verb`, but its unknown result is overwritten right away.
+        data = [1, 0, 0, 3, 1, 1, 2, 3, 2, 3, 1, 0, 1001, 0, 7, 0, 99]
+
+        application = SymbolicIntCodeApplication(data, variables={1: "noun", 2: "verb"})
+        application.run()
+
+        result = application.application[0]
+        self.assertIsInstance(result, Polynomial)
+        self.assertEqual(result.substitute({"noun": 3, "verb": 4}), 28)
+        self.assertEqual(
+            list(solve(result, 28, {"noun": range(10), "verb": range(10)})),
+            [{"noun": 3, "verb": 4}],
+        )
+
+    def test_control_flow_on_variable_falls_back(self):
+        """Test that a jump depending on a variable raises `SymbolicFallback`."""
+        data = [1005, 5, 4, 99, 99, 0]
+
+        application = SymbolicIntCodeApplication(data, variables={5: "flag"})
+        with self.assertRaises(SymbolicFallback):
+            application.run()
+
+    def test_solve_linear_and_nonlinear_expressions(self):
+        """Test that `solve` finds every assignment, whether or not it can solve for a variable."""
+        x, y = Polynomial.variable("x"), Polynomial.variable("y")
+        domains = {"x": range(10), "y": range(10)}
+
+        self.assertEqual(list(solve(x * 3 + y, 17, domains)), [
+            {"x": 3, "y": 8}, {"x": 4, "y": 5}, {"x": 5, "y": 2},
+        ])
+        self.assertEqual(list(solve(x * x + y * y, 25, domains)), [
+            {"x": 0, "y": 5}, {"x": 3, "y": 4}, {"x": 4, "y": 3}, {"x": 5, "y": 0},
+        ])
+
+    def test_solve_unknown_expression_falls_back(self):
+        """Test that solving an unknown expression raises `SymbolicFallback`."""
+        with self.assertRaises(SymbolicFallback):
+            list(solve(UNKNOWN, 150, {"noun": range(100), "verb": range(100)}))
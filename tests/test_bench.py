@@ -0,0 +1,54 @@
+import contextlib
+import io
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from solutions.bench import Statistics, find_regressions, find_solutions, main
+
+
+class BenchmarkTests(unittest.TestCase):
+    """Tests for the benchmark suite of the solutions."""
+
+    def test_statistics(self):
+        """Test the summary statistics of a list of running times."""
+        result = Statistics.from_times([0.4, 0.1, 0.3, 0.2, 1.0])
+
+        self.assertEqual((result.runs, result.min, result.median, result.p95), (5, 0.1, 0.3, 1.0))
+        self.assertAlmostEqual(result.mean, 0.4)
+
+    def test_find_regressions(self):
+        """Test that only medians above the baseline plus the threshold are regressions."""
+        results = {
+            "day01.solution": Statistics.from_times([0.12]),
+            "day02.solution": Statistics.from_times([0.13]),
+            "day03.solution": Statistics.from_times([9.0]),
+        }
+        baseline = {
+            "day01.solution": {"total": {"median": 0.1}},
+            "day02.solution": {"total": {"median": 0.1}},
+        }
+
+        regressions = find_regressions(results, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("day02.solution"))
+
+    def test_find_solutions(self):
+        """Test that the alternative solutions of a day are found along with its main solution."""
+        self.assertEqual(
+            list(find_solutions([7])),
+            [(7, "solutions.day07.solution"), (7, "solutions.day07.solution_asyncio")],
+        )
+
+    def test_failing_solution(self):
+        """Test that a solution that raises is reported as failed and the results still written."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = pathlib.Path(directory) / "results.json"
+            with mock.patch("solutions.bench.time_solution", side_effect=RuntimeError("crashed")):
+                with self.assertLogs("solutions.bench"), contextlib.redirect_stdout(io.StringIO()):
+                    status = main(["1", "-r", "1", "-w", "0", "-o", str(output)])
+
+            self.assertEqual(status, 1)
+            self.assertEqual(json.loads(output.read_text())["failed"], ["day01.solution"])
@@ -0,0 +1,90 @@
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from solutions.data import _dependencies, get_parsed_data, iter_data, map_data
+from solutions.day08.solution import part_one, part_two
+from solutions.day10.solution import AsteroidMap
+
+calls = []
+
+
+def parse(data):
+    """Parse a map of asteroids and record every call in `calls`."""
+    calls.append(data)
+    asteroids = {
+        complex(x, y): 0 for y, row in enumerate(data) for x, cell in enumerate(row) if cell == "#"
+    }
+    return AsteroidMap(data, asteroids, [])
+
+
+class ParsedDataCacheTests(unittest.TestCase):
+    """Tests for the cache of parsed input data."""
+
+    def test_parsed_data_is_cached_by_content(self):
+        """Test that parsing is skipped for known data and that each call gets a fresh copy."""
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch("solutions.data.PARSED_ROOT", pathlib.Path(directory)):
+                calls.clear()
+                first = get_parsed_data(parse, [".#", "#."])
+                first.asteroids[complex(1, 0)] = 5
+
+                second = get_parsed_data(parse, [".#", "#."])
+                self.assertEqual(second.asteroids, {complex(1, 0): 0, complex(0, 1): 0})
+                self.assertEqual(len(calls), 1)
+
+                # Different data is parsed again and cached next to the data of before
+                get_parsed_data(parse, ["##"])
+                self.assertEqual(len(calls), 2)
+                self.assertEqual(len(list(pathlib.Path(directory).glob("*.pickle"))), 2)
+
+                # A changed parser parses the data again and replaces all of its outdated files
+                with mock.patch("solutions.data._module_hash", return_value="0" * 64):
+                    get_parsed_data(parse, ["##"])
+                self.assertEqual(len(calls), 3)
+                self.assertEqual(len(list(pathlib.Path(directory).iterdir())), 1)
+
+    def test_parser_dependencies_are_hashed(self):
+        """Test that the cache key covers the modules a parser uses, like the helpers of its day."""
+        dependencies = _dependencies("solutions.day10.solution")
+
+        self.assertIn("solutions.day10.helpers", dependencies)
+        self.assertNotIn("logging", dependencies)
+
+
+class DataLoaderTests(unittest.TestCase):
+    """Tests for the streaming and memory-mapped input data loaders."""
+
+    def test_iter_and_map_data(self):
+        """Test that lines are streamed without newlines and that the first line is mapped."""
+        with tempfile.TemporaryDirectory() as directory:
+            (pathlib.Path(directory) / "day08.txt").write_text("0122\n1201\n")
+            with mock.patch("solutions.data.DATA_ROOT", pathlib.Path(directory)):
+                lines = iter_data(day=8)
+                self.assertEqual(next(lines), "0122")
+                self.assertEqual(list(lines), ["1201"])
+
+                view = map_data(day=8)
+                self.assertEqual(bytes(view), b"0122")
+                self.assertEqual(bytes(view[1::2]), b"12")
+                view.release()
+
+    def test_map_empty_data(self):
+        """Test that an empty input file is mapped to an empty view instead of raising."""
+        with tempfile.TemporaryDirectory() as directory:
+            (pathlib.Path(directory) / "day08.txt").write_bytes(b"")
+            with mock.patch("solutions.data.DATA_ROOT", pathlib.Path(directory)):
+                self.assertEqual(bytes(map_data(day=8)), b"")
+
+    def test_solve_day_8_on_mapped_data(self):
+        """Test that both parts of day 8 run on a view of the mapped input data."""
+        # The first layer has the fewest `0`s; its transparent pixels are filled in by the second
+        pixels = b"0" + b"1" * 50 + b"2" * 99 + b"0" * 75 + b"1" * 75
+        with tempfile.TemporaryDirectory() as directory:
+            (pathlib.Path(directory) / "day08.txt").write_bytes(pixels + b"\n")
+            with mock.patch("solutions.data.DATA_ROOT", pathlib.Path(directory)):
+                view = map_data(day=8)
+                self.assertEqual(part_one(view), 50 * 99)
+                self.assertEqual(part_two(view), part_two(pixels))
+                view.release()
@@ -0,0 +1,74 @@
+import argparse
+import json
+import pathlib
+import tempfile
+import unittest
+
+from solutions.orchestrator import (
+    load_timings, parse_days, run_isolated, run_tasks, save_timings, schedule,
+)
+
+
+class OrchestratorTests(unittest.TestCase):
+    """Tests for running the solutions of all days in parallel."""
+
+    def test_parse_days(self):
+        """Test that both single days and inclusive ranges of days are accepted."""
+        self.assertEqual(parse_days("7"), [7])
+        self.assertEqual(parse_days("3-6"), [3, 4, 5, 6])
+
+        for argument in ("seven", "6-3", "0", "24-26"):
+            with self.subTest(argument=argument):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    parse_days(argument)
+
+    def test_schedule(self):
+        """Test that solutions are ordered longest first, with unknown running times in front."""
+        tasks = [(1, "solutions.day01.solution"), (7, "solutions.day07.solution"),
+                 (9, "solutions.day09.solution")]
+        timings = {"day01.solution": 0.001, "day09.solution": 3.0}
+
+        self.assertEqual(
+            [day for day, _ in schedule(tasks, timings)],
+            [7, 9, 1],
+        )
+
+    def test_run_tasks_and_timings(self):
+        """Test that the outcomes of a sweep are collected and that its timings are recorded."""
+        outcomes = run_tasks([(1, "solutions.day01.solution")], workers=1)
+
+        self.assertEqual(len(outcomes), 1)
+        self.assertIsNone(outcomes[0].error)
+        self.assertEqual(outcomes[0].result.answers, (3308377, 4959709))
+
+        with tempfile.TemporaryDirectory() as directory:
+            timings_file = pathlib.Path(directory) / "timings.json"
+            self.assertEqual(load_timings(timings_file), {})
+
+            save_timings(timings_file, outcomes)
+            self.assertEqual(
+                load_timings(timings_file),
+                {"day01.solution": outcomes[0].result.timings.total},
+            )
+
+    def test_run_isolated(self):
+        """Test that solutions run in processes of their own return their outcomes in order."""
+        tasks = [(1, "solutions.day01.solution"), (4, "solutions.day04.solution")]
+        outcomes = run_isolated(tasks, workers=1)
+
+        names = [outcome.name for outcome in outcomes]
+        self.assertEqual(names, ["day01.solution", "day04.solution"])
+        self.assertEqual(outcomes[1].result.answers, (960, 626))
+
+    def test_sweep_leaves_benchmark_results_alone(self):
+        """Test that a sweep does not modify benchmark results and that those take precedence."""
+        outcomes = run_tasks([(1, "solutions.day01.solution")], workers=1)
+        results = {"day01.solution": {"total": {"runs": 10, "median": 0.5, "p95": 0.7}}}
+
+        with tempfile.TemporaryDirectory() as directory:
+            timings_file = pathlib.Path(directory) / "timings.json"
+            timings_file.write_text(json.dumps({"repeat": 10, "results": results}))
+
+            save_timings(timings_file, outcomes)
+            self.assertEqual(json.loads(timings_file.read_text())["results"], results)
+            self.assertEqual(load_timings(timings_file), {"day01.solution": 0.5})
@@ -0,0 +1,23 @@
+import unittest
+
+from solutions import day01
+from solutions.runner import format_answer, run_solution
+
+
+class RunnerTests(unittest.TestCase):
+    """Tests for running solutions phase by phase."""
+
+    def test_run_solution(self):
+        """Test that the phases give the same answers as `main` and that each phase is timed."""
+        data = ["12", "1969"]
+        result = run_solution(day01, data)
+
+        self.assertEqual(result.answers, day01.main(data))
+        self.assertTrue(all(time >= 0 for time in result.timings))
+        self.assertAlmostEqual(result.timings.total, sum(result.timings))
+
+    def test_format_answer(self):
+        """Test that answers spanning multiple lines start on a new line."""
+        self.assertEqual(format_answer(42), "42")
+        self.assertEqual(format_answer("# #\n # "), "\n# #\n # ")
+        self.assertEqual(format_answer("\n# #\n # "), "\n# #\n # ")